@@ -54,6 +54,10 @@ async def autocomplete(
     - **limit**: Maximum number of suggestions (1-50)
     - **context**: Optional additional context
     """
+    # Debounced keystrokes often send a blank query; answer without touching the service
+    if not request.query.strip():
+        return AutocompleteResponse(query=request.query, suggestions=[], total=0)
+
     try:
         suggestions = service.get_suggestions(
             query=request.query, user_id=request.user_id, limit=request.limit
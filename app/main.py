@@ -39,7 +39,10 @@ async def lifespan(app: FastAPI):
     # Initialize services
     try:
         # Vector service
-        vector_service = VectorService(model_name=config.vector_model.model_name)
+        vector_service = VectorService(
+            model_name=config.vector_model.model_name,
+            cache_size=config.vector_model.cache_size,
+        )
         logger.info("Vector service initialized")
 
         # OpenSearch service
@@ -82,6 +85,7 @@ async def lifespan(app: FastAPI):
                 api_key=config.llm.api_key,
                 temperature=config.llm.temperature,
                 max_tokens=config.llm.max_tokens,
+                cache_size=config.llm.cache_size,
             )
             if llm_service.is_available():
                 logger.info(f"LLM service initialized with {config.llm.provider}/{config.llm.model}")
@@ -1,11 +1,18 @@
 """Metadata models for database tables, dimensions, metrics, etc."""
 
 import datetime
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
 from sqlmodel import Column, Field, JSON, Relationship, SQLModel
 
 
+@lru_cache(maxsize=2048)
+def _split_aliases(alias: str) -> Tuple[str, ...]:
+    """Split a comma-separated alias string, shared by every object with the same aliases"""
+    return tuple(a.strip() for a in alias.split(','))
+
+
 class IndexMixin:
     """Mixin for searchable tables"""
     __searchable__ = False
@@ -107,6 +114,11 @@ class MetaDimension(SQLModel, IndexMixin, table=True):
         back_populates="dimensions", sa_relationship_kwargs={"foreign_keys": "MetaDimension.entity_id"}
     )
 
+    @property
+    def alias_tuple(self) -> Tuple[str, ...]:
+        """别名元组, 由 alias 按逗号拆分"""
+        return _split_aliases(self.alias) if self.alias else ()
+
 
 class MetaMetric(SQLModel, IndexMixin, table=True):
     """度量和指标"""
@@ -2,7 +2,7 @@
 
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class AutocompleteRequest(BaseModel):
@@ -17,6 +17,12 @@ class AutocompleteRequest(BaseModel):
 class Suggestion(BaseModel):
     """Single suggestion item"""
 
+    # Suggestions are built once per result and never modified afterwards;
+    # services pass exactly these fields, so unknown keys are rejected
+    model_config = ConfigDict(
+        frozen=True, extra="forbid", str_strip_whitespace=True, validate_assignment=False
+    )
+
     text: str = Field(..., description="Suggestion text")
     score: float = Field(..., description="Relevance score")
     source: str = Field(..., description="Source of suggestion (keyword/vector/personalized)")
@@ -79,6 +85,12 @@ class RelatedQueriesRequest(BaseModel):
 
 class QueryItem(BaseModel):
     """Single query item"""
+
+    # Same read-only, fixed-shape contract as Suggestion
+    model_config = ConfigDict(
+        frozen=True, extra="forbid", str_strip_whitespace=True, validate_assignment=False
+    )
+
     text: str = Field(..., description="Query text")
     score: float = Field(..., description="Relevance/similarity score")
     source: str = Field(..., description="Source of query (vector/history/trending)")
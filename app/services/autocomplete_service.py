@@ -3,6 +3,8 @@
 import logging
 from typing import Any, Dict, List, Optional
 
+from pydantic import TypeAdapter
+
 from app.models.schemas import Suggestion
 from app.services.opensearch_service import OpenSearchService
 from app.services.personalization_service import PersonalizationService
@@ -12,6 +14,12 @@ from app.services.prefix_preserving_service import PrefixPreservingService
 
 logger = logging.getLogger(__name__)
 
+# Validates a whole response's suggestions in one call; built once at import
+_SUGGESTIONS_ADAPTER = TypeAdapter(List[Suggestion])
+
+# Tie-break order for related queries with equal scores; unknown sources go last
+_SOURCE_RANK = {"llm": 0, "sequence_next": 1, "hybrid": 2, "sequence_prev": 3, "history": 4}
+
 
 class AutocompleteService:
     """Main service for autocomplete functionality"""
@@ -155,8 +163,8 @@ class AutocompleteService:
                     boost_factor=self.personalization_weight,
                 )
 
-            # Convert to Suggestion objects
-            suggestions = []
+            # Convert to Suggestion objects, validating the whole batch at once
+            suggestion_data = []
             for result in unique_results[:limit]:
                 # Determine source
                 source = "hybrid"
@@ -167,17 +175,17 @@ class AutocompleteService:
                 elif result.get("vector_score", 0) > 0 and result.get("keyword_score", 0) == 0:
                     source = "vector"
 
-                suggestion = Suggestion(
-                    text=result["text"],
-                    score=round(result["score"], 4),
-                    source=source,
-                    metadata={
+                suggestion_data.append({
+                    "text": result["text"],
+                    "score": round(result["score"], 4),
+                    "source": source,
+                    "metadata": {
                         "keywords": result.get("keywords", []),
                         "doc_id": result.get("doc_id"),
                         **result.get("metadata", {}),
                     },
-                )
-                suggestions.append(suggestion)
+                })
+            suggestions = _SUGGESTIONS_ADAPTER.validate_python(suggestion_data)
 
             logger.info(f"Generated {len(suggestions)} suggestions for query: {query}")
             return suggestions
@@ -269,11 +277,20 @@ class AutocompleteService:
             logger.error(f"Failed to add document: {e}")
             return False
 
-    def add_documents_bulk(self, documents: List[Dict[str, Any]]) -> tuple:
+    def add_documents_bulk(
+        self,
+        documents: List[Dict[str, Any]],
+        batch_size: int = 64,
+        chunk_size: int = 500,
+        suspend_refresh: bool = False,
+    ) -> tuple:
         """Add multiple documents in bulk
 
         Args:
             documents: List of document dicts with 'text' and optional 'keywords', 'metadata'
+            batch_size: Number of texts encoded per model forward pass
+            chunk_size: Number of documents sent per OpenSearch bulk request
+            suspend_refresh: Disable index refresh during the load (offline loads only)
 
         Returns:
             Tuple of (success_count, error_count)
@@ -284,7 +301,7 @@ class AutocompleteService:
             texts = [doc["text"] for doc in documents]
 
             # Batch encode all texts
-            vectors = self.vector_service.encode(texts)
+            vectors = self.vector_service.encode(texts, batch_size=batch_size)
 
             for i, doc in enumerate(documents):
                 import hashlib
@@ -304,7 +321,9 @@ class AutocompleteService:
                 )
 
             # Bulk index
-            success, errors = self.opensearch.bulk_index_documents(processed_docs)
+            success, errors = self.opensearch.bulk_index_documents(
+                processed_docs, chunk_size=chunk_size, suspend_refresh=suspend_refresh
+            )
             logger.info(f"Bulk added {success} documents with {errors} errors")
             return success, errors
 
@@ -416,6 +435,7 @@ class AutocompleteService:
                 return []
 
             query = query.strip()
+            query_lower = query.lower()
 
             # Generate query vector for hybrid search
             query_vector = self.vector_service.encode_single(query)
@@ -439,7 +459,7 @@ class AutocompleteService:
                 # Add "next" queries (queries that typically follow the current query)
                 # These get higher scores as they represent the likely next question
                 for query_text, seq_score in sequences.get("next", []):
-                    if query_text.lower() != query.lower():
+                    if query_text.lower() != query_lower:
                         # Higher score for next queries (0.85-0.95 range)
                         normalized_score = min(0.95, 0.85 + (seq_score / 20))
                         sequence_queries.append({
@@ -457,7 +477,7 @@ class AutocompleteService:
                 # Add "previous" queries (queries that typically precede the current query)
                 # These get lower scores as they are less likely to be the user's next question
                 for query_text, seq_score in sequences.get("previous", []):
-                    if query_text.lower() != query.lower():
+                    if query_text.lower() != query_lower:
                         # Lower score for previous queries (0.65-0.75 range)
                         normalized_score = min(0.75, 0.65 + (seq_score / 20))
                         sequence_queries.append({
@@ -479,7 +499,7 @@ class AutocompleteService:
                 user_prefs = self.personalization.get_user_preferences(user_id, limit=20)
                 for pref in user_prefs:
                     # Add queries from user history that aren't already in results
-                    if pref.lower() != query.lower():
+                    if pref.lower() != query_lower:
                         related_from_history.append({
                             "text": pref,
                             "score": 0.7,  # Fixed score for historical queries
@@ -514,16 +534,20 @@ class AutocompleteService:
             all_results = llm_queries + sequence_queries + results + related_from_history
 
             # Deduplicate by text (case-insensitive), keeping the first occurrence (highest priority)
-            seen_texts = set()
-            unique_results = []
+            unique_by_text = {}
             for result in all_results:
-                text_lower = result["text"].lower()
-                if text_lower not in seen_texts and text_lower != query.lower():
-                    seen_texts.add(text_lower)
-                    unique_results.append(result)
-
-            # Sort by score (LLM and next queries will naturally rank higher)
-            unique_results.sort(key=lambda x: x.get("score", 0), reverse=True)
+                unique_by_text.setdefault(result["text"].lower(), result)
+            unique_by_text.pop(query_lower, None)
+            unique_results = list(unique_by_text.values())
+
+            # Sort by score (LLM and next queries will naturally rank higher),
+            # breaking ties by source so next queries stay ahead of previous ones
+            unique_results.sort(
+                key=lambda x: (
+                    -x.get("score", 0),
+                    _SOURCE_RANK.get(x.get("source", "hybrid"), len(_SOURCE_RANK)),
+                )
+            )
 
             # Convert to QueryItem format
             related_queries = []
@@ -1,9 +1,19 @@
 """Service for automatic dimension mapping to table columns"""
 
 import logging
-from typing import Any, Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Sequence, Tuple
 import re
 
+import numpy as np
+
+try:
+    from rapidfuzz import process as rapidfuzz_process
+    from rapidfuzz.distance import Levenshtein as RapidfuzzLevenshtein
+    HAS_RAPIDFUZZ = True
+except ImportError:
+    HAS_RAPIDFUZZ = False
+
 try:
     import Levenshtein
     HAS_LEVENSHTEIN = True
@@ -12,10 +22,155 @@ except ImportError:
 
 from sqlmodel import Session, select
 from app.models.metadata import MetaDimension, MetaTableColumn
+from app.utils.name_trie import NameTrie
 
 
 logger = logging.getLogger(__name__)
 
+# camelCase word boundaries, e.g. "userName" -> "user_Name", "userID" -> "user_ID"
+_CAMEL_WORD_RE = re.compile('(.)([A-Z][a-z]+)')
+_CAMEL_UPPER_RE = re.compile('([a-z0-9])([A-Z])')
+
+# Lowercases ASCII letters and turns hyphens into underscores in one pass
+_ASCII_NAME_TABLE = str.maketrans(
+    {**{chr(c): chr(c + 32) for c in range(ord('A'), ord('Z') + 1)}, '-': '_'}
+)
+
+# Column logical types compatible with each dimension semantic type
+_SEMANTIC_TYPE_MAPPINGS = {
+    'ID': ('int', 'bigint', 'varchar', 'string', 'text'),
+    'DATE': ('date', 'datetime', 'timestamp', 'time'),
+    'CATEGORY': ('varchar', 'string', 'text', 'int', 'enum')
+}
+
+# One alternation per semantic type, so compatibility is a single substring search
+_SEMANTIC_TYPE_PATTERNS = {
+    semantic_type: re.compile('|'.join(map(re.escape, logical_types)))
+    for semantic_type, logical_types in _SEMANTIC_TYPE_MAPPINGS.items()
+}
+
+# Minimum normalized Levenshtein similarity for a fuzzy match
+_FUZZY_MIN_SIMILARITY = 0.7
+
+# Minimum share of a field's values found among a dimension's values for a value match
+_VALUE_MIN_OVERLAP = 0.6
+
+# Candidate count above which the pure-Python fallback switches to the NumPy batch
+_BATCH_LEVENSHTEIN_MIN_CANDIDATES = 8
+
+# Candidate count from which the pure-Python fallback walks a trie of the names instead
+_TRIE_MIN_CANDIDATES = 32
+
+# Weight of each score component in the total score
+# Value match has highest weight when available
+_SCORE_WEIGHTS = {
+    'exact_match': 1.0,
+    'alias_match': 0.95,
+    'fuzzy_match': 0.5,
+    'value_match': 1.2,  # Highest weight
+    'semantic_match': 0.2  # Supplementary
+}
+
+
+class DimensionIndex(NamedTuple):
+    """Active dimensions with their normalized names and aliases, built once per batch
+    
+    ids and semantic_codes are column arrays parallel to dimensions, so the
+    per-column scoring can work on whole arrays instead of ORM attributes.
+    """
+    dimensions: Tuple[MetaDimension, ...]
+    names: Tuple[str, ...]
+    name_to_ids: Dict[str, FrozenSet[int]]
+    alias_to_ids: Dict[str, FrozenSet[int]]
+    ids: np.ndarray
+    semantic_types: Tuple[str, ...]
+    semantic_codes: np.ndarray
+
+
+def _bounded_levenshtein(a: str, b: str, max_distance: int) -> int:
+    """Levenshtein distance, computed only as far as max_distance
+    
+    Uses two reused DP rows and only fills cells within max_distance of the
+    diagonal, stopping as soon as a whole row exceeds the bound.
+    
+    Args:
+        a: First string
+        b: Second string
+        max_distance: Largest distance of interest
+        
+    Returns:
+        The exact distance if it is at most max_distance, otherwise max_distance + 1
+    """
+    over = max_distance + 1
+    if abs(len(a) - len(b)) > max_distance:
+        return over
+    
+    # Indexing bytes yields small ints, which compare faster than 1-char strings
+    if a.isascii() and b.isascii():
+        a = a.encode('ascii')
+        b = b.encode('ascii')
+    
+    prev = [j if j <= max_distance else over for j in range(len(b) + 1)]
+    curr = [over] * (len(b) + 1)
+    for i in range(1, len(a) + 1):
+        lo = max(1, i - max_distance)
+        hi = min(len(b), i + max_distance)
+        curr[lo - 1] = i if lo == 1 and i <= max_distance else over
+        row_min = curr[lo - 1]
+        char = a[i - 1]
+        for j in range(lo, hi + 1):
+            value = min(prev[j] + 1, curr[j - 1] + 1, prev[j - 1] + (char != b[j - 1]))
+            curr[j] = value
+            if value < row_min:
+                row_min = value
+        if hi < len(b):
+            curr[hi + 1] = over
+        if row_min > max_distance:
+            return over
+        prev, curr = curr, prev
+    
+    return min(prev[len(b)], over)
+
+
+def _levenshtein_batch(query: str, candidates: Sequence[str]) -> np.ndarray:
+    """Levenshtein distances from one query to many candidates in a single NumPy sweep
+    
+    Each DP row is computed for all candidates at once. The left-to-right
+    insertion dependency within a row is resolved with a running minimum, so
+    the Python-level work is one iteration per query character.
+    
+    Args:
+        query: Query string
+        candidates: Candidate strings
+        
+    Returns:
+        Array of distances, one per candidate
+    """
+    lengths = np.array([len(c) for c in candidates], dtype=np.intp)
+    width = int(lengths.max(initial=0))
+    # Pad with a value no code point can take, so padding never matches the query
+    encoded = np.full((len(candidates), width), np.iinfo(np.uint32).max, dtype=np.uint32)
+    for row, candidate in enumerate(candidates):
+        encoded[row, :len(candidate)] = np.frombuffer(candidate.encode('utf-32-le'), dtype='<u4')
+    
+    offsets = np.arange(width + 1, dtype=np.int32)
+    prev = np.broadcast_to(offsets, (len(candidates), width + 1)).copy()
+    for i, char in enumerate(np.frombuffer(query.encode('utf-32-le'), dtype='<u4'), start=1):
+        # Best of deletion and substitution for each cell, before insertions
+        best = np.empty_like(prev)
+        best[:, 0] = i
+        np.minimum(prev[:, 1:] + 1, prev[:, :-1] + (encoded != char), out=best[:, 1:])
+        # Insertions: curr[j] = min over k <= j of best[k] + (j - k)
+        prev = np.minimum.accumulate(best - offsets, axis=1) + offsets
+    
+    return prev[np.arange(len(candidates)), lengths]
+
+
+@lru_cache(maxsize=16)
+def _name_trie(names: Tuple[str, ...]) -> NameTrie:
+    """Trie over normalized dimension names, reused while the dimension list is unchanged"""
+    return NameTrie(names)
+
 
 class DimensionMappingService:
     """Service for automatically mapping table columns to dimensions"""
@@ -28,10 +183,13 @@ class DimensionMappingService:
         """
         self.session = session
     
-    def _normalize_name(self, name: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _normalize_name(name: str) -> str:
         """Normalize field/dimension name for comparison
         
-        Handles case insensitivity, underscores, and camelCase
+        Handles case insensitivity, underscores, and camelCase. Results are
+        cached because the same field and dimension names recur across columns.
         
         Args:
             name: Field or dimension name
@@ -39,12 +197,27 @@ class DimensionMappingService:
         Returns:
             Normalized name in lowercase
         """
-        # Convert camelCase to snake_case
-        name = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', name)
-        name = re.sub('([a-z0-9])([A-Z])', r'\1_\2', name)
+        # Convert camelCase to snake_case; there are no boundaries without uppercase letters
+        if not name.islower():
+            name = _CAMEL_WORD_RE.sub(r'\1_\2', name)
+            name = _CAMEL_UPPER_RE.sub(r'\1_\2', name)
         # Convert to lowercase and remove extra spaces/underscores
-        name = name.lower().strip().replace('-', '_')
-        return name
+        if name.isascii():
+            return name.strip().translate(_ASCII_NAME_TABLE)
+        return name.lower().strip().replace('-', '_')
+    
+    @classmethod
+    @lru_cache(maxsize=2048)
+    def _normalize_aliases(cls, aliases: Tuple[str, ...]) -> Tuple[str, ...]:
+        """Normalize a dimension's aliases
+        
+        Args:
+            aliases: Dimension aliases, as MetaDimension.alias_tuple
+            
+        Returns:
+            Normalized aliases, in their original order
+        """
+        return tuple(cls._normalize_name(a) for a in aliases)
     
     def _exact_match_score(self, field_name: str, dimension_name: str) -> float:
         """Calculate exact match score
@@ -77,12 +250,77 @@ class DimensionMappingService:
             return 0.0
         
         norm_field = self._normalize_name(field_name)
-        aliases = [self._normalize_name(a.strip()) for a in dimension.alias.split(',')]
-        
-        if norm_field in aliases:
+        if norm_field in self._normalize_aliases(dimension.alias_tuple):
             return 0.95  # Slightly lower than exact match
         return 0.0
     
+    def build_index(self, dimensions: Iterable[MetaDimension]) -> DimensionIndex:
+        """Index dimensions by normalized name and alias
+        
+        Lets exact and alias matching for every column of a table be a dict
+        lookup instead of re-normalizing each dimension per column.
+        
+        Args:
+            dimensions: Candidate dimensions; inactive ones are skipped
+            
+        Returns:
+            Index over the active dimensions
+        """
+        active = tuple(d for d in dimensions if d.status == 1)
+        name_to_ids: Dict[str, set] = {}
+        alias_to_ids: Dict[str, set] = {}
+        
+        for dimension in active:
+            name_to_ids.setdefault(self._normalize_name(dimension.name), set()).add(dimension.id)
+            if dimension.alias:
+                for alias in self._normalize_aliases(dimension.alias_tuple):
+                    alias_to_ids.setdefault(alias, set()).add(dimension.id)
+        
+        semantic_types = tuple(sorted({d.semantic_type for d in active}))
+        semantic_code = {semantic_type: code for code, semantic_type in enumerate(semantic_types)}
+        
+        return DimensionIndex(
+            dimensions=active,
+            names=tuple(d.name for d in active),
+            name_to_ids={k: frozenset(v) for k, v in name_to_ids.items()},
+            alias_to_ids={k: frozenset(v) for k, v in alias_to_ids.items()},
+            ids=np.array([d.id for d in active], dtype=np.int64),
+            semantic_types=semantic_types,
+            semantic_codes=np.array([semantic_code[d.semantic_type] for d in active], dtype=np.intp)
+        )
+    
+    def _load_index(self) -> DimensionIndex:
+        """Build the index over all active dimensions in the database"""
+        statement = select(MetaDimension).where(MetaDimension.status == 1)
+        return self.build_index(self.session.exec(statement).all())
+    
+    @staticmethod
+    def _scale_fuzzy_similarity(similarity: float) -> float:
+        """Turn a normalized Levenshtein similarity into a fuzzy match score
+        
+        Args:
+            similarity: 1 - distance / max_len, between 0.0 and 1.0
+            
+        Returns:
+            Score between 0.0 and 1.0
+        """
+        # Only consider matches with high similarity (>= 0.7)
+        if similarity >= _FUZZY_MIN_SIMILARITY:
+            return similarity * 0.8  # Scale down fuzzy matches
+        return 0.0
+    
+    @staticmethod
+    def _max_fuzzy_distance(max_len: int) -> int:
+        """Largest Levenshtein distance that still reaches the fuzzy similarity threshold
+        
+        Args:
+            max_len: Length of the longer of the two names
+            
+        Returns:
+            Maximum distance, in edits
+        """
+        return int(max_len * (1 - _FUZZY_MIN_SIMILARITY) + 1e-9)
+    
     def _fuzzy_match_score(self, field_name: str, dimension_name: str) -> float:
         """Calculate fuzzy match score using Levenshtein distance
         
@@ -93,33 +331,109 @@ class DimensionMappingService:
         Returns:
             Score between 0.0 and 1.0
         """
-        if not HAS_LEVENSHTEIN:
-            return 0.0
+        return self._fuzzy_match_scores(field_name, [dimension_name])[0]
+    
+    def _fuzzy_match_scores(self, field_name: str, dimension_names: Sequence[str]) -> List[float]:
+        """Calculate fuzzy match scores of one field against many dimension names
         
-        norm_field = self._normalize_name(field_name)
-        norm_dim = self._normalize_name(dimension_name)
+        Names whose length difference alone rules out a match are skipped.
+        With rapidfuzz the rest of the row is scored in a single cdist call. Without
+        either Levenshtein library, large catalogs are searched through a trie,
+        mid-sized ones in one NumPy sweep and a few with a pure-Python distance
+        bounded by the similarity threshold.
         
-        # Calculate similarity ratio
-        distance = Levenshtein.distance(norm_field, norm_dim)
-        max_len = max(len(norm_field), len(norm_dim))
+        Args:
+            field_name: Table column field name
+            dimension_names: Dimension names
+            
+        Returns:
+            Scores between 0.0 and 1.0, in the order of dimension_names
+        """
+        scores = [0.0] * len(dimension_names)
+        norm_field = self._normalize_name(field_name)
+        if not norm_field:
+            return scores
+        
+        if (not HAS_RAPIDFUZZ and not HAS_LEVENSHTEIN
+                and len(dimension_names) >= _TRIE_MIN_CANDIDATES):
+            return self._trie_fuzzy_scores(norm_field, dimension_names)
+        
+        # A distance is at least the length difference, so names whose length
+        # alone rules out the similarity threshold are never compared, and
+        # identical names are settled in the same pass without a distance
+        positions, norm_dims, max_lens = [], [], []
+        for position, name in enumerate(dimension_names):
+            norm_dim = self._normalize_name(name)
+            if norm_dim == norm_field:
+                scores[position] = self._scale_fuzzy_similarity(1.0)
+                continue
+            max_len = max(len(norm_field), len(norm_dim))
+            if abs(len(norm_field) - len(norm_dim)) <= self._max_fuzzy_distance(max_len):
+                positions.append(position)
+                norm_dims.append(norm_dim)
+                max_lens.append(max_len)
+        
+        if not norm_dims:
+            return scores
+        
+        if HAS_RAPIDFUZZ:
+            # cdist only returns raw distances here: its similarity scorers yield float32,
+            # which rounds exact 0.7 boundary matches below the threshold
+            distances = rapidfuzz_process.cdist(
+                [norm_field], norm_dims, scorer=RapidfuzzLevenshtein.distance
+            )[0]
+            similarities = 1.0 - distances / np.array(max_lens, dtype=np.float64)
+        elif not HAS_LEVENSHTEIN and len(norm_dims) > _BATCH_LEVENSHTEIN_MIN_CANDIDATES:
+            similarities = 1.0 - _levenshtein_batch(norm_field, norm_dims) / np.array(max_lens)
+        else:
+            similarities = []
+            for norm_dim, max_len in zip(norm_dims, max_lens):
+                if HAS_LEVENSHTEIN:
+                    distance = Levenshtein.distance(norm_field, norm_dim)
+                else:
+                    # Distances beyond this bound fall below the similarity threshold anyway
+                    distance = _bounded_levenshtein(
+                        norm_field, norm_dim, self._max_fuzzy_distance(max_len)
+                    )
+                similarities.append(1.0 - (distance / max_len))
+        
+        for position, similarity in zip(positions, similarities):
+            scores[position] = self._scale_fuzzy_similarity(float(similarity))
+        return scores
+    
+    def _trie_fuzzy_scores(self, norm_field: str, dimension_names: Sequence[str]) -> List[float]:
+        """Calculate fuzzy match scores by walking a trie of the dimension names
         
-        if max_len == 0:
-            return 0.0
+        Args:
+            norm_field: Normalized table column field name
+            dimension_names: Dimension names
+            
+        Returns:
+            Scores between 0.0 and 1.0, in the order of dimension_names
+        """
+        scores = [0.0] * len(dimension_names)
+        norm_dims = tuple(self._normalize_name(name) for name in dimension_names)
         
-        similarity = 1.0 - (distance / max_len)
+        # No name can match beyond the distance allowed for the longest pair
+        max_distance = self._max_fuzzy_distance(max(len(norm_field), *map(len, norm_dims)))
+        matches = _name_trie(norm_dims).search_within(norm_field, max_distance)
         
-        # Only consider matches with high similarity (>= 0.7)
-        if similarity >= 0.7:
-            return similarity * 0.8  # Scale down fuzzy matches
-        return 0.0
+        for position, distance in matches.items():
+            max_len = max(len(norm_field), len(norm_dims[position]))
+            scores[position] = self._scale_fuzzy_similarity(1.0 - (distance / max_len))
+        return scores
     
+    @staticmethod
+    @lru_cache(maxsize=1024)
     def _semantic_type_match(
-        self, 
         column_logical_type: str, 
         dimension_semantic_type: str
     ) -> bool:
         """Check if semantic types are compatible
         
+        Results are cached because a schema only uses a handful of distinct
+        logical types.
+        
         Args:
             column_logical_type: Logical type of the column
             dimension_semantic_type: Semantic type of the dimension
@@ -127,23 +441,61 @@ class DimensionMappingService:
         Returns:
             True if types are compatible
         """
-        # Simple matching logic - can be extended
-        type_mappings = {
-            'ID': ['int', 'bigint', 'varchar', 'string', 'text'],
-            'DATE': ['date', 'datetime', 'timestamp', 'time'],
-            'CATEGORY': ['varchar', 'string', 'text', 'int', 'enum']
-        }
+        # Simple matching logic - can be extended via _SEMANTIC_TYPE_MAPPINGS
+        pattern = _SEMANTIC_TYPE_PATTERNS.get(dimension_semantic_type)
+        if pattern is None:
+            return False
+        
+        return pattern.search(column_logical_type.lower()) is not None
+    
+    @staticmethod
+    def _normalize_values(values: Iterable[Any]) -> FrozenSet[str]:
+        """Normalize values to lowercase strings for comparison
         
-        logical_type_lower = column_logical_type.lower()
-        compatible_types = type_mappings.get(dimension_semantic_type, [])
+        Values are stringified before they are hashed, so 1, True and 1.0 stay
+        distinct and unhashable JSON values (lists, dicts) are accepted.
         
-        return any(ct in logical_type_lower for ct in compatible_types)
+        Args:
+            values: Raw field or dimension values
+            
+        Returns:
+            Normalized values, without None
+        """
+        return frozenset(str(v).lower() for v in values if v is not None)
+    
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _value_overlap_score(field_set: FrozenSet[str], dim_set: FrozenSet[str]) -> float:
+        """Score the overlap of two normalized value sets
+        
+        Args:
+            field_set: Normalized values of the table column
+            dim_set: Normalized values of the dimension
+            
+        Returns:
+            Score between 0.0 and 1.0
+        """
+        if not field_set or not dim_set:
+            return 0.0
+        
+        # The overlap cannot reach the threshold, skip the intersection
+        if len(dim_set) < _VALUE_MIN_OVERLAP * len(field_set):
+            return 0.0
+        
+        # Calculate overlap ratio
+        overlap_ratio = len(field_set & dim_set) / len(field_set)
+        
+        # High overlap indicates strong match
+        if overlap_ratio >= _VALUE_MIN_OVERLAP:
+            return overlap_ratio
+        
+        return 0.0
     
     def _value_based_match_score(
         self,
-        field_values: List[Any],
+        field_values: Iterable[Any],
         dimension: MetaDimension,
-        dimension_values: Optional[List[Any]] = None
+        dimension_values: Optional[Iterable[Any]] = None
     ) -> float:
         """Calculate value-based match score
         
@@ -152,7 +504,7 @@ class DimensionMappingService:
         Args:
             field_values: Unique values from the table column
             dimension: Dimension object
-            dimension_values: Optional list of known dimension values
+            dimension_values: Optional known dimension values
             
         Returns:
             Score between 0.0 and 1.0
@@ -160,28 +512,16 @@ class DimensionMappingService:
         if not field_values or not dimension_values:
             return 0.0
         
-        # Convert to sets for intersection calculation
-        field_set = set(str(v).lower() for v in field_values if v is not None)
-        dim_set = set(str(v).lower() for v in dimension_values if v is not None)
-        
-        if not field_set or not dim_set:
-            return 0.0
-        
-        # Calculate overlap ratio
-        intersection = field_set.intersection(dim_set)
-        overlap_ratio = len(intersection) / len(field_set)
-        
-        # High overlap indicates strong match
-        if overlap_ratio >= 0.6:
-            return overlap_ratio
-        
-        return 0.0
+        return self._value_overlap_score(
+            self._normalize_values(field_values), self._normalize_values(dimension_values)
+        )
     
     def calculate_dimension_scores(
         self,
         column: MetaTableColumn,
-        field_values: Optional[List[Any]] = None,
-        dimension_values_map: Optional[Dict[int, List[Any]]] = None
+        field_values: Optional[Iterable[Any]] = None,
+        dimension_values_map: Optional[Dict[int, List[Any]]] = None,
+        index: Optional[DimensionIndex] = None
     ) -> List[Dict[str, Any]]:
         """Calculate matching scores for all candidate dimensions
         
@@ -189,59 +529,70 @@ class DimensionMappingService:
             column: Table column to map
             field_values: Optional unique values from this column
             dimension_values_map: Optional mapping of dimension_id to their possible values
+            index: Optional prebuilt dimension index; loaded from the database if omitted
             
         Returns:
             List of candidate dimensions with scores, sorted by total score
         """
-        # Get all active dimensions
-        statement = select(MetaDimension).where(MetaDimension.status == 1)
-        dimensions = self.session.exec(statement).all()
+        if index is None:
+            index = self._load_index()
+        
+        # Normalize once so every dimension compares against the same set
+        field_set = self._normalize_values(field_values) if field_values else frozenset()
+        
+        norm_field = self._normalize_name(column.field_name)
+        exact_ids = index.name_to_ids.get(norm_field, frozenset())
+        alias_ids = index.alias_to_ids.get(norm_field, frozenset())
+        
+        # One array per score component, parallel to index.dimensions
+        component_scores = {
+            'exact_match': np.isin(index.ids, tuple(exact_ids)) * 1.0,
+            'alias_match': np.isin(index.ids, tuple(alias_ids)) * 0.95,
+            'fuzzy_match': np.array(
+                self._fuzzy_match_scores(column.field_name, index.names), dtype=float
+            ),
+            'value_match': np.zeros(len(index.dimensions)),
+            'semantic_match': np.zeros(len(index.dimensions))
+        }
         
-        candidates = []
+        # Check semantic type compatibility once per distinct semantic type
+        if index.semantic_types:
+            compatible = np.array([
+                self._semantic_type_match(column.logical_type, semantic_type)
+                for semantic_type in index.semantic_types
+            ])
+            # Bonus for semantic compatibility
+            component_scores['semantic_match'] = compatible[index.semantic_codes] * 0.3
+        
+        # Calculate value-based match if values are provided
+        if field_set and dimension_values_map:
+            for position, dimension in enumerate(index.dimensions):
+                dimension_values = dimension_values_map.get(dimension.id)
+                if dimension_values:
+                    component_scores['value_match'][position] = self._value_overlap_score(
+                        field_set, self._normalize_values(dimension_values)
+                    )
+        
+        # Calculate weighted total score
+        total_scores = sum(
+            component_scores[key] * _SCORE_WEIGHTS[key] for key in component_scores
+        )
         
-        for dimension in dimensions:
-            scores = {
-                'exact_match': self._exact_match_score(column.field_name, dimension.name),
-                'alias_match': self._alias_match_score(column.field_name, dimension),
-                'fuzzy_match': self._fuzzy_match_score(column.field_name, dimension.name),
-                'value_match': 0.0,
-                'semantic_match': 0.0
-            }
-            
-            # Check semantic type compatibility
-            if self._semantic_type_match(column.logical_type, dimension.semantic_type):
-                scores['semantic_match'] = 0.3  # Bonus for semantic compatibility
-            
-            # Calculate value-based match if values are provided
-            if field_values and dimension_values_map and dimension.id in dimension_values_map:
-                dim_values = dimension_values_map.get(dimension.id, [])
-                scores['value_match'] = self._value_based_match_score(
-                    field_values, dimension, dim_values
-                )
-            
-            # Calculate weighted total score
-            # Value match has highest weight when available
-            weights = {
-                'exact_match': 1.0,
-                'alias_match': 0.95,
-                'fuzzy_match': 0.5,
-                'value_match': 1.2,  # Highest weight
-                'semantic_match': 0.2  # Supplementary
-            }
-            
-            total_score = sum(scores[key] * weights[key] for key in scores)
-            
-            # Only include candidates with meaningful scores (> 0.3)
-            if total_score > 0.3:
-                candidates.append({
-                    'dimension_id': dimension.id,
-                    'dimension_name': dimension.name,
-                    'dimension_verbose_name': dimension.verbose_name,
-                    'dimension_semantic_type': dimension.semantic_type,
-                    'total_score': total_score,
-                    'scores': scores,
-                    'confidence': self._calculate_confidence(total_score, scores)
-                })
+        candidates = []
+        # Only include candidates with meaningful scores (> 0.3)
+        for position in np.flatnonzero(total_scores > 0.3):
+            dimension = index.dimensions[position]
+            total_score = float(total_scores[position])
+            scores = {key: float(values[position]) for key, values in component_scores.items()}
+            candidates.append({
+                'dimension_id': dimension.id,
+                'dimension_name': dimension.name,
+                'dimension_verbose_name': dimension.verbose_name,
+                'dimension_semantic_type': dimension.semantic_type,
+                'total_score': total_score,
+                'scores': scores,
+                'confidence': self._calculate_confidence(total_score, scores)
+            })
         
         # Sort by total score descending
         candidates.sort(key=lambda x: x['total_score'], reverse=True)
@@ -299,10 +650,12 @@ class DimensionMappingService:
         )
         columns = self.session.exec(statement).all()
         
+        # Shared by every column instead of reloading dimensions per column
+        index = self._load_index()
         result = {}
         
         for column in columns:
-            candidates = self.calculate_dimension_scores(column)
+            candidates = self.calculate_dimension_scores(column, index=index)
             
             # Filter by min_score and limit to max_candidates
             filtered = [c for c in candidates if c['total_score'] >= min_score][:max_candidates]
@@ -1,11 +1,59 @@
 """LLM service for intelligent query enhancement and recommendation"""
 
+import copy
+import json
 import logging
 import os
-from typing import Any, Dict, List, Optional
+import re
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# One list item per line: optional "1." / "1)" numbering or bullet, then the item text
+_LIST_ITEM_RE = re.compile(r"^[^\S\n]*(?:\d+[.)]|[-*•·])?[^\S\n]*(.*?)[^\S\n]*$", re.M)
+_QUOTE_CHARS = "\"'“”‘’"
+
+_EXPANSION_SYSTEM_PROMPT = (
+    "You are a query expansion assistant for a business intelligence system. "
+    "Generate semantically related queries."
+)
+_RELATED_SYSTEM_PROMPT = (
+    "You are a business intelligence query assistant. Generate relevant follow-up queries."
+)
+_REWRITE_SYSTEM_PROMPT = (
+    "You are a query optimization assistant. Rewrite queries to be more effective for search."
+)
+
+
+@lru_cache(maxsize=256)
+def _parse_list_items(response: str) -> Tuple[str, ...]:
+    """Split an LLM list response into queries, cached since identical generations recur
+
+    Args:
+        response: Raw LLM response text
+
+    Returns:
+        Parsed queries, deduplicated in order of appearance
+    """
+    # Split into lines with numbering/bullets and surrounding whitespace removed
+    lines = [line for line in _LIST_ITEM_RE.findall(response) if line]
+
+    # If only one line, try comma-separated
+    if len(lines) == 1:
+        lines = [item for item in _LIST_ITEM_RE.findall(lines[0].replace(",", "\n")) if item]
+
+    # Remove quotes and drop fragments too short to be a query
+    items = {}
+    for line in lines:
+        line = line.strip(_QUOTE_CHARS)
+        if len(line) > 2:
+            items.setdefault(line, None)
+    return tuple(items)
+
 
 class LLMService:
     """Service for LLM-powered query understanding and recommendation enhancement"""
@@ -17,6 +65,7 @@ class LLMService:
         api_key: Optional[str] = None,
         temperature: float = 0.7,
         max_tokens: int = 150,
+        cache_size: int = 512,
     ):
         """Initialize LLM service
 
@@ -26,6 +75,7 @@ class LLMService:
             api_key: API key for the provider
             temperature: Temperature for generation (0-1)
             max_tokens: Maximum tokens to generate
+            cache_size: Maximum number of LLM responses kept for repeated queries
         """
         self.provider = provider.lower()
         self.model = model
@@ -33,6 +83,10 @@ class LLMService:
         self.temperature = temperature
         self.max_tokens = max_tokens
         self.client = None
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[Tuple[Hashable, ...], Any]" = OrderedDict()
+        # Sync routes run in FastAPI's threadpool and share this instance
+        self._cache_lock = threading.Lock()
         self._initialize_client()
 
     def _initialize_client(self):
@@ -95,6 +149,71 @@ class LLMService:
         """
         return self.client is not None
 
+    @staticmethod
+    def _context_key(context: Optional[Dict[str, Any]]) -> str:
+        """Stable cache key component for a context dictionary"""
+        if not context:
+            return ""
+        return json.dumps(context, sort_keys=True, ensure_ascii=False, default=str)
+
+    def _cache_get(self, key: Tuple[Hashable, ...]) -> Optional[Any]:
+        """Look up a cached response, marking it as recently used"""
+        with self._cache_lock:
+            value = self._cache.get(key)
+            if value is not None:
+                self._cache.move_to_end(key)
+            return value
+
+    def _cache_put(self, key: Tuple[Hashable, ...], value: Any):
+        """Cache a successful response, evicting the least recently used one if full"""
+        if not value or self.cache_size <= 0:
+            return
+        with self._cache_lock:
+            self._cache[key] = value
+            self._cache.move_to_end(key)
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def clear_cache(self):
+        """Drop all cached LLM responses"""
+        with self._cache_lock:
+            self._cache.clear()
+
+    def _chat(self, system_prompt: str, prompt: str, temperature: float, max_tokens: int) -> Optional[str]:
+        """Send one prompt to the configured provider
+
+        Args:
+            system_prompt: System message (not sent to Anthropic)
+            prompt: User message
+            temperature: Temperature for generation
+            max_tokens: Maximum tokens to generate
+
+        Returns:
+            Stripped response text, or None for an unsupported provider
+        """
+        if self.provider == "openai":
+            response = self.client.chat.completions.create(
+                model=self.model,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=temperature,
+                max_tokens=max_tokens,
+            )
+            return response.choices[0].message.content.strip()
+        if self.provider == "anthropic":
+            message = self.client.messages.create(
+                model=self.model,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                messages=[
+                    {"role": "user", "content": prompt}
+                ]
+            )
+            return message.content[0].text.strip()
+        return None
+
     def expand_query(self, query: str, context: Optional[Dict[str, Any]] = None) -> List[str]:
         """Expand a query into related search terms using LLM
 
@@ -108,42 +227,36 @@ class LLMService:
         if not self.is_available():
             return []
 
-        try:
-            prompt = self._build_query_expansion_prompt(query, context)
-            
-            if self.provider == "openai":
-                response = self.client.chat.completions.create(
-                    model=self.model,
-                    messages=[
-                        {"role": "system", "content": "You are a query expansion assistant for a business intelligence system. Generate semantically related queries."},
-                        {"role": "user", "content": prompt}
-                    ],
-                    temperature=self.temperature,
-                    max_tokens=self.max_tokens,
-                )
-                result = response.choices[0].message.content.strip()
-            elif self.provider == "anthropic":
-                message = self.client.messages.create(
-                    model=self.model,
-                    max_tokens=self.max_tokens,
-                    temperature=self.temperature,
-                    messages=[
-                        {"role": "user", "content": prompt}
-                    ]
-                )
-                result = message.content[0].text.strip()
-            else:
-                return []
+        key = ("expand", query, self._context_key(context))
+        cached = self._cache_get(key)
+        if cached is not None:
+            return list(cached)
 
-            # Parse the result - expect comma-separated or line-separated queries
-            expanded_queries = self._parse_llm_response(result)
-            logger.info(f"Expanded query '{query}' to {len(expanded_queries)} related queries")
+        try:
+            result = self._chat(
+                _EXPANSION_SYSTEM_PROMPT,
+                self._build_query_expansion_prompt(query, context),
+                self.temperature,
+                self.max_tokens,
+            )
+            expanded_queries = self._expanded_queries(query, result)
+            self._cache_put(key, tuple(expanded_queries))
             return expanded_queries
 
         except Exception as e:
             logger.error(f"Failed to expand query with LLM: {e}")
             return []
 
+    def _expanded_queries(self, query: str, result: Optional[str]) -> List[str]:
+        """Turn a query expansion response into a list of queries"""
+        if result is None:
+            return []
+
+        # Parse the result - expect comma-separated or line-separated queries
+        expanded_queries = list(self._parse_llm_response(result))
+        logger.info(f"Expanded query '{query}' to {len(expanded_queries)} related queries")
+        return expanded_queries
+
     def generate_related_queries(
         self,
         query: str,
@@ -165,57 +278,52 @@ class LLMService:
         if not self.is_available():
             return []
 
-        try:
-            prompt = self._build_related_queries_prompt(query, existing_results, limit, context)
-            
-            if self.provider == "openai":
-                response = self.client.chat.completions.create(
-                    model=self.model,
-                    messages=[
-                        {"role": "system", "content": "You are a business intelligence query assistant. Generate relevant follow-up queries."},
-                        {"role": "user", "content": prompt}
-                    ],
-                    temperature=self.temperature,
-                    max_tokens=self.max_tokens,
-                )
-                result = response.choices[0].message.content.strip()
-            elif self.provider == "anthropic":
-                message = self.client.messages.create(
-                    model=self.model,
-                    max_tokens=self.max_tokens,
-                    temperature=self.temperature,
-                    messages=[
-                        {"role": "user", "content": prompt}
-                    ]
-                )
-                result = message.content[0].text.strip()
-            else:
-                return []
+        key = ("related", query, tuple(existing_results or ()), limit, self._context_key(context))
+        cached = self._cache_get(key)
+        if cached is not None:
+            # Query dicts are mutable, so every caller gets its own copy
+            return copy.deepcopy(list(cached))
 
-            # Parse and format results
-            related_queries = []
-            parsed_queries = self._parse_llm_response(result)
-            
-            for i, query_text in enumerate(parsed_queries[:limit]):
-                related_queries.append({
-                    "text": query_text,
-                    "score": 0.95 - (i * 0.05),  # Decreasing score for each item
-                    "source": "llm",
-                    "keywords": [],
-                    "metadata": {
-                        "llm_generated": True,
-                        "llm_provider": self.provider,
-                        "llm_model": self.model
-                    }
-                })
-
-            logger.info(f"Generated {len(related_queries)} LLM-based related queries for '{query}'")
+        try:
+            result = self._chat(
+                _RELATED_SYSTEM_PROMPT,
+                self._build_related_queries_prompt(query, existing_results, limit, context),
+                self.temperature,
+                self.max_tokens,
+            )
+            related_queries = self._related_queries(query, result, limit)
+            self._cache_put(key, tuple(copy.deepcopy(related_queries)))
             return related_queries
 
         except Exception as e:
             logger.error(f"Failed to generate related queries with LLM: {e}")
             return []
 
+    def _related_queries(self, query: str, result: Optional[str], limit: int) -> List[Dict[str, Any]]:
+        """Turn a related queries response into scored query dictionaries"""
+        if result is None:
+            return []
+
+        # Parse and format results
+        related_queries = []
+        parsed_queries = self._parse_llm_response(result)
+        
+        for i, query_text in enumerate(islice(parsed_queries, limit)):
+            related_queries.append({
+                "text": query_text,
+                "score": 0.95 - (i * 0.05),  # Decreasing score for each item
+                "source": "llm",
+                "keywords": [],
+                "metadata": {
+                    "llm_generated": True,
+                    "llm_provider": self.provider,
+                    "llm_model": self.model
+                }
+            })
+
+        logger.info(f"Generated {len(related_queries)} LLM-based related queries for '{query}'")
+        return related_queries
+
     def rewrite_query(self, query: str, intent: str = "clarify") -> Optional[str]:
         """Rewrite a query for better search results
 
@@ -229,34 +337,19 @@ class LLMService:
         if not self.is_available():
             return None
 
-        try:
-            prompt = self._build_query_rewrite_prompt(query, intent)
-            
-            if self.provider == "openai":
-                response = self.client.chat.completions.create(
-                    model=self.model,
-                    messages=[
-                        {"role": "system", "content": "You are a query optimization assistant. Rewrite queries to be more effective for search."},
-                        {"role": "user", "content": prompt}
-                    ],
-                    temperature=0.3,  # Lower temperature for more deterministic rewrites
-                    max_tokens=100,
-                )
-                rewritten = response.choices[0].message.content.strip()
-            elif self.provider == "anthropic":
-                message = self.client.messages.create(
-                    model=self.model,
-                    max_tokens=100,
-                    temperature=0.3,
-                    messages=[
-                        {"role": "user", "content": prompt}
-                    ]
-                )
-                rewritten = message.content[0].text.strip()
-            else:
-                return None
+        key = ("rewrite", query, intent)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
 
-            logger.info(f"Rewrote query '{query}' to '{rewritten}'")
+        try:
+            # Lower temperature for more deterministic rewrites
+            rewritten = self._chat(
+                _REWRITE_SYSTEM_PROMPT, self._build_query_rewrite_prompt(query, intent), 0.3, 100
+            )
+            if rewritten is not None:
+                logger.info(f"Rewrote query '{query}' to '{rewritten}'")
+                self._cache_put(key, rewritten)
             return rewritten
 
         except Exception as e:
@@ -370,8 +463,6 @@ class LLMService:
                 return []
 
             # Parse the JSON response
-            import json
-            
             # Try to extract JSON from response
             # Sometimes LLM wraps JSON in markdown code blocks
             if "```json" in result:
@@ -462,35 +553,13 @@ Return only the JSON array:"""
         
         return prompt
 
-    def _parse_llm_response(self, response: str) -> List[str]:
-        """Parse LLM response into a list of queries
+    def _parse_llm_response(self, response: str) -> Iterator[str]:
+        """Parse LLM response into queries
 
         Args:
             response: Raw LLM response text
 
-        Returns:
-            List of parsed queries
+        Yields:
+            Parsed queries, deduplicated in order of appearance
         """
-        # Try to parse as line-separated
-        lines = [line.strip() for line in response.split('\n') if line.strip()]
-        
-        # If only one line, try comma-separated
-        if len(lines) == 1:
-            lines = [item.strip() for item in response.split(',') if item.strip()]
-        
-        # Clean up any numbering or bullets
-        cleaned = []
-        for line in lines:
-            # Remove common prefixes like "1.", "- ", "* ", etc.
-            cleaned_line = line
-            for prefix in ['1.', '2.', '3.', '4.', '5.', '6.', '7.', '8.', '9.', '0.', '-', '*', '•', '·']:
-                if cleaned_line.startswith(prefix):
-                    cleaned_line = cleaned_line[len(prefix):].strip()
-            
-            # Remove quotes
-            cleaned_line = cleaned_line.strip('"\'""''')
-            
-            if cleaned_line and len(cleaned_line) > 2:
-                cleaned.append(cleaned_line)
-        
-        return cleaned
+        yield from _parse_list_items(response)
@@ -2,8 +2,10 @@
 
 import datetime
 import logging
-from typing import Any, Dict, List, Optional, Type, TypeVar
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Type, TypeVar, Union
 
+from sqlalchemy.engine import Connection, Engine, make_url
 from sqlmodel import Session, create_engine, select
 
 from app.models.metadata import (
@@ -13,6 +15,7 @@ from app.models.metadata import (
     MetaEntity,
     MetaMetric,
     MetaTable,
+    MetaTableColumn,
 )
 
 logger = logging.getLogger(__name__)
@@ -20,39 +23,83 @@ logger = logging.getLogger(__name__)
 T = TypeVar('T')
 
 
+def _create_tables(engine: Union[Engine, Connection]) -> None:
+    """Create all metadata tables on engine if they don't exist"""
+    from sqlmodel import SQLModel
+    from app.models.metadata import (
+        MetaDatabase,
+        MetaDimension,
+        MetaDomain,
+        MetaEntity,
+        MetaMetric,
+        MetaRelation,
+        MetaTable,
+        MetaTableColumn,
+        MetaTag,
+    )
+
+    SQLModel.metadata.create_all(engine)
+    logger.info("Metadata tables created successfully")
+
+
+def _create_engine(database_url: str) -> Engine:
+    """Create an engine for database_url with the metadata tables in place"""
+    engine = create_engine(database_url, echo=False)
+    _create_tables(engine)
+    return engine
+
+
+@lru_cache(maxsize=16)
+def _engine_for(database_url: str) -> Engine:
+    """Get the process-wide engine for database_url, creating it on first use"""
+    return _create_engine(database_url)
+
+
+def _is_in_memory(database_url: str) -> bool:
+    """Check whether database_url points at a private in-memory SQLite database"""
+    url = make_url(database_url)
+    return url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:")
+
+
 class MetadataService:
     """Service for metadata CRUD operations"""
 
-    def __init__(self, database_url: str = "sqlite:///./metadata.db"):
+    def __init__(
+        self,
+        database_url: str = "sqlite:///./metadata.db",
+        engine: Optional[Union[Engine, Connection]] = None
+    ):
         """Initialize metadata service with database connection
         
         Args:
             database_url: Database connection URL
+            engine: Optional existing engine or connection to use instead of
+                creating one from database_url
+
+        Engines built from database_url are shared by every service using
+        the same URL, so table creation runs once per
+        process. In-memory SQLite URLs still get a fresh database each time.
         """
-        self.engine = create_engine(database_url, echo=False)
-        self._create_tables()
+        if engine is not None:
+            self.engine = engine
+            self._create_tables()
+        elif _is_in_memory(database_url):
+            self.engine = _create_engine(database_url)
+        else:
+            self.engine = _engine_for(database_url)
 
     def _create_tables(self):
         """Create all metadata tables if they don't exist"""
-        from sqlmodel import SQLModel
-        from app.models.metadata import (
-            MetaDatabase,
-            MetaDimension,
-            MetaDomain,
-            MetaEntity,
-            MetaMetric,
-            MetaRelation,
-            MetaTable,
-            MetaTableColumn,
-            MetaTag,
-        )
-        
-        SQLModel.metadata.create_all(self.engine)
-        logger.info("Metadata tables created successfully")
+        _create_tables(self.engine)
 
     def _get_session(self) -> Session:
-        """Get a database session"""
-        return Session(self.engine)
+        """Get a database session
+        
+        Attributes stay loaded after commit, so returned records are usable
+        without a refresh SELECT. Defaults are all set in Python and ids are
+        filled in by the INSERT, so nothing the database generates is missed.
+        """
+        return Session(self.engine, expire_on_commit=False)
 
     def _update_timestamps(self, obj: Any, is_create: bool = False):
         """Update timestamp fields"""
@@ -77,10 +124,54 @@ class MetadataService:
             self._update_timestamps(obj, is_create=True)
             session.add(obj)
             session.commit()
-            session.refresh(obj)
             logger.info(f"Created {model_class.__name__} with id {obj.id}")
             return obj
 
+    def create_many(self, model_class: Type[T], data_list: List[Dict[str, Any]]) -> List[T]:
+        """Create several records in one transaction
+        
+        Args:
+            model_class: SQLModel class
+            data_list: Record data for each record
+            
+        Returns:
+            Created records, in the order of data_list
+        """
+        now = datetime.datetime.now()
+        with self._get_session() as session:
+            objs = [
+                model_class(**{**data, "gmt_create": now, "gmt_modified": now})
+                for data in data_list
+            ]
+            session.add_all(objs)
+            session.commit()
+            logger.info(f"Created {len(objs)} {model_class.__name__} records")
+            return objs
+
+    def bulk_insert(self, model_class: Type[T], data_list: List[Dict[str, Any]]) -> int:
+        """Insert several records as one executemany, without tracking them
+        
+        Cheaper than create_many when the caller does not need the records
+        back. Model defaults are still applied, but ids are not returned.
+        
+        Args:
+            model_class: SQLModel class
+            data_list: Record data for each record
+            
+        Returns:
+            Number of records inserted
+        """
+        now = datetime.datetime.now()
+        mappings = [
+            model_class(**{**data, "gmt_create": now, "gmt_modified": now}).model_dump(exclude={"id"})
+            for data in data_list
+        ]
+        with self._get_session() as session:
+            session.bulk_insert_mappings(model_class, mappings)
+            session.commit()
+        logger.info(f"Inserted {len(mappings)} {model_class.__name__} records")
+        return len(mappings)
+
     def get_by_id(self, model_class: Type[T], record_id: int) -> Optional[T]:
         """Get a record by ID
         
@@ -155,7 +246,6 @@ class MetadataService:
             self._update_timestamps(obj, is_create=False)
             session.add(obj)
             session.commit()
-            session.refresh(obj)
             logger.info(f"Updated {model_class.__name__} with id {record_id}")
             return obj
 
@@ -209,6 +299,14 @@ class MetadataService:
         """Create a dimension"""
         return self.create(MetaDimension, data)
 
+    def create_dimensions(self, data_list: List[Dict[str, Any]]) -> List[MetaDimension]:
+        """Create several dimensions in one transaction"""
+        return self.create_many(MetaDimension, data_list)
+
+    def bulk_insert_dimensions(self, data_list: List[Dict[str, Any]]) -> int:
+        """Insert several dimensions without returning them"""
+        return self.bulk_insert(MetaDimension, data_list)
+
     def get_dimension(self, dimension_id: int) -> Optional[MetaDimension]:
         """Get a dimension by ID"""
         return self.get_by_id(MetaDimension, dimension_id)
@@ -289,6 +387,24 @@ class MetadataService:
         """Delete a table"""
         return self.delete(MetaTable, table_id)
 
+    def create_table_columns(
+        self,
+        table_id: int,
+        data_list: List[Dict[str, Any]]
+    ) -> List[MetaTableColumn]:
+        """Create several columns of a table in one transaction
+        
+        Args:
+            table_id: Table ID the columns belong to
+            data_list: Column data for each column
+            
+        Returns:
+            Created columns, in the order of data_list
+        """
+        return self.create_many(
+            MetaTableColumn, [{**data, "table_id": table_id} for data in data_list]
+        )
+
     # Entity-specific methods
     def create_entity(self, data: Dict[str, Any]) -> MetaEntity:
         """Create an entity"""
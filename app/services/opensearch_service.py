@@ -158,11 +158,21 @@ class OpenSearchService:
             logger.error(f"Failed to index document: {e}")
             return False
 
-    def bulk_index_documents(self, documents: List[Dict[str, Any]]) -> Tuple[int, int]:
+    def bulk_index_documents(
+        self,
+        documents: List[Dict[str, Any]],
+        chunk_size: int = 500,
+        thread_count: int = 4,
+        suspend_refresh: bool = False,
+    ) -> Tuple[int, int]:
         """Bulk index multiple documents
 
         Args:
             documents: List of documents to index
+            chunk_size: Number of documents sent per bulk request
+            thread_count: Number of threads sending bulk requests in parallel
+            suspend_refresh: Disable periodic refresh during the ingest and refresh once
+                at the end; only for offline loads, as the setting is index-wide
 
         Returns:
             Tuple of (success_count, error_count)
@@ -170,9 +180,9 @@ class OpenSearchService:
         try:
             from datetime import datetime
 
-            actions = []
-            for doc in documents:
-                action = {
+            now = datetime.now().isoformat()
+            actions = (
+                {
                     "_index": self.index_name,
                     "_id": doc.get("doc_id", None),
                     "_source": {
@@ -181,20 +191,80 @@ class OpenSearchService:
                         "keywords": doc.get("keywords", []),
                         "metadata": doc.get("metadata", {}),
                         "frequency": 0,
-                        "created_at": datetime.now().isoformat(),
-                        "updated_at": datetime.now().isoformat(),
+                        "created_at": now,
+                        "updated_at": now,
                     },
                 }
-                actions.append(action)
+                for doc in documents
+            )
 
-            success, errors = helpers.bulk(self.client, actions, refresh=True)
-            logger.info(f"Bulk indexed {success} documents with {len(errors)} errors")
-            return success, len(errors)
+            success, errors = 0, 0
+            suspended, previous_interval = False, None
+            try:
+                if suspend_refresh:
+                    try:
+                        previous_interval = self._get_refresh_interval()
+                        self._set_refresh_interval("-1")
+                        suspended = True
+                    except Exception as e:
+                        logger.warning(f"Could not suspend refresh, indexing with it enabled: {e}")
+
+                # Collect per-document failures instead of aborting the whole batch
+                for ok, _ in helpers.parallel_bulk(
+                    self.client,
+                    actions,
+                    thread_count=thread_count,
+                    chunk_size=chunk_size,
+                    queue_size=thread_count,
+                    raise_on_error=False,
+                ):
+                    if ok:
+                        success += 1
+                    else:
+                        errors += 1
+            finally:
+                # A failed restore or refresh must not hide what was indexed
+                if suspended:
+                    try:
+                        # None restores the index default when no interval was configured
+                        self._set_refresh_interval(previous_interval)
+                    except Exception as e:
+                        logger.error(f"Failed to restore refresh interval {previous_interval}: {e}")
+                # Documents are searchable on return, as with single-document indexing
+                try:
+                    self.client.indices.refresh(index=self.index_name)
+                except Exception as e:
+                    logger.error(f"Failed to refresh index after bulk indexing: {e}")
+
+            logger.info(f"Bulk indexed {success} documents with {errors} errors")
+            return success, errors
 
         except Exception as e:
             logger.error(f"Bulk indexing failed: {e}")
             return 0, len(documents)
 
+    def _get_refresh_interval(self) -> Optional[str]:
+        """Get the configured index refresh interval
+
+        Returns:
+            Refresh interval, or None if the index uses the default
+        """
+        settings = self.client.indices.get_settings(
+            index=self.index_name, name="index.refresh_interval"
+        )
+        index_settings = settings.get(self.index_name, {}).get("settings", {})
+        return index_settings.get("index", {}).get("refresh_interval")
+
+    def _set_refresh_interval(self, interval: Optional[str]):
+        """Set the index refresh interval
+
+        Args:
+            interval: Refresh interval such as "1s", "-1" to disable, or None for the default
+        """
+        self.client.indices.put_settings(
+            index=self.index_name, body={"index": {"refresh_interval": interval}}
+        )
+
     def keyword_search(
         self, query: str, size: int = 10, min_score: float = 0.1
     ) -> List[Dict[str, Any]]:
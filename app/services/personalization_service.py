@@ -100,38 +100,46 @@ class PersonalizationService:
             if timestamp is None:
                 timestamp = datetime.now().isoformat()
 
-            # Store in multiple structures for different query patterns
+            # Read the previous query before this selection becomes the newest entry
+            prev_query = self._get_previous_query(user_id)
+
+            # Store in multiple structures for different query patterns,
+            # sending every write in a single round-trip
+            pipe = self.redis_client.pipeline(transaction=False)
 
             # 1. User's selection history
             history_key = f"user:{user_id}:history"
             history_item = json.dumps(
                 {"query": query, "selected": selected_text, "timestamp": timestamp}
             )
-            self.redis_client.lpush(history_key, history_item)
-            self.redis_client.ltrim(history_key, 0, 999)  # Keep last 1000 items
+            pipe.lpush(history_key, history_item)
+            pipe.ltrim(history_key, 0, 999)  # Keep last 1000 items
 
             # 2. User's query -> selection mapping (most recent)
             query_key = f"user:{user_id}:query:{query}"
-            self.redis_client.setex(query_key, timedelta(days=30), selected_text)
+            pipe.setex(query_key, timedelta(days=30), selected_text)
 
             # 3. User's frequent selections
             freq_key = f"user:{user_id}:freq"
-            self.redis_client.zincrby(freq_key, 1, selected_text)
+            pipe.zincrby(freq_key, 1, selected_text)
 
             # 4. Global query -> selection frequency
             global_key = f"global:query:{query}"
-            self.redis_client.zincrby(global_key, 1, selected_text)
+            pipe.zincrby(global_key, 1, selected_text)
 
             # 5. Track query sequences for better related query suggestions
-            # Get the previous query from user's recent history
-            prev_query = self._get_previous_query(user_id)
             if prev_query and prev_query != query:
                 # Store: previous_query -> current_query sequence
                 sequence_key = f"sequence:{prev_query}"
-                self.redis_client.zincrby(sequence_key, 1, query)
+                pipe.zincrby(sequence_key, 1, query)
                 # Also store user-specific sequences
                 user_sequence_key = f"user:{user_id}:sequence:{prev_query}"
-                self.redis_client.zincrby(user_sequence_key, 1, query)
+                pipe.zincrby(user_sequence_key, 1, query)
+                # Reverse index: current_query <- previous_query, so lookups need no key scan
+                pipe.zincrby(f"prev:{query}", 1, prev_query)
+                pipe.zincrby(f"user:{user_id}:prev:{query}", 1, prev_query)
+
+            pipe.execute()
 
             logger.debug(f"Tracked selection for user {user_id}: {query} -> {selected_text}")
             return True
@@ -249,30 +257,21 @@ class PersonalizationService:
             result["next"] = result["next"][:limit]
 
             # Get queries that come before this query (previous queries)
-            # We need to find all keys where this query is a value in the sequence
-            # For performance, we'll scan user-specific and global sequence keys
+            # from the reverse index written by track_selection
             if user_id:
-                # Check user-specific sequences
-                pattern = f"user:{user_id}:sequence:*"
-                for key in self.redis_client.scan_iter(match=pattern, count=100):
-                    score = self.redis_client.zscore(key, query)
-                    if score is not None:
-                        # Extract the previous query from the key
-                        prev_query = key.split(f"user:{user_id}:sequence:")[1]
-                        if prev_query and prev_query != query:
-                            result["previous"].append((prev_query, score))
-
-            # Also check global sequences
-            pattern = "sequence:*"
-            for key in self.redis_client.scan_iter(match=pattern, count=100):
-                score = self.redis_client.zscore(key, query)
-                if score is not None:
-                    # Extract the previous query from the key
-                    prev_query = key.split("sequence:")[1]
-                    if prev_query and prev_query != query:
-                        # Check if not already in results
-                        if prev_query not in {q for q, _ in result["previous"]}:
-                            result["previous"].append((prev_query, score))
+                user_prev_key = f"user:{user_id}:prev:{query}"
+                user_prev = self.redis_client.zrevrange(user_prev_key, 0, limit - 1, withscores=True)
+                if user_prev:
+                    result["previous"].extend(user_prev)
+
+            global_prev = self.redis_client.zrevrange(f"prev:{query}", 0, limit - 1, withscores=True)
+
+            # Combine and deduplicate previous queries
+            seen_previous = {q for q, _ in result["previous"]}
+            for query_text, score in global_prev:
+                if query_text not in seen_previous:
+                    result["previous"].append((query_text, score))
+                    seen_previous.add(query_text)
 
             # Sort previous queries by score and limit
             result["previous"].sort(key=lambda x: x[1], reverse=True)
@@ -1,7 +1,8 @@
 """Service for long text prefix-preserving intelligent autocomplete"""
 
 import logging
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
 import jieba
 
@@ -13,6 +14,16 @@ from app.services.personalization_service import PersonalizationService
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1024)
+def _tokenize(query: str) -> Tuple[str, ...]:
+    """Segment query with jieba, dropping whitespace-only tokens
+
+    Autocomplete sees the same prefixes again and again as the user types,
+    so segmentations are cached; the tuple keeps cached results immutable.
+    """
+    return tuple(t for t in jieba.lcut(query) if t.strip())
+
+
 class PrefixPreservingService:
     """Long text prefix-preserving autocomplete service"""
 
@@ -58,25 +69,22 @@ class PrefixPreservingService:
                 - tokens: List of all tokens
                 - is_long_query: Whether this qualifies for prefix preservation
         """
+        query = (query or "").strip()
+        if not query:
+            return {
+                "prefix": "",
+                "incomplete_term": "",
+                "tokens": [],
+                "is_long_query": False,
+            }
+        
         try:
-            # Tokenize using jieba
-            tokens = jieba.lcut(query.strip())
-            
-            # Filter out empty tokens
-            tokens = [t for t in tokens if t.strip()]
+            # Tokenize using jieba, filtering out empty tokens
+            tokens = list(_tokenize(query))
             
             # Determine if this is a long query
             is_long_query = len(tokens) >= self.min_tokens_for_prefix_mode
             
-            # Identify incomplete term (last 1-2 tokens)
-            if len(tokens) == 0:
-                return {
-                    "prefix": "",
-                    "incomplete_term": "",
-                    "tokens": [],
-                    "is_long_query": False,
-                }
-            
             # For long queries, treat last token as incomplete if it's short
             # or if it's clearly a prefix (like "销" in "帮我查询一下今年北京的销")
             if is_long_query:
@@ -300,12 +308,16 @@ class PrefixPreservingService:
             if not results:
                 return None
             
-            # 6. Convert to Suggestion objects
+            # 6. Convert to Suggestion objects; rows without usable text are dropped and
+            # text is stripped here as validation would, so model_construct can skip it
             suggestions = []
             for result in results[:limit]:
-                suggestion = Suggestion(
-                    text=result["text"],
-                    score=round(result.get("score", 0.5), 4),
+                text = result.get("text")
+                if not isinstance(text, str) or not text.strip():
+                    continue
+                suggestion = Suggestion.model_construct(
+                    text=text.strip(),
+                    score=round(float(result.get("score", 0.5)), 4),
                     source="prefix_preserved",
                     metadata={
                         "prefix": analysis["prefix"],
@@ -316,6 +328,9 @@ class PrefixPreservingService:
                 )
                 suggestions.append(suggestion)
             
+            if not suggestions:
+                return None
+            
             logger.info(
                 f"Generated {len(suggestions)} prefix-preserved suggestions for: {query}"
             )
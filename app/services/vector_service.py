@@ -1,7 +1,9 @@
 """Vector embedding service"""
 
 import logging
-from typing import List, Optional
+import threading
+from collections import OrderedDict
+from typing import List, Optional, Tuple
 
 import numpy as np
 
@@ -12,15 +14,22 @@ class VectorService:
     """Service for generating vector embeddings"""
 
     def __init__(
-        self, model_name: str = "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2"
+        self,
+        model_name: str = "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2",
+        cache_size: int = 1024,
     ):
         """Initialize vector service with sentence transformer model
 
         Args:
             model_name: Name of the sentence transformer model
+            cache_size: Maximum number of single-text embeddings kept in memory (0 disables caching)
         """
         self.model_name = model_name
+        self.cache_size = cache_size
         self._model = None
+        self._cache: "OrderedDict[str, Tuple[float, ...]]" = OrderedDict()
+        # Sync routes run in FastAPI's threadpool and share this instance
+        self._cache_lock = threading.Lock()
 
     def _load_model(self):
         """Lazy load the sentence transformer model"""
@@ -35,18 +44,19 @@ class VectorService:
                 logger.error(f"Failed to load model: {e}")
                 raise
 
-    def encode(self, texts: List[str]) -> np.ndarray:
+    def encode(self, texts: List[str], batch_size: int = 32) -> np.ndarray:
         """Encode texts to vector embeddings
 
         Args:
             texts: List of text strings to encode
+            batch_size: Number of texts per forward pass
 
         Returns:
             Array of vector embeddings
         """
         self._load_model()
         try:
-            embeddings = self._model.encode(texts, convert_to_numpy=True)
+            embeddings = self._model.encode(texts, batch_size=batch_size, convert_to_numpy=True)
             return embeddings
         except Exception as e:
             logger.error(f"Failed to encode texts: {e}")
@@ -61,8 +71,27 @@ class VectorService:
         Returns:
             Vector embedding as list of floats
         """
-        embeddings = self.encode([text])
-        return embeddings[0].tolist()
+        # Autocomplete re-encodes the same prefixes constantly, so reuse recent embeddings
+        with self._cache_lock:
+            cached = self._cache.get(text)
+            if cached is not None:
+                self._cache.move_to_end(text)
+                return list(cached)
+
+        # The model runs outside the lock so concurrent misses encode in parallel
+        embedding = self.encode([text])[0].tolist()
+        if self.cache_size > 0:
+            with self._cache_lock:
+                self._cache[text] = tuple(embedding)
+                self._cache.move_to_end(text)
+                if len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return embedding
+
+    def clear_cache(self):
+        """Drop all cached single-text embeddings"""
+        with self._cache_lock:
+            self._cache.clear()
 
     def get_dimension(self) -> int:
         """Get the dimension of the vector embeddings
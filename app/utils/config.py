@@ -1,5 +1,6 @@
 """Configuration management"""
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional
 
@@ -7,6 +8,9 @@ import yaml
 from pydantic import BaseModel
 from pydantic_settings import BaseSettings
 
+# Prefer the libyaml C loader when PyYAML was built with it
+YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class OpenSearchConfig(BaseModel):
     """OpenSearch configuration"""
@@ -45,6 +49,7 @@ class VectorModelConfig(BaseModel):
 
     model_name: str = "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2"
     dimension: int = 384
+    cache_size: int = 1024
 
 
 class APIConfig(BaseModel):
@@ -65,6 +70,7 @@ class LLMConfig(BaseModel):
     model: str = "gpt-3.5-turbo"
     temperature: float = 0.7
     max_tokens: int = 150
+    cache_size: int = 512
     api_key: Optional[str] = None
 
 
@@ -85,19 +91,13 @@ class Config(BaseSettings):
         if not path.exists():
             return cls()
 
-        with open(path, "r", encoding="utf-8") as f:
-            config_dict = yaml.safe_load(f)
+        with open(path, "rb") as f:
+            config_dict = yaml.load(f, Loader=YamlLoader)
 
         return cls(**config_dict)
 
 
-# Global configuration instance
-config: Optional[Config] = None
-
-
+@lru_cache(maxsize=1)
 def get_config() -> Config:
     """Get global configuration instance"""
-    global config
-    if config is None:
-        config = Config.from_yaml()
-    return config
+    return Config.from_yaml()
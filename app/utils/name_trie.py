@@ -0,0 +1,71 @@
+"""Prefix trie for finding names within a Levenshtein distance of a query"""
+
+from typing import Dict, Iterable, List
+
+
+class _TrieNode:
+    """Trie node holding children by character and the positions of names ending here"""
+
+    __slots__ = ("children", "positions")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.positions: List[int] = []
+
+
+class NameTrie:
+    """Trie over a list of names for bounded fuzzy lookup
+
+    Names that share a prefix share the Levenshtein DP rows computed for that
+    prefix, and whole subtrees are skipped once every cell of a row exceeds
+    the distance bound.
+    """
+
+    def __init__(self, names: Iterable[str]):
+        """Build the trie
+
+        Args:
+            names: Names to index; results refer to them by position
+        """
+        self._root = _TrieNode()
+        for position, name in enumerate(names):
+            node = self._root
+            for char in name:
+                node = node.children.setdefault(char, _TrieNode())
+            node.positions.append(position)
+
+    def search_within(self, query: str, max_distance: int) -> Dict[int, int]:
+        """Find all names within max_distance edits of query
+
+        Args:
+            query: Query string
+            max_distance: Largest Levenshtein distance to report
+
+        Returns:
+            Mapping of name position to its exact distance from query
+        """
+        results: Dict[int, int] = {}
+        first_row = list(range(len(query) + 1))
+        if first_row[-1] <= max_distance:
+            for position in self._root.positions:
+                results[position] = first_row[-1]
+
+        # Depth-first walk; each entry carries the DP row of its parent
+        stack = [(char, child, first_row) for char, child in self._root.children.items()]
+        while stack:
+            char, node, prev_row = stack.pop()
+            row = [prev_row[0] + 1]
+            for j in range(1, len(query) + 1):
+                row.append(min(
+                    row[j - 1] + 1,
+                    prev_row[j] + 1,
+                    prev_row[j - 1] + (query[j - 1] != char),
+                ))
+
+            if row[-1] <= max_distance:
+                for position in node.positions:
+                    results[position] = row[-1]
+            if min(row) <= max_distance:
+                stack.extend((c, child, row) for c, child in node.children.items())
+
+        return results
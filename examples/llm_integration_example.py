@@ -5,6 +5,8 @@ This example shows how the LLM service enhances autocomplete and related query s
 """
 
 import os
+from concurrent.futures import ThreadPoolExecutor
+
 from app.services.llm_service import LLMService
 
 
@@ -201,6 +203,21 @@ def demonstrate_without_llm():
     print()
 
 
+def render_example(index, example):
+    """Render a single with/without LLM comparison as a printable block"""
+    lines = [
+        f"Example {index}: '{example['query']}'",
+        "-" * 40,
+        "Without LLM:",
+    ]
+    lines.extend(f"  • {item}" for item in example["without_llm"])
+    lines.append("")
+    lines.append("With LLM (more comprehensive):")
+    lines.extend(f"  • {item}" for item in example["with_llm"])
+    lines.append("")
+    return "\n".join(lines)
+
+
 def show_integration_benefits():
     """Show concrete examples of LLM benefits"""
     print()
@@ -257,17 +274,13 @@ def show_integration_benefits():
         }
     ]
     
-    for i, example in enumerate(examples, 1):
-        print(f"Example {i}: '{example['query']}'")
-        print("-" * 40)
-        print("Without LLM:")
-        for item in example["without_llm"]:
-            print(f"  • {item}")
-        print()
-        print("With LLM (more comprehensive):")
-        for item in example["with_llm"]:
-            print(f"  • {item}")
-        print()
+    # Examples are rendered independently, so render them concurrently and
+    # print in the original order
+    with ThreadPoolExecutor(max_workers=len(examples)) as executor:
+        rendered = list(executor.map(render_example, range(1, len(examples) + 1), examples))
+
+    for block in rendered:
+        print(block)
     
     print("=" * 80)
     print("Key Advantages:")
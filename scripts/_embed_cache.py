@@ -0,0 +1,140 @@
+"""Disk-backed embedding and model caches for the data initialization scripts"""
+
+import hashlib
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Callable, Dict, List, Union
+
+import numpy as np
+
+from app.services.vector_service import VectorService
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = Path(__file__).resolve().parent.parent / ".cache"
+DEFAULT_CACHE_PATH = CACHE_DIR / "embeddings.npz"
+DEFAULT_MODELS_DIR = CACHE_DIR / "models"
+
+
+def _cache_key(model_name: str, text: str) -> str:
+    """Build the cache key for a text, scoped to the model that embedded it"""
+    digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    # npz entries are stored as zip members, so keep the key free of path separators
+    return f"{model_name.replace('/', '__')}:{digest}"
+
+
+def _load(cache_path: Path) -> Dict[str, np.ndarray]:
+    """Load the cache file into a dict, treating a missing or corrupt file as empty"""
+    if not cache_path.exists():
+        return {}
+    try:
+        with np.load(cache_path) as data:
+            return {key: data[key] for key in data.files}
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable embedding cache {cache_path}: {e}")
+        return {}
+
+
+def _save(cache_path: Path, cache: Dict[str, np.ndarray]):
+    """Atomically rewrite the cache file"""
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix=".npz")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.savez_compressed(f, **cache)
+        os.replace(tmp_path, cache_path)
+    except Exception:
+        os.unlink(tmp_path)
+        raise
+
+
+def get_or_compute(
+    texts: List[str],
+    encode: Callable[[List[str]], np.ndarray],
+    model_name: str,
+    cache_path: Union[str, Path] = DEFAULT_CACHE_PATH,
+) -> np.ndarray:
+    """Return embeddings for texts, encoding only those missing from the cache
+
+    Args:
+        texts: Texts to embed
+        encode: Function that batch-encodes a list of texts
+        model_name: Name of the embedding model, part of the cache key
+        cache_path: Location of the npz cache file
+
+    Returns:
+        Array of embeddings in the same order as texts
+    """
+    cache_path = Path(cache_path)
+    cache = _load(cache_path)
+    keys = [_cache_key(model_name, text) for text in texts]
+
+    missing = list(dict.fromkeys(text for text, key in zip(texts, keys) if key not in cache))
+    if missing:
+        logger.info(f"Encoding {len(missing)} texts not found in embedding cache")
+        vectors = encode(missing)
+        for text, vector in zip(missing, vectors):
+            cache[_cache_key(model_name, text)] = np.asarray(vector)
+        _save(cache_path, cache)
+    else:
+        logger.info("All embeddings served from cache")
+
+    return np.stack([cache[key] for key in keys])
+
+
+def load_fp16_model(model_name: str, models_dir: Union[str, Path] = DEFAULT_MODELS_DIR):
+    """Load a SentenceTransformer from a half-precision local copy
+
+    The first call downloads the model and saves it with FP16 weights, which
+    halves the bytes read on later cold starts. Computation stays in FP32 on
+    CPU, where half-precision matmuls are slow or unsupported.
+
+    Args:
+        model_name: Name of the sentence transformer model
+        models_dir: Directory holding the converted models
+
+    Returns:
+        Loaded SentenceTransformer model
+    """
+    import torch
+    from sentence_transformers import SentenceTransformer
+
+    local_path = Path(models_dir) / f"{model_name.replace('/', '__')}-fp16"
+    if not local_path.exists():
+        logger.info(f"Converting {model_name} to half precision at {local_path}")
+        model = SentenceTransformer(model_name, device="cpu")
+        model.half()
+        model.save(str(local_path))
+
+    device = "cuda" if torch.cuda.is_available() else "cpu"
+    model = SentenceTransformer(str(local_path), device=device)
+    return model.half() if device == "cuda" else model.float()
+
+
+class CachedVectorService(VectorService):
+    """VectorService that serves repeated texts from the on-disk embedding cache"""
+
+    def __init__(
+        self,
+        model_name: str,
+        cache_path: Union[str, Path] = DEFAULT_CACHE_PATH,
+        models_dir: Union[str, Path] = DEFAULT_MODELS_DIR,
+    ):
+        super().__init__(model_name=model_name)
+        self.cache_path = cache_path
+        self.models_dir = models_dir
+
+    def _load_model(self):
+        """Lazy load the model from its half-precision local copy"""
+        if self._model is None:
+            self._model = load_fp16_model(self.model_name, self.models_dir)
+
+    def encode(self, texts: List[str], batch_size: int = 32) -> np.ndarray:
+        return get_or_compute(
+            texts,
+            lambda missing: super(CachedVectorService, self).encode(missing, batch_size=batch_size),
+            self.model_name,
+            self.cache_path,
+        )
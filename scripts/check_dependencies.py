@@ -1,21 +1,138 @@
 #!/usr/bin/env python
 """Check for outdated dependencies and security vulnerabilities"""
 
-import subprocess
+import asyncio
+import json
+import os
+import shutil
 import sys
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from importlib import metadata
 
+try:
+    from packaging.version import InvalidVersion, Version
+except ImportError:  # pragma: no cover - packaging ships with pip/setuptools
+    Version = None
 
-def run_command(cmd, description):
-    """Run a command and print results"""
+PYPI_JSON_URL = "https://pypi.org/pypi/{name}/json"
+# Concurrent PyPI lookups; kept small so a full environment does not flood the index
+PYPI_MAX_WORKERS = int(os.getenv("PYPI_MAX_WORKERS", "8"))
+
+
+async def _run(cmd):
+    """Run a command given as an argv list and capture its output"""
+    proc = await asyncio.create_subprocess_exec(
+        *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+    )
+    stdout, stderr = await proc.communicate()
+    return proc.returncode, stdout.decode(), stderr.decode()
+
+
+def report_command(description, result):
+    """Print the results of a command run by _run"""
     print(f"\n{'=' * 60}")
     print(f"{description}")
     print(f"{'=' * 60}")
+    if isinstance(result, Exception):
+        print(f"Error: {result}")
+        return False
+    returncode, stdout, stderr = result
+    print(stdout)
+    if stderr:
+        print(stderr)
+    return returncode == 0
+
+
+async def run_checks(checks):
+    """Run the outdated-package scan and all command checks concurrently
+
+    Returns:
+        Tuple of (outdated_check_passed, command_results) with results in checks order
+    """
+    loop = asyncio.get_running_loop()
+    outdated_passed, *results = await asyncio.gather(
+        loop.run_in_executor(None, check_outdated),
+        *(_run(cmd) for cmd, _ in checks),
+        return_exceptions=True,
+    )
+    return outdated_passed is True, results
+
+
+def _fetch_latest(name):
+    """Fetch the latest released version of a package from PyPI
+
+    Returns:
+        Tuple of (latest_version, error); both are None for a package that is not on
+        PyPI, such as a private or local distribution
+    """
     try:
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-        print(result.stdout)
-        if result.stderr:
-            print(result.stderr)
-        return result.returncode == 0
+        with urllib.request.urlopen(PYPI_JSON_URL.format(name=name), timeout=10) as response:
+            return json.load(response)["info"]["version"], None
+    except urllib.error.HTTPError as e:
+        if e.code == 404:
+            return None, None
+        return None, e
+    except Exception as e:
+        return None, e
+
+
+def _is_newer(latest, installed):
+    """Return True if the latest version is newer than the installed one"""
+    if Version is None:
+        return latest != installed
+    try:
+        return Version(latest) > Version(installed)
+    except InvalidVersion:
+        return latest != installed
+
+
+def check_outdated():
+    """Check installed packages against PyPI without spawning pip"""
+    print(f"\n{'=' * 60}")
+    print("Checking for outdated packages...")
+    print(f"{'=' * 60}")
+    try:
+        installed = {}
+        for dist in metadata.distributions():
+            name = dist.metadata["Name"]
+            if name:
+                installed[name] = dist.version
+
+        names = sorted(installed, key=str.lower)
+        with ThreadPoolExecutor(max_workers=PYPI_MAX_WORKERS) as executor:
+            fetched = list(executor.map(_fetch_latest, names))
+
+        outdated = []
+        failed = []
+        not_on_index = []
+        for name, (latest, error) in zip(names, fetched):
+            if error is not None:
+                failed.append((name, error))
+            elif latest is None:
+                not_on_index.append(name)
+            elif _is_newer(latest, installed[name]):
+                outdated.append((name, installed[name], latest))
+
+        if outdated:
+            print(f"{'Package':<30} {'Version':<15} {'Latest':<15}")
+            print(f"{'-' * 30} {'-' * 15} {'-' * 15}")
+            for name, version, latest in outdated:
+                print(f"{name:<30} {version:<15} {latest:<15}")
+        elif not failed:
+            print("All packages are up to date")
+
+        if not_on_index:
+            print(f"\nSkipped {len(not_on_index)} packages not on PyPI: {', '.join(not_on_index)}")
+
+        # An unreachable index must not pass as "up to date"
+        if failed:
+            print(f"\nCould not check {len(failed)} of {len(names)} packages:")
+            for name, error in failed:
+                print(f"  {name}: {error}")
+            return False
+        return True
     except Exception as e:
         print(f"Error: {e}")
         return False
@@ -28,26 +145,25 @@ def main():
     print("=" * 60)
 
     checks = [
-        ("pip list --outdated", "Checking for outdated packages..."),
-        ("pip check", "Checking for package compatibility issues..."),
+        ([sys.executable, "-m", "pip", "check"], "Checking for package compatibility issues..."),
     ]
 
     # Try to run safety check if available
-    try:
-        subprocess.run(["safety", "--version"], capture_output=True, check=True)
+    safety = shutil.which("safety")
+    if safety:
         checks.append(
             (
-                "safety check --file requirements.txt --json",
+                [safety, "check", "--file", "requirements.txt", "--json"],
                 "Running security vulnerability scan...",
             )
         )
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    else:
         print("\nNote: 'safety' not installed. Install with: pip install safety")
         print("      To scan for security vulnerabilities.")
 
-    all_passed = True
-    for cmd, description in checks:
-        if not run_command(cmd, description):
+    all_passed, results = asyncio.run(run_checks(checks))
+    for (_, description), result in zip(checks, results):
+        if not report_command(description, result):
             all_passed = False
 
     print("\n" + "=" * 60)
@@ -0,0 +1,170 @@
+"""Long-lived embedding server that keeps the sentence transformer warm between script runs
+
+Start it once with ``python scripts/embed_daemon.py`` and pass ``--use-daemon`` to
+``scripts/init_data.py``; later runs then skip the model load entirely. The protocol
+is newline-delimited JSON over a Unix domain socket: each request is
+``{"texts": [...]}`` and each response is ``{"vecs": [[...], ...]}`` or
+``{"error": "..."}``.
+"""
+
+import os
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import argparse
+import asyncio
+import json
+import logging
+import socket
+import stat
+import tempfile
+from typing import List
+
+import numpy as np
+
+from scripts._embed_cache import CachedVectorService
+
+logger = logging.getLogger(__name__)
+
+
+
+def _default_socket_path() -> str:
+    """Per-user socket path, so other local users cannot squat or answer on it
+
+    Uses $XDG_RUNTIME_DIR when set (already private to the user), otherwise a
+    0700 directory of the user's own in the system temp dir.
+    """
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, "aibi-embed.sock")
+    return os.path.join(tempfile.gettempdir(), f"aibi-embed-{os.getuid()}", "embed.sock")
+
+
+SOCKET_PATH = _default_socket_path()
+
+
+def _ensure_private_dir(path: str):
+    """Create the socket directory as 0700 and refuse one owned by another user"""
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    info = os.stat(path)
+    if info.st_uid != os.getuid() or stat.S_IMODE(info.st_mode) & 0o077:
+        raise RuntimeError(f"Socket directory {path} must be owned by you with mode 0700")
+
+
+def _remove_stale_socket(socket_path: str):
+    """Remove a socket file left by a dead daemon, refusing to replace a live one"""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(socket_path)
+        except FileNotFoundError:
+            return
+        except ConnectionRefusedError:
+            # Nobody is listening, the file is left over from a daemon that was killed
+            os.unlink(socket_path)
+            return
+    raise RuntimeError(f"An embedding daemon is already listening on {socket_path}")
+
+
+async def _handle(service: CachedVectorService, encode_lock: asyncio.Lock, reader, writer):
+    """Answer embedding requests on one client connection until it closes"""
+    loop = asyncio.get_running_loop()
+    try:
+        while line := await reader.readline():
+            try:
+                texts = json.loads(line)["texts"]
+                # Each encode rewrites the shared cache file, so run them one at a time
+                async with encode_lock:
+                    vectors = await loop.run_in_executor(None, service.encode, texts)
+                reply = {"vecs": vectors.tolist()}
+            except Exception as e:
+                logger.error(f"Failed to encode request: {e}")
+                reply = {"error": str(e)}
+            writer.write(json.dumps(reply).encode() + b"\n")
+            await writer.drain()
+    finally:
+        writer.close()
+
+
+async def serve(model_name: str, socket_path: str = SOCKET_PATH):
+    """Load the model once and serve embeddings on a Unix socket
+
+    Args:
+        model_name: Name of the sentence transformer model
+        socket_path: Filesystem path of the Unix socket
+    """
+    socket_dir = os.path.dirname(socket_path)
+    if socket_dir != os.environ.get("XDG_RUNTIME_DIR"):
+        _ensure_private_dir(socket_dir)
+    _remove_stale_socket(socket_path)
+
+    service = CachedVectorService(model_name=model_name)
+    service._load_model()
+    encode_lock = asyncio.Lock()
+
+    server = await asyncio.start_unix_server(
+        lambda r, w: _handle(service, encode_lock, r, w), path=socket_path, limit=2**24
+    )
+    logger.info(f"Embedding daemon for {model_name} listening on {socket_path}")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        os.unlink(socket_path)
+
+
+class DaemonVectorService(CachedVectorService):
+    """CachedVectorService that delegates encoding to a running embed daemon
+
+    Falls back to encoding in-process when no daemon is listening.
+    """
+
+    def __init__(self, model_name: str, socket_path: str = SOCKET_PATH, **kwargs):
+        super().__init__(model_name=model_name, **kwargs)
+        self.socket_path = socket_path
+        self._daemon_available = True
+
+    def _encode_remote(self, texts: List[str]) -> np.ndarray:
+        """Send texts to the daemon and return its embeddings"""
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(self.socket_path)
+            with sock.makefile("rwb") as stream:
+                stream.write(json.dumps({"texts": texts}).encode() + b"\n")
+                stream.flush()
+                reply = json.loads(stream.readline())
+        if "error" in reply:
+            raise RuntimeError(f"Embedding daemon error: {reply['error']}")
+        return np.asarray(reply["vecs"], dtype=np.float32)
+
+    def encode(self, texts: List[str], batch_size: int = 32) -> np.ndarray:
+        if self._daemon_available:
+            try:
+                return self._encode_remote(texts)
+            except (ConnectionRefusedError, FileNotFoundError):
+                logger.warning(
+                    f"No embedding daemon at {self.socket_path}, encoding in-process"
+                )
+                self._daemon_available = False
+        return super().encode(texts, batch_size=batch_size)
+
+
+def main():
+    """Main function"""
+    from app.utils.config import get_config
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--socket", default=SOCKET_PATH, help="Unix socket path")
+    parser.add_argument("--model", default=None, help="Model name (defaults to config.yaml)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    model_name = args.model or get_config().vector_model.model_name
+    try:
+        asyncio.run(serve(model_name, args.socket))
+    except KeyboardInterrupt:
+        logger.info("Embedding daemon stopped")
+
+
+if __name__ == "__main__":
+    main()
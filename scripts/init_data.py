@@ -6,12 +6,14 @@ import sys
 # Add parent directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
+import argparse
 import logging
 
 from app.services.autocomplete_service import AutocompleteService
 from app.services.opensearch_service import OpenSearchService
-from app.services.vector_service import VectorService
 from app.utils.config import get_config
+from scripts._embed_cache import CachedVectorService
+from scripts.embed_daemon import DaemonVectorService
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
@@ -86,16 +88,21 @@ def create_sample_data():
     return sample_data
 
 
-def main():
-    """Main function"""
+def main(use_daemon: bool = False):
+    """Main function
+
+    Args:
+        use_daemon: Encode through a running embed daemon instead of loading the model
+    """
     logger.info("Initializing sample data...")
 
     try:
         # Load configuration
         config = get_config()
 
-        # Initialize services
-        vector_service = VectorService(model_name=config.vector_model.model_name)
+        # Initialize services; embeddings are cached on disk so re-runs skip the model
+        vector_service_cls = DaemonVectorService if use_daemon else CachedVectorService
+        vector_service = vector_service_cls(model_name=config.vector_model.model_name)
 
         opensearch_service = OpenSearchService(
             host=config.opensearch.host,
@@ -128,7 +135,12 @@ def main():
         logger.info("Adding sample data...")
         sample_data = create_sample_data()
 
-        success, errors = autocomplete_service.add_documents_bulk(sample_data)
+        # Encode the whole corpus in one batched pass and index it in a single
+        # bulk request rather than one round-trip per document; nothing queries
+        # the index yet, so refresh can be suspended until the load finishes
+        success, errors = autocomplete_service.add_documents_bulk(
+            sample_data, batch_size=64, chunk_size=500, suspend_refresh=True
+        )
 
         logger.info(f"Successfully added {success} documents with {errors} errors")
         logger.info("Sample data initialization complete!")
@@ -139,4 +151,11 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Initialize sample autocomplete data")
+    parser.add_argument(
+        "--use-daemon",
+        action="store_true",
+        help="Encode through scripts/embed_daemon.py, falling back to in-process encoding",
+    )
+    args = parser.parse_args()
+    main(use_daemon=args.use_daemon)
@@ -1,36 +1,73 @@
 """Simple test script for the autocomplete API"""
 
+import asyncio
 import json
 import time
 
 import requests
 
+try:
+    import httpx
+except ImportError:  # httpx ships with requirements-dev.txt
+    httpx = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 BASE_URL = "http://localhost:8000"
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+CONNECTION_ERRORS = (requests.exceptions.ConnectionError,) + (
+    (httpx.ConnectError,) if httpx is not None else ()
+)
+
+
+def _dump(data):
+    """Pretty-print a JSON payload"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(data, indent=2, ensure_ascii=False)
 
 
-def test_health():
+def _encode(payload):
+    """Serialize a request payload to JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, ensure_ascii=False).encode()
+
+
+def _loads(response):
+    """Decode a JSON response body"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+async def test_health(client):
     """Test health endpoint"""
+    response = await client.get("/api/v1/health")
     print("\n=== Testing Health Endpoint ===")
-    response = requests.get(f"{BASE_URL}/api/v1/health")
     print(f"Status Code: {response.status_code}")
-    print(f"Response: {json.dumps(response.json(), indent=2, ensure_ascii=False)}")
+    print(f"Response: {_dump(_loads(response))}")
     return response.status_code == 200
 
 
-def test_autocomplete(query, user_id=None):
+async def test_autocomplete(client, query, user_id=None):
     """Test autocomplete endpoint"""
-    print(f"\n=== Testing Autocomplete: '{query}' ===")
-
     payload = {"query": query, "limit": 5}
 
     if user_id:
         payload["user_id"] = user_id
 
-    response = requests.post(f"{BASE_URL}/api/v1/autocomplete", json=payload)
+    response = await client.post("/api/v1/autocomplete", content=_encode(payload), headers=JSON_HEADERS)
 
+    # Requests run concurrently, so print each block only after its response arrives
+    print(f"\n=== Testing Autocomplete: '{query}' ===")
     print(f"Status Code: {response.status_code}")
     if response.status_code == 200:
-        data = response.json()
+        data = _loads(response)
         print(f"Query: {data['query']}")
         print(f"Total Suggestions: {data['total']}")
         print("\nSuggestions:")
@@ -40,92 +77,128 @@ def test_autocomplete(query, user_id=None):
     else:
         print(f"Error: {response.text}")
 
-    return response.json() if response.status_code == 200 else None
+    return _loads(response) if response.status_code == 200 else None
 
 
-def test_feedback(query, selected, user_id="test_user"):
+async def test_feedback(client, query, selected, user_id="test_user"):
     """Test feedback endpoint"""
-    print(f"\n=== Testing Feedback ===")
-
     payload = {"query": query, "selected_suggestion": selected, "user_id": user_id}
 
-    response = requests.post(f"{BASE_URL}/api/v1/feedback", json=payload)
+    response = await client.post("/api/v1/feedback", content=_encode(payload), headers=JSON_HEADERS)
 
+    print("\n=== Testing Feedback ===")
     print(f"Status Code: {response.status_code}")
-    print(f"Response: {json.dumps(response.json(), indent=2, ensure_ascii=False)}")
+    print(f"Response: {_dump(_loads(response))}")
 
 
-def test_add_document():
+async def test_add_document(client):
     """Test adding a document"""
-    print("\n=== Testing Add Document ===")
-
     payload = {
         "text": "测试自动补全功能",
         "keywords": ["test", "autocomplete", "测试"],
         "metadata": {"category": "test"},
     }
 
-    response = requests.post(f"{BASE_URL}/api/v1/documents", json=payload)
+    response = await client.post("/api/v1/documents", content=_encode(payload), headers=JSON_HEADERS)
 
+    print("\n=== Testing Add Document ===")
     print(f"Status Code: {response.status_code}")
-    print(f"Response: {json.dumps(response.json(), indent=2, ensure_ascii=False)}")
-
-
-def run_comprehensive_test():
+    print(f"Response: {_dump(_loads(response))}")
+
+
+async def _wait_for_doc(client, query, timeout=5.0, interval=0.2):
+    """Poll autocomplete until a suggestion for the query appears or the timeout expires"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        response = await client.post(
+            "/api/v1/autocomplete",
+            content=_encode({"query": query, "limit": 5}),
+            headers=JSON_HEADERS,
+        )
+        if response.status_code == 200 and any(
+            query in s["text"] for s in _loads(response)["suggestions"]
+        ):
+            return True
+        await asyncio.sleep(interval)
+    return False
+
+
+async def run_comprehensive_test():
     """Run comprehensive test suite"""
     print("=" * 60)
     print("ChatBI Autocomplete Service - Test Suite")
     print("=" * 60)
 
-    # Test 1: Health check
-    if not test_health():
-        print("\n❌ Health check failed. Is the service running?")
-        return
-
-    print("\n✓ Service is healthy")
-
-    # Wait a bit for service to be ready
-    time.sleep(1)
-
-    # Test 2: Chinese query
-    result = test_autocomplete("销售")
-
-    # Test 3: English query
-    test_autocomplete("sales")
+    limits = httpx.Limits(max_connections=16)
+    async with httpx.AsyncClient(base_url=BASE_URL, limits=limits, timeout=30) as client:
+        # Test 1: Health check
+        if not await test_health(client):
+            print("\n❌ Health check failed. Is the service running?")
+            return
+
+        print("\n✓ Service is healthy")
+
+        # Tests 2-5 and 8: independent queries (Chinese, English, mixed, partial
+        # match) and document insertion run concurrently
+        result, *_ = await asyncio.gather(
+            test_autocomplete(client, "销售"),
+            test_autocomplete(client, "sales"),
+            test_autocomplete(client, "销售trend"),
+            test_autocomplete(client, "用户"),
+            test_add_document(client),
+        )
+
+        # Test 6: Feedback (if we got results)
+        if result and result["suggestions"]:
+            first_suggestion = result["suggestions"][0]["text"]
+            await test_feedback(client, "销售", first_suggestion, "test_user_001")
+
+        # Test 7: Personalized query (same query as before)
+        print("\n--- Testing Personalization (should boost previous selection) ---")
+        await test_autocomplete(client, "销售", user_id="test_user_001")
+
+        # Test 9: Query for newly added document once it is searchable
+        if not await _wait_for_doc(client, "测试"):
+            print("\n⚠ Added document not searchable yet")
+        await test_autocomplete(client, "测试")
 
-    # Test 4: Mixed query
-    test_autocomplete("销售trend")
-
-    # Test 5: Partial match
-    test_autocomplete("用户")
-
-    # Test 6: Feedback (if we got results)
-    if result and result["suggestions"]:
-        first_suggestion = result["suggestions"][0]["text"]
-        test_feedback("销售", first_suggestion, "test_user_001")
+    print("\n" + "=" * 60)
+    print("Test Suite Complete!")
+    print("=" * 60)
 
-    # Test 7: Personalized query (same query as before)
-    print("\n--- Testing Personalization (should boost previous selection) ---")
-    test_autocomplete("销售", user_id="test_user_001")
 
-    # Test 8: Add document
-    test_add_document()
+def run_smoke_test():
+    """Run a minimal sequential check with requests when httpx is unavailable"""
+    print("=" * 60)
+    print("ChatBI Autocomplete Service - Smoke Test")
+    print("=" * 60)
 
-    # Wait for indexing
-    time.sleep(1)
+    session = requests.Session()
+    session.headers.update(JSON_HEADERS)
 
-    # Test 9: Query for newly added document
-    test_autocomplete("测试")
+    response = session.get(f"{BASE_URL}/api/v1/health")
+    print(f"\nHealth: {response.status_code} {_dump(_loads(response))}")
+    if response.status_code != 200:
+        print("\n❌ Health check failed. Is the service running?")
+        return
 
-    print("\n" + "=" * 60)
-    print("Test Suite Complete!")
-    print("=" * 60)
+    response = session.post(
+        f"{BASE_URL}/api/v1/autocomplete", data=_encode({"query": "销售", "limit": 5})
+    )
+    print(f"\nAutocomplete '销售': {response.status_code}")
+    if response.status_code == 200:
+        for i, suggestion in enumerate(_loads(response)["suggestions"], 1):
+            print(f"  {i}. {suggestion['text']}")
 
 
 if __name__ == "__main__":
     try:
-        run_comprehensive_test()
-    except requests.exceptions.ConnectionError:
+        if httpx is None:
+            print("httpx not installed - running requests-based smoke test")
+            run_smoke_test()
+        else:
+            asyncio.run(run_comprehensive_test())
+    except CONNECTION_ERRORS:
         print("\n❌ Could not connect to service at", BASE_URL)
         print("Please ensure the service is running:")
         print("  python app/main.py")
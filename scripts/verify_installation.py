@@ -1,11 +1,74 @@
 """Verification script to check if the installation is correct"""
 
+import importlib
+import multiprocessing
 import os
 import sys
+from pathlib import Path
 
 # Add parent directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
+_BASE = Path(__file__).resolve().parent.parent
+_SKIP_DIRS = frozenset(
+    {
+        ".git",
+        ".cache",
+        "__pycache__",
+        "node_modules",
+        "venv",
+        ".venv",
+        "htmlcov",
+        ".pytest_cache",
+        ".mypy_cache",
+    }
+)
+
+# Repository-relative paths, with forward slashes, that a correct checkout must contain
+_REQUIRED_FILES = frozenset(
+    {
+        "app/__init__.py",
+        "app/main.py",
+        "app/api/__init__.py",
+        "app/api/routes.py",
+        "app/models/__init__.py",
+        "app/models/schemas.py",
+        "app/services/__init__.py",
+        "app/services/autocomplete_service.py",
+        "app/services/opensearch_service.py",
+        "app/services/vector_service.py",
+        "app/services/personalization_service.py",
+        "app/utils/__init__.py",
+        "app/utils/config.py",
+        "config.yaml",
+        "requirements.txt",
+        "README.md",
+        ".gitignore",
+        "docker-compose.yml",
+        "scripts/init_data.py",
+        "scripts/test_api.py",
+        "examples/client_example.py",
+    }
+)
+
+# Top-level directories holding required files; nothing else is walked
+_REQUIRED_DIRS = frozenset(path.split("/", 1)[0] for path in _REQUIRED_FILES if "/" in path)
+
+
+def _probe(*modules):
+    """Import modules and report success; run inside a child process"""
+    for module in modules:
+        importlib.import_module(module)
+    return True
+
+
+def _probe_in_child(*modules):
+    """Import modules in a forked child so heavy dependencies never load in this process"""
+    if "fork" not in multiprocessing.get_all_start_methods():
+        return _probe(*modules)
+    with multiprocessing.get_context("fork").Pool(1, maxtasksperchild=1) as pool:
+        return pool.apply(_probe, modules)
+
 
 def verify_imports():
     """Verify all imports work"""
@@ -28,20 +91,22 @@ def verify_imports():
         print("✓ Config imported successfully")
 
         # Test services (without initializing connections)
-        from app.services.autocomplete_service import AutocompleteService
-        from app.services.opensearch_service import OpenSearchService
-        from app.services.personalization_service import PersonalizationService
-        from app.services.vector_service import VectorService
+        _probe_in_child(
+            "app.services.autocomplete_service",
+            "app.services.opensearch_service",
+            "app.services.personalization_service",
+            "app.services.vector_service",
+        )
 
         print("✓ Services imported successfully")
 
         # Test API
-        from app.api.routes import router
+        _probe_in_child("app.api.routes")
 
         print("✓ API routes imported successfully")
 
         # Test main
-        from app.main import app
+        _probe_in_child("app.main")
 
         print("✓ FastAPI app imported successfully")
 
@@ -109,42 +174,28 @@ def verify_file_structure():
     """Verify file structure"""
     print("\nVerifying file structure...")
 
-    required_files = [
-        "app/__init__.py",
-        "app/main.py",
-        "app/api/__init__.py",
-        "app/api/routes.py",
-        "app/models/__init__.py",
-        "app/models/schemas.py",
-        "app/services/__init__.py",
-        "app/services/autocomplete_service.py",
-        "app/services/opensearch_service.py",
-        "app/services/vector_service.py",
-        "app/services/personalization_service.py",
-        "app/utils/__init__.py",
-        "app/utils/config.py",
-        "config.yaml",
-        "requirements.txt",
-        "README.md",
-        ".gitignore",
-        "docker-compose.yml",
-        "scripts/init_data.py",
-        "scripts/test_api.py",
-        "examples/client_example.py",
-    ]
-
-    base_path = os.path.join(os.path.dirname(__file__), "..")
 
-    all_exist = True
-    for file_path in required_files:
-        full_path = os.path.join(base_path, file_path)
-        if os.path.exists(full_path):
-            print(f"✓ {file_path}")
+    # Collect every file in one walk instead of stat-ing each required path,
+    # descending only into the top-level directories that hold required files
+    present = set()
+    for root, dirs, files in os.walk(_BASE):
+        rel_root = os.path.relpath(root, _BASE)
+        if rel_root == ".":
+            dirs[:] = [d for d in dirs if d in _REQUIRED_DIRS]
         else:
+            dirs[:] = [d for d in dirs if d not in _SKIP_DIRS]
+        for name in files:
+            rel_path = name if rel_root == "." else os.path.join(rel_root, name)
+            present.add(rel_path.replace(os.sep, "/"))
+
+    missing = _REQUIRED_FILES - present
+    for file_path in sorted(_REQUIRED_FILES):
+        if file_path in missing:
             print(f"✗ {file_path} - NOT FOUND")
-            all_exist = False
+        else:
+            print(f"✓ {file_path}")
 
-    return all_exist
+    return not missing
 
 
 def main():
@@ -8,11 +8,21 @@ and can be enabled/disabled without breaking the system.
 
 import sys
 import os
+import py_compile
+from importlib.util import cache_from_source
 
 # Add parent directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 
+def check_syntax(path):
+    """Compile a file to its __pycache__ bytecode, skipping files whose .pyc is current"""
+    cfile = cache_from_source(path)
+    if os.path.exists(cfile) and os.path.getmtime(cfile) >= os.path.getmtime(path):
+        return
+    py_compile.compile(path, doraise=True)
+
+
 def check_imports():
     """Verify all imports work correctly"""
     print("=" * 80)
@@ -76,11 +86,12 @@ def check_llm_service():
         ("Numbered", "1. Query 1\n2. Query 2\n3. Query 3", 3),
         ("Bullets", "- Query 1\n- Query 2\n- Query 3", 3),
         ("Comma separated", "Query 1, Query 2, Query 3", 3),
+        ("Duplicates", "Query 1\nQuery 2\nQuery 1", 2),
     ]
     
     for name, input_text, expected_count in test_cases:
-        parsed = llm._parse_llm_response(input_text)
-        if len(parsed) == expected_count:
+        parsed = list(llm._parse_llm_response(input_text))
+        if len(parsed) == expected_count and parsed == list(dict.fromkeys(parsed)):
             print(f"✓ Response parsing works for {name}")
         else:
             print(f"✗ Response parsing failed for {name}: got {len(parsed)}, expected {expected_count}")
@@ -120,8 +131,9 @@ def check_configuration():
     
     try:
         import yaml
-        with open('config.yaml', 'r') as f:
-            config = yaml.safe_load(f)
+        from app.utils.config import YamlLoader
+        with open('config.yaml', 'rb') as f:
+            config = yaml.load(f, Loader=YamlLoader)
         
         if 'llm' in config:
             print("✓ LLM configuration section exists")
@@ -240,10 +252,9 @@ def check_examples():
             
             # Try to parse it
             try:
-                with open(example, 'r') as f:
-                    compile(f.read(), example, 'exec')
+                check_syntax(example)
                 print(f"✓ Example has valid Python syntax: {example}")
-            except SyntaxError as e:
+            except py_compile.PyCompileError as e:
                 print(f"✗ Example has syntax error: {example}: {e}")
                 return False
         else:
@@ -270,10 +281,9 @@ def check_tests():
             
             # Try to parse it
             try:
-                with open(test_file, 'r') as f:
-                    compile(f.read(), test_file, 'exec')
+                check_syntax(test_file)
                 print(f"✓ Test file has valid Python syntax: {test_file}")
-            except SyntaxError as e:
+            except py_compile.PyCompileError as e:
                 print(f"✗ Test file has syntax error: {test_file}: {e}")
                 return False
         else:
@@ -1,8 +1,55 @@
 """Pytest configuration and shared fixtures"""
 
+import numpy as np
 import pytest
+from sqlalchemy import event
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel, create_engine
 from unittest.mock import Mock, AsyncMock
 
+# Shared embedding returned by mock_vector_service, allocated once at import
+_EMBEDDING = np.full((1, 384), 0.1, dtype=np.float32)
+_EMBEDDING.flags.writeable = False  # shared between tests, so guard against mutation
+
+
+# Test databases are throwaway, so trade durability for speed on every connection
+_TEST_SQLITE_PRAGMAS = (
+    "PRAGMA synchronous=OFF",
+    "PRAGMA journal_mode=MEMORY",
+    "PRAGMA locking_mode=EXCLUSIVE",
+    "PRAGMA temp_store=MEMORY",
+)
+
+
+def _apply_test_sqlite_pragmas(dbapi_connection, connection_record):
+    """Connect hook that applies _TEST_SQLITE_PRAGMAS"""
+    cursor = dbapi_connection.cursor()
+    for pragma in _TEST_SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
+@pytest.fixture(scope="session")
+def sqlite_engine_factory():
+    """Build in-memory SQLite engines with all tables, disposed at the end of the session"""
+    engines = []
+
+    def make_engine(url="sqlite:///:memory:"):
+        # StaticPool keeps the in-memory database behind one shared connection
+        engine = create_engine(
+            url,
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+        event.listen(engine, "connect", _apply_test_sqlite_pragmas)
+        SQLModel.metadata.create_all(engine)
+        engines.append(engine)
+        return engine
+
+    yield make_engine
+    for engine in engines:
+        engine.dispose()
+
 
 @pytest.fixture
 def mock_opensearch_client():
@@ -36,7 +83,7 @@ def mock_redis_client():
 def mock_vector_service():
     """Mock Vector Service"""
     service = Mock()
-    service.encode = Mock(return_value=[[0.1] * 384])
+    service.encode = Mock(return_value=_EMBEDDING)
     return service
 
 
@@ -0,0 +1,82 @@
+"""Shared fixtures for integration tests"""
+
+import asyncio
+
+import httpx
+import pytest
+from unittest.mock import Mock
+
+
+# Default service results, sliced to the requested limit by the mock
+_DEFAULT_SIMILAR = (
+    {
+        "text": "销售数据分析",
+        "score": 0.92,
+        "source": "vector",
+        "metadata": {"keywords": ["sales", "data"], "doc_id": "doc1"}
+    },
+    {
+        "text": "销售趋势报告",
+        "score": 0.88,
+        "source": "vector",
+        "metadata": {"keywords": ["sales", "trend"], "doc_id": "doc2"}
+    },
+)
+
+_DEFAULT_RELATED = (
+    {
+        "text": "市场分析",
+        "score": 0.85,
+        "source": "hybrid",
+        "metadata": {"keywords": ["market"], "doc_id": "doc3"}
+    },
+    {
+        "text": "业绩统计",
+        "score": 0.80,
+        "source": "history",
+        "metadata": {"from_user_history": True}
+    },
+)
+
+
+def _seed_mock_autocomplete_service(service):
+    """Install the default side effects on the mocked AutocompleteService"""
+    service.get_similar_queries.side_effect = (
+        lambda **kwargs: list(_DEFAULT_SIMILAR[: kwargs.get("limit", 10)])
+    )
+    service.get_related_queries.side_effect = (
+        lambda **kwargs: list(_DEFAULT_RELATED[: kwargs.get("limit", 10)])
+    )
+
+
+@pytest.fixture(scope="session")
+def mock_autocomplete_service():
+    """Mock AutocompleteService for testing"""
+    service = Mock()
+    _seed_mock_autocomplete_service(service)
+    return service
+
+
+@pytest.fixture(autouse=True)
+def _reset_mock(mock_autocomplete_service):
+    """Undo per-test side effect overrides on the shared mock"""
+    yield
+    mock_autocomplete_service.reset_mock(return_value=True, side_effect=True)
+    _seed_mock_autocomplete_service(mock_autocomplete_service)
+
+
+@pytest.fixture(scope="session")
+def test_client(mock_autocomplete_service):
+    """Create an async HTTP client that calls the app in-process, shared by the whole session"""
+    from app.api.routes import router, set_autocomplete_service
+    from fastapi import FastAPI
+    
+    app = FastAPI()
+    app.include_router(router, prefix="/api/v1")
+    
+    set_autocomplete_service(mock_autocomplete_service)
+    
+    # ASGITransport holds no event-loop resources, so one client serves every test's loop
+    client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+    yield client
+    asyncio.run(client.aclose())
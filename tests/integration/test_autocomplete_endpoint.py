@@ -0,0 +1,28 @@
+"""Integration tests for the autocomplete endpoint"""
+import pytest
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("query", ["", "   "], ids=["empty", "whitespace"])
+async def test_autocomplete_blank_query(test_client, mock_autocomplete_service, query):
+    """Test blank queries return no suggestions without calling the service"""
+    response = await test_client.post("/api/v1/autocomplete", json={"query": query})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["suggestions"] == []
+    assert data["total"] == 0
+    mock_autocomplete_service.get_suggestions.assert_not_called()
+
+
+@pytest.mark.integration
+async def test_autocomplete_query_calls_service(test_client, mock_autocomplete_service):
+    """Test a non-blank query is passed to the service"""
+    mock_autocomplete_service.get_suggestions.return_value = []
+
+    response = await test_client.post("/api/v1/autocomplete", json={"query": "销售", "limit": 5})
+
+    assert response.status_code == 200
+    mock_autocomplete_service.get_suggestions.assert_called_once_with(
+        query="销售", user_id=None, limit=5
+    )
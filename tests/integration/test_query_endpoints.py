@@ -1,90 +1,58 @@
 """Integration tests for query endpoints (similar and related queries)"""
 import pytest
 from unittest.mock import Mock, patch, MagicMock
-from fastapi.testclient import TestClient
 
 
-@pytest.fixture
-def mock_autocomplete_service():
-    """Mock AutocompleteService for testing"""
-    service = Mock()
-    
-    # Mock get_similar_queries
-    service.get_similar_queries.return_value = [
-        {
-            "text": "销售数据分析",
-            "score": 0.92,
-            "source": "vector",
-            "metadata": {"keywords": ["sales", "data"], "doc_id": "doc1"}
-        },
-        {
-            "text": "销售趋势报告",
-            "score": 0.88,
-            "source": "vector",
-            "metadata": {"keywords": ["sales", "trend"], "doc_id": "doc2"}
-        }
-    ]
-    
-    # Mock get_related_queries
-    service.get_related_queries.return_value = [
-        {
-            "text": "市场分析",
-            "score": 0.85,
-            "source": "hybrid",
-            "metadata": {"keywords": ["market"], "doc_id": "doc3"}
-        },
-        {
-            "text": "业绩统计",
-            "score": 0.80,
-            "source": "history",
-            "metadata": {"from_user_history": True}
-        }
-    ]
-    
-    return service
-
-
-@pytest.fixture
-def test_client(mock_autocomplete_service):
-    """Create test client with mocked service"""
-    from app.api.routes import router, set_autocomplete_service
-    from fastapi import FastAPI
-    
-    app = FastAPI()
-    app.include_router(router, prefix="/api/v1")
-    
-    set_autocomplete_service(mock_autocomplete_service)
-    
-    return TestClient(app)
+# (endpoint path, response field, AutocompleteService method) for each query endpoint
+QUERY_ENDPOINTS = [
+    pytest.param("/api/v1/similar-queries", "similar_queries", "get_similar_queries", id="similar"),
+    pytest.param("/api/v1/related-queries", "related_queries", "get_related_queries", id="related"),
+]
 
 
 @pytest.mark.integration
-def test_similar_queries_endpoint(test_client):
-    """Test similar queries endpoint returns correct response"""
-    response = test_client.post(
-        "/api/v1/similar-queries",
-        json={"query": "销售分析", "user_id": "user123", "limit": 5}
-    )
+@pytest.mark.parametrize(
+    "endpoint,key,payload,expected_first",
+    [
+        pytest.param(
+            "/api/v1/similar-queries",
+            "similar_queries",
+            {"query": "销售分析", "user_id": "user123", "limit": 5},
+            {"text": "销售数据分析", "score": 0.92, "source": "vector"},
+            id="similar",
+        ),
+        pytest.param(
+            "/api/v1/related-queries",
+            "related_queries",
+            {"query": "销售报告", "user_id": "user456", "limit": 10},
+            {"text": "市场分析", "score": 0.85, "source": "hybrid"},
+            id="related",
+        ),
+    ],
+)
+async def test_query_endpoint(test_client, endpoint, key, payload, expected_first):
+    """Test query endpoints return correct response"""
+    response = await test_client.post(endpoint, json=payload)
     
     assert response.status_code == 200
     data = response.json()
     
-    assert data["query"] == "销售分析"
-    assert "similar_queries" in data
-    assert len(data["similar_queries"]) == 2
+    assert data["query"] == payload["query"]
+    assert key in data
+    assert len(data[key]) == 2
     assert data["total"] == 2
     
     # Check first result
-    first_query = data["similar_queries"][0]
-    assert first_query["text"] == "销售数据分析"
-    assert first_query["score"] == 0.92
-    assert first_query["source"] == "vector"
+    first_query = data[key][0]
+    assert first_query["text"] == expected_first["text"]
+    assert first_query["score"] == expected_first["score"]
+    assert first_query["source"] == expected_first["source"]
 
 
 @pytest.mark.integration
-def test_similar_queries_without_user_id(test_client):
+async def test_similar_queries_without_user_id(test_client):
     """Test similar queries endpoint works without user_id"""
-    response = test_client.post(
+    response = await test_client.post(
         "/api/v1/similar-queries",
         json={"query": "销售分析"}
     )
@@ -97,32 +65,9 @@ def test_similar_queries_without_user_id(test_client):
 
 
 @pytest.mark.integration
-def test_related_queries_endpoint(test_client):
-    """Test related queries endpoint returns correct response"""
-    response = test_client.post(
-        "/api/v1/related-queries",
-        json={"query": "销售报告", "user_id": "user456", "limit": 10}
-    )
-    
-    assert response.status_code == 200
-    data = response.json()
-    
-    assert data["query"] == "销售报告"
-    assert "related_queries" in data
-    assert len(data["related_queries"]) == 2
-    assert data["total"] == 2
-    
-    # Check first result
-    first_query = data["related_queries"][0]
-    assert first_query["text"] == "市场分析"
-    assert first_query["score"] == 0.85
-    assert first_query["source"] == "hybrid"
-
-
-@pytest.mark.integration
-def test_related_queries_with_history(test_client):
+async def test_related_queries_with_history(test_client):
     """Test related queries includes history-based results"""
-    response = test_client.post(
+    response = await test_client.post(
         "/api/v1/related-queries",
         json={"query": "销售报告", "user_id": "user456"}
     )
@@ -136,90 +81,39 @@ def test_related_queries_with_history(test_client):
 
 
 @pytest.mark.integration
-def test_similar_queries_empty_query(test_client, mock_autocomplete_service):
-    """Test similar queries with empty query returns empty results"""
-    mock_autocomplete_service.get_similar_queries.return_value = []
+@pytest.mark.parametrize("endpoint,key,method", QUERY_ENDPOINTS)
+async def test_query_endpoint_empty_query(test_client, mock_autocomplete_service, endpoint, key, method):
+    """Test query endpoints with empty query return empty results"""
+    getattr(mock_autocomplete_service, method).side_effect = lambda **kwargs: []
     
-    response = test_client.post(
-        "/api/v1/similar-queries",
-        json={"query": ""}
-    )
+    response = await test_client.post(endpoint, json={"query": ""})
     
     assert response.status_code == 200
     data = response.json()
-    assert len(data["similar_queries"]) == 0
+    assert len(data[key]) == 0
     assert data["total"] == 0
 
 
 @pytest.mark.integration
-def test_related_queries_empty_query(test_client, mock_autocomplete_service):
-    """Test related queries with empty query returns empty results"""
-    mock_autocomplete_service.get_related_queries.return_value = []
-    
-    response = test_client.post(
-        "/api/v1/related-queries",
-        json={"query": ""}
-    )
-    
-    assert response.status_code == 200
-    data = response.json()
-    assert len(data["related_queries"]) == 0
-    assert data["total"] == 0
-
-
-@pytest.mark.integration
-def test_similar_queries_limit_parameter(test_client, mock_autocomplete_service):
-    """Test similar queries respects limit parameter"""
-    response = test_client.post(
-        "/api/v1/similar-queries",
-        json={"query": "test", "limit": 1}
-    )
-    
-    assert response.status_code == 200
-    # Verify limit was passed to service
-    mock_autocomplete_service.get_similar_queries.assert_called_once()
-    call_kwargs = mock_autocomplete_service.get_similar_queries.call_args.kwargs
-    assert call_kwargs["limit"] == 1
-
-
-@pytest.mark.integration
-def test_related_queries_limit_parameter(test_client, mock_autocomplete_service):
-    """Test related queries respects limit parameter"""
-    response = test_client.post(
-        "/api/v1/related-queries",
-        json={"query": "test", "limit": 3}
-    )
+@pytest.mark.parametrize("endpoint,key,method", QUERY_ENDPOINTS)
+async def test_query_endpoint_limit_parameter(test_client, mock_autocomplete_service, endpoint, key, method):
+    """Test query endpoints pass the limit parameter to the service"""
+    response = await test_client.post(endpoint, json={"query": "test", "limit": 3})
     
     assert response.status_code == 200
     # Verify limit was passed to service
-    mock_autocomplete_service.get_related_queries.assert_called_once()
-    call_kwargs = mock_autocomplete_service.get_related_queries.call_args.kwargs
-    assert call_kwargs["limit"] == 3
-
-
-@pytest.mark.integration
-def test_similar_queries_error_handling(test_client, mock_autocomplete_service):
-    """Test similar queries endpoint handles service errors"""
-    mock_autocomplete_service.get_similar_queries.side_effect = Exception("Service error")
-    
-    response = test_client.post(
-        "/api/v1/similar-queries",
-        json={"query": "test"}
-    )
-    
-    assert response.status_code == 500
-    assert "detail" in response.json()
+    service_method = getattr(mock_autocomplete_service, method)
+    service_method.assert_called_once()
+    assert service_method.call_args.kwargs["limit"] == 3
 
 
 @pytest.mark.integration
-def test_related_queries_error_handling(test_client, mock_autocomplete_service):
-    """Test related queries endpoint handles service errors"""
-    mock_autocomplete_service.get_related_queries.side_effect = Exception("Service error")
+@pytest.mark.parametrize("endpoint,key,method", QUERY_ENDPOINTS)
+async def test_query_endpoint_error_handling(test_client, mock_autocomplete_service, endpoint, key, method):
+    """Test query endpoints handle service errors"""
+    getattr(mock_autocomplete_service, method).side_effect = Exception("Service error")
     
-    response = test_client.post(
-        "/api/v1/related-queries",
-        json={"query": "test"}
-    )
+    response = await test_client.post(endpoint, json={"query": "test"})
     
     assert response.status_code == 500
     assert "detail" in response.json()
@@ -4,17 +4,21 @@ import pytest
 from app.utils.config import Config
 
 
+@pytest.fixture(scope="session")
+def config():
+    """Build the configuration once for all tests"""
+    return Config()
+
+
 @pytest.mark.unit
-def test_config_loads_successfully():
+def test_config_loads_successfully(config):
     """Test that configuration loads without errors"""
-    config = Config()
     assert config is not None
 
 
 @pytest.mark.unit
-def test_config_has_required_sections():
+def test_config_has_required_sections(config):
     """Test that configuration has all required sections"""
-    config = Config()
     assert hasattr(config, "opensearch")
     assert hasattr(config, "redis")
     assert hasattr(config, "autocomplete")
@@ -22,18 +26,16 @@ def test_config_has_required_sections():
 
 
 @pytest.mark.unit
-def test_opensearch_config_has_defaults():
+def test_opensearch_config_has_defaults(config):
     """Test OpenSearch configuration defaults"""
-    config = Config()
     assert config.opensearch.get("host") is not None
     assert config.opensearch.get("port") is not None
     assert config.opensearch.get("index_name") is not None
 
 
 @pytest.mark.unit
-def test_autocomplete_weights_are_valid():
+def test_autocomplete_weights_are_valid(config):
     """Test that autocomplete weights are within valid range"""
-    config = Config()
     keyword_weight = config.autocomplete.get("keyword_weight", 0.7)
     vector_weight = config.autocomplete.get("vector_weight", 0.3)
 
@@ -1,9 +1,20 @@
 """Unit tests for dimension mapping service"""
 
+import os
+from dataclasses import dataclass
+from typing import Dict, Tuple
+from unittest.mock import patch
+
 import pytest
-from sqlmodel import Session, create_engine, SQLModel
+from pydantic import TypeAdapter
+from sqlmodel import Session
 
-from app.services.dimension_mapping_service import DimensionMappingService
+from app.services.dimension_mapping_service import (
+    DimensionMappingService,
+    _bounded_levenshtein,
+    _levenshtein_batch
+)
+from app.models.metadata_schemas import ColumnMappingSuggestion
 from app.models.metadata import (
     MetaDimension,
     MetaTableColumn,
@@ -13,182 +24,215 @@ from app.models.metadata import (
 )
 
 
+# Validates the full suggest_dimension_mappings result in one call
+_SUGGESTIONS_ADAPTER = TypeAdapter(Dict[int, ColumnMappingSuggestion])
+
+
+@dataclass(frozen=True)
+class SeedIds:
+    """Primary keys of the rows inserted by setup_test_data"""
+    table_id: int
+    dimension_ids: Tuple[int, ...]
+    column_ids: Tuple[int, ...]
+
+
+@pytest.fixture(scope="session")
+def _engine(sqlite_engine_factory):
+    """Create the in-memory database and its tables once per test session
+    
+    The named shared-cache database is visible to every connection in the
+    process, and each pytest-xdist worker gets its own name so seed data is
+    built once per worker.
+    """
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER", "master")
+    return sqlite_engine_factory(
+        f"sqlite:///file:test-{worker_id}?mode=memory&cache=shared&uri=true"
+    )
+
+
 @pytest.fixture
-def session():
-    """Create an in-memory database session for testing"""
-    engine = create_engine("sqlite:///:memory:")
-    SQLModel.metadata.create_all(engine)
+def session(_engine):
+    """Create a database session whose changes are rolled back after each test"""
+    connection = _engine.connect()
+    transaction = connection.begin()
+    # Commits inside the test stay within the outer transaction rolled back below
+    session = Session(bind=connection)
+    
+    yield session
     
-    with Session(engine) as session:
-        yield session
+    session.close()
+    transaction.rollback()
+    connection.close()
 
 
 @pytest.fixture
-def setup_test_data(session):
-    """Setup test dimensions and table columns"""
-    # Create test database
-    db = MetaDatabase(
-        name="test_db",
-        db_type="postgresql",
-        created_by="test",
-        updated_by="test"
-    )
-    session.add(db)
-    session.commit()
-    session.refresh(db)
-    
-    # Create test domain
-    domain = MetaDomain(
-        name="test_domain",
-        created_by="test",
-        updated_by="test"
-    )
-    session.add(domain)
-    session.commit()
-    session.refresh(domain)
-    
-    # Create test table
-    table = MetaTable(
-        name="test_table",
-        full_name="test_db.public.test_table",
-        verbose_name="测试表",
-        database_id=db.id,
-        domain_id=domain.id,
-        created_by="test",
-        updated_by="test"
-    )
-    session.add(table)
-    session.commit()
-    session.refresh(table)
-    
-    # Create test dimensions
-    dimensions = [
-        MetaDimension(
-            name="user_id",
-            verbose_name="用户ID",
-            semantic_type="ID",
-            alias="uid,userId",
-            status=1,
-            created_by="test",
-            updated_by="test"
-        ),
-        MetaDimension(
-            name="category",
-            verbose_name="类别",
-            semantic_type="CATEGORY",
-            alias="cat,type",
-            status=1,
-            created_by="test",
-            updated_by="test"
-        ),
-        MetaDimension(
-            name="business_category",
-            verbose_name="业务类别",
-            semantic_type="CATEGORY",
-            alias="biz_category,biz_cat",
-            status=1,
-            created_by="test",
-            updated_by="test"
-        ),
-        MetaDimension(
-            name="created_date",
-            verbose_name="创建日期",
-            semantic_type="DATE",
-            status=1,
-            created_by="test",
-            updated_by="test"
-        ),
-    ]
-    
-    for dim in dimensions:
-        session.add(dim)
-    session.commit()
-    
-    for dim in dimensions:
-        session.refresh(dim)
-    
-    # Create test columns
-    columns = [
-        MetaTableColumn(
-            field_name="user_id",
-            data_type="bigint",
-            logical_type="bigint",
-            table_id=table.id,
-            status=1,
-            created_by="test",
-            updated_by="test"
-        ),
-        MetaTableColumn(
-            field_name="userId",
-            data_type="varchar",
-            logical_type="varchar",
-            table_id=table.id,
-            status=1,
+def service(session):
+    """Create a dimension mapping service bound to the test session"""
+    return DimensionMappingService(session)
+
+
+@pytest.fixture(scope="module")
+def scorer():
+    """Share one service without a session across the tests of pure scoring helpers"""
+    return DimensionMappingService(None)
+
+
+@pytest.fixture(scope="session")
+def setup_test_data(_engine):
+    """Setup test dimensions and table columns once for the whole session"""
+    with Session(_engine) as session:
+        # Create test database
+        db = MetaDatabase(
+            name="test_db",
+            db_type="postgresql",
             created_by="test",
             updated_by="test"
-        ),
-        MetaTableColumn(
-            field_name="biz_category",
-            data_type="varchar",
-            logical_type="varchar",
-            table_id=table.id,
-            status=1,
+        )
+    
+        # Create test domain
+        domain = MetaDomain(
+            name="test_domain",
             created_by="test",
             updated_by="test"
-        ),
-        MetaTableColumn(
-            field_name="categry",  # Typo - fuzzy match
-            data_type="varchar",
-            logical_type="varchar",
-            table_id=table.id,
-            status=1,
+        )
+        # Flush parents to get the IDs the table references
+        session.add_all([db, domain])
+        session.flush()
+    
+        # Create test table
+        table = MetaTable(
+            name="test_table",
+            full_name="test_db.public.test_table",
+            verbose_name="测试表",
+            database_id=db.id,
+            domain_id=domain.id,
             created_by="test",
             updated_by="test"
-        ),
-        MetaTableColumn(
-            field_name="create_date",
-            data_type="date",
-            logical_type="date",
+        )
+        session.add(table)
+        session.flush()
+    
+        # Create test dimensions
+        dimensions = [
+            MetaDimension(
+                name="user_id",
+                verbose_name="用户ID",
+                semantic_type="ID",
+                alias="uid,userId",
+                status=1,
+                created_by="test",
+                updated_by="test"
+            ),
+            MetaDimension(
+                name="category",
+                verbose_name="类别",
+                semantic_type="CATEGORY",
+                alias="cat,type",
+                status=1,
+                created_by="test",
+                updated_by="test"
+            ),
+            MetaDimension(
+                name="business_category",
+                verbose_name="业务类别",
+                semantic_type="CATEGORY",
+                alias="biz_category,biz_cat",
+                status=1,
+                created_by="test",
+                updated_by="test"
+            ),
+            MetaDimension(
+                name="created_date",
+                verbose_name="创建日期",
+                semantic_type="DATE",
+                status=1,
+                created_by="test",
+                updated_by="test"
+            ),
+        ]
+    
+    
+        # Create test columns
+        columns = [
+            MetaTableColumn(
+                field_name="user_id",
+                data_type="bigint",
+                logical_type="bigint",
+                table_id=table.id,
+                status=1,
+                created_by="test",
+                updated_by="test"
+            ),
+            MetaTableColumn(
+                field_name="userId",
+                data_type="varchar",
+                logical_type="varchar",
+                table_id=table.id,
+                status=1,
+                created_by="test",
+                updated_by="test"
+            ),
+            MetaTableColumn(
+                field_name="biz_category",
+                data_type="varchar",
+                logical_type="varchar",
+                table_id=table.id,
+                status=1,
+                created_by="test",
+                updated_by="test"
+            ),
+            MetaTableColumn(
+                field_name="categry",  # Typo - fuzzy match
+                data_type="varchar",
+                logical_type="varchar",
+                table_id=table.id,
+                status=1,
+                created_by="test",
+                updated_by="test"
+            ),
+            MetaTableColumn(
+                field_name="create_date",
+                data_type="date",
+                logical_type="date",
+                table_id=table.id,
+                status=1,
+                created_by="test",
+                updated_by="test"
+            ),
+        ]
+    
+        # Insert dimensions and columns together in a single commit
+        session.add_all(dimensions + columns)
+        session.flush()
+    
+        # Read the IDs populated by the flush before commit() expires every
+        # object, which would otherwise cost one SELECT per row to reload
+        ids = SeedIds(
             table_id=table.id,
-            status=1,
-            created_by="test",
-            updated_by="test"
-        ),
-    ]
-    
-    for col in columns:
-        session.add(col)
-    session.commit()
-    
-    for col in columns:
-        session.refresh(col)
-    
-    return {
-        'table': table,
-        'dimensions': dimensions,
-        'columns': columns,
-        'db': db,
-        'domain': domain
-    }
+            dimension_ids=tuple(dim.id for dim in dimensions),
+            column_ids=tuple(col.id for col in columns),
+        )
+        session.commit()
+        
+        # Return plain IDs so tests re-fetch rows inside their own rolled-back session
+        session.expunge_all()
+        return ids
 
 
 @pytest.mark.unit
-def test_normalize_name(session):
+def test_normalize_name(scorer):
     """Test name normalization"""
-    service = DimensionMappingService(session)
-    
-    assert service._normalize_name("user_id") == "user_id"
-    assert service._normalize_name("userId") == "user_id"
-    assert service._normalize_name("UserID") == "user_id"
-    assert service._normalize_name("USER-ID") == "user_id"
-    assert service._normalize_name("  user_id  ") == "user_id"
+    assert scorer._normalize_name("user_id") == "user_id"
+    assert scorer._normalize_name("userId") == "user_id"
+    assert scorer._normalize_name("UserID") == "user_id"
+    assert scorer._normalize_name("USER-ID") == "user_id"
+    assert scorer._normalize_name("  user_id  ") == "user_id"
 
 
 @pytest.mark.unit
-def test_exact_match_score(session, setup_test_data):
+def test_exact_match_score(service, setup_test_data):
     """Test exact match scoring"""
-    service = DimensionMappingService(session)
-    data = setup_test_data
+    ids = setup_test_data
     
     # Test exact match
     score = service._exact_match_score("user_id", "user_id")
@@ -204,12 +248,12 @@ def test_exact_match_score(session, setup_test_data):
 
 
 @pytest.mark.unit
-def test_alias_match_score(session, setup_test_data):
+def test_alias_match_score(session, service, setup_test_data):
     """Test alias match scoring"""
-    service = DimensionMappingService(session)
-    data = setup_test_data
+    ids = setup_test_data
     
-    user_dim = data['dimensions'][0]
+    user_dim = session.get(MetaDimension, ids.dimension_ids[0])
+    assert "uid" in user_dim.alias_tuple
     
     # Test alias match
     score = service._alias_match_score("uid", user_dim)
@@ -225,81 +269,157 @@ def test_alias_match_score(session, setup_test_data):
 
 
 @pytest.mark.unit
-def test_fuzzy_match_score(session):
+def test_build_index(session, service, setup_test_data):
+    """Test the normalized name and alias index"""
+    ids = setup_test_data
+    
+    dimensions = [session.get(MetaDimension, dim_id) for dim_id in ids.dimension_ids]
+    index = service.build_index(dimensions)
+    
+    assert index.names == tuple(d.name for d in dimensions)
+    assert index.name_to_ids["user_id"] == frozenset({ids.dimension_ids[0]})
+    assert index.alias_to_ids["uid"] == frozenset({ids.dimension_ids[0]})
+    assert "product_id" not in index.alias_to_ids
+
+
+@pytest.mark.unit
+def test_fuzzy_match_score(scorer):
     """Test fuzzy match scoring"""
-    service = DimensionMappingService(session)
+    # Test high similarity
+    score = scorer._fuzzy_match_score("categry", "category")
+    assert score > 0.5
     
-    try:
-        import Levenshtein
-        
-        # Test high similarity
-        score = service._fuzzy_match_score("categry", "category")
-        assert score > 0.5
-        
-        # Test low similarity
-        score = service._fuzzy_match_score("user_id", "product_name")
-        assert score == 0.0
-    except ImportError:
-        # Skip if Levenshtein not available
-        pytest.skip("Levenshtein library not available")
+    # Test low similarity
+    score = scorer._fuzzy_match_score("user_id", "product_name")
+    assert score == 0.0
 
 
 @pytest.mark.unit
-def test_semantic_type_match(session):
-    """Test semantic type matching"""
-    service = DimensionMappingService(session)
+@pytest.mark.parametrize(
+    "backend,padding",
+    [
+        pytest.param("rapidfuzz", 0, id="rapidfuzz"),
+        pytest.param("Levenshtein", 0, id="levenshtein"),
+        pytest.param(None, 0, id="python"),
+        pytest.param(None, 10, id="numpy"),
+        pytest.param(None, 40, id="trie"),
+    ],
+)
+def test_fuzzy_match_scores_threshold_parity(scorer, monkeypatch, backend, padding):
+    """Test every fuzzy backend keeps a match at exactly the similarity threshold"""
+    import app.services.dimension_mapping_service as module
+    
+    if backend:
+        pytest.importorskip(backend)
+    monkeypatch.setattr(module, "HAS_RAPIDFUZZ", backend == "rapidfuzz")
+    monkeypatch.setattr(module, "HAS_LEVENSHTEIN", backend == "Levenshtein")
+    
+    # 3 edits over 10 characters is a similarity of exactly 0.7; the padding
+    # names share no character with the field and only select the backend
+    names = ["abcdefgxyz"] + ["z" * 10] * padding
+    scores = scorer._fuzzy_match_scores("abcdefghij", names)
+    
+    assert scores[0] == pytest.approx(0.56)
+    assert scores[1:] == [0.0] * padding
+
+
+@pytest.mark.unit
+def test_bounded_levenshtein():
+    """Test bounded Levenshtein distance"""
+    # Exact distances within the bound
+    assert _bounded_levenshtein("categry", "category", 2) == 1
+    assert _bounded_levenshtein("kitten", "sitting", 3) == 3
+    assert _bounded_levenshtein("", "", 0) == 0
+    
+    # Distances beyond the bound are reported as max_distance + 1
+    assert _bounded_levenshtein("kitten", "sitting", 2) == 3
+    assert _bounded_levenshtein("user_id", "product_name", 3) == 4
+    assert _bounded_levenshtein("a", "abcdef", 2) == 3
+
+
+@pytest.mark.unit
+def test_levenshtein_batch():
+    """Test batched Levenshtein distance against the scalar implementation"""
+    candidates = ["category", "sitting", "", "产品类别", "user_id", "categry"]
     
+    for query in ["categry", "kitten", "", "产品"]:
+        expected = [
+            _bounded_levenshtein(query, candidate, max(len(query), len(candidate)))
+            for candidate in candidates
+        ]
+        assert _levenshtein_batch(query, candidates).tolist() == expected
+
+
+@pytest.mark.unit
+def test_semantic_type_match(scorer):
+    """Test semantic type matching"""
     # Test ID type
-    assert service._semantic_type_match("bigint", "ID") is True
-    assert service._semantic_type_match("varchar", "ID") is True
-    assert service._semantic_type_match("date", "ID") is False
+    assert scorer._semantic_type_match("bigint", "ID") is True
+    assert scorer._semantic_type_match("varchar", "ID") is True
+    assert scorer._semantic_type_match("date", "ID") is False
     
     # Test DATE type
-    assert service._semantic_type_match("date", "DATE") is True
-    assert service._semantic_type_match("datetime", "DATE") is True
-    assert service._semantic_type_match("varchar", "DATE") is False
+    assert scorer._semantic_type_match("date", "DATE") is True
+    assert scorer._semantic_type_match("datetime", "DATE") is True
+    assert scorer._semantic_type_match("varchar", "DATE") is False
     
     # Test CATEGORY type
-    assert service._semantic_type_match("varchar", "CATEGORY") is True
-    assert service._semantic_type_match("string", "CATEGORY") is True
-    assert service._semantic_type_match("int", "CATEGORY") is True
+    assert scorer._semantic_type_match("varchar", "CATEGORY") is True
+    assert scorer._semantic_type_match("string", "CATEGORY") is True
+    assert scorer._semantic_type_match("int", "CATEGORY") is True
 
 
 @pytest.mark.unit
-def test_value_based_match_score(session, setup_test_data):
+def test_value_based_match_score(session, service, setup_test_data):
     """Test value-based matching"""
-    service = DimensionMappingService(session)
-    data = setup_test_data
+    ids = setup_test_data
     
-    category_dim = data['dimensions'][1]
+    category_dim = session.get(MetaDimension, ids.dimension_ids[1])
     
     # Test high overlap
-    field_values = ["electronics", "books", "clothing"]
-    dim_values = ["electronics", "books", "clothing", "toys"]
+    field_values = frozenset(["electronics", "books", "clothing"])
+    dim_values = frozenset(["electronics", "books", "clothing", "toys"])
     score = service._value_based_match_score(field_values, category_dim, dim_values)
     assert score >= 0.75
     
     # Test medium overlap
-    field_values = ["electronics", "books", "sports"]
-    dim_values = ["electronics", "books", "clothing", "toys"]
+    field_values = frozenset(["electronics", "books", "sports"])
+    dim_values = frozenset(["electronics", "books", "clothing", "toys"])
     score = service._value_based_match_score(field_values, category_dim, dim_values)
     assert 0.6 <= score < 0.75
     
     # Test low overlap
-    field_values = ["a", "b", "c"]
-    dim_values = ["x", "y", "z"]
+    field_values = frozenset(["a", "b", "c"])
+    dim_values = frozenset(["x", "y", "z"])
     score = service._value_based_match_score(field_values, category_dim, dim_values)
     assert score == 0.0
+    
+    # Test dimension too small to cover the field values
+    field_values = frozenset(["electronics", "books", "clothing", "toys"])
+    dim_values = frozenset(["electronics", "books"])
+    score = service._value_based_match_score(field_values, category_dim, dim_values)
+    assert score == 0.0
+
+
+@pytest.mark.unit
+def test_value_based_match_score_raw_values(scorer):
+    """Test values are compared as strings, so equal-hashing and unhashable values work"""
+    # 1, True and 1.0 hash equal but normalize to "1", "true" and "1.0"
+    score = scorer._value_based_match_score([1, True, 1.0], None, ["1", "true", "1.0", "x"])
+    assert score == 1.0
+
+    # JSON column samples may be lists or dicts
+    score = scorer._value_based_match_score([["a"], {"k": 1}], None, ["['a']", "{'k': 1}"])
+    assert score == 1.0
 
 
 @pytest.mark.unit
-def test_calculate_dimension_scores_exact_match(session, setup_test_data):
+def test_calculate_dimension_scores_exact_match(session, service, setup_test_data):
     """Test dimension score calculation with exact match"""
-    service = DimensionMappingService(session)
-    data = setup_test_data
+    ids = setup_test_data
     
     # Column with exact name match
-    user_id_col = data['columns'][0]
+    user_id_col = session.get(MetaTableColumn, ids.column_ids[0])
     candidates = service.calculate_dimension_scores(user_id_col)
     
     assert len(candidates) > 0
@@ -310,13 +430,12 @@ def test_calculate_dimension_scores_exact_match(session, setup_test_data):
 
 
 @pytest.mark.unit
-def test_calculate_dimension_scores_alias_match(session, setup_test_data):
+def test_calculate_dimension_scores_alias_match(session, service, setup_test_data):
     """Test dimension score calculation with alias match"""
-    service = DimensionMappingService(session)
-    data = setup_test_data
+    ids = setup_test_data
     
     # Column with alias match
-    biz_category_col = data['columns'][2]
+    biz_category_col = session.get(MetaTableColumn, ids.column_ids[2])
     candidates = service.calculate_dimension_scores(biz_category_col)
     
     assert len(candidates) > 0
@@ -330,19 +449,18 @@ def test_calculate_dimension_scores_alias_match(session, setup_test_data):
 
 
 @pytest.mark.unit
-def test_calculate_dimension_scores_with_values(session, setup_test_data):
+def test_calculate_dimension_scores_with_values(session, service, setup_test_data):
     """Test dimension score calculation with value-based matching"""
-    service = DimensionMappingService(session)
-    data = setup_test_data
+    ids = setup_test_data
     
     # Prepare value data
     field_values = ["electronics", "books", "clothing"]
     dimension_values_map = {
-        data['dimensions'][1].id: ["electronics", "books", "clothing", "toys"]
+        ids.dimension_ids[1]: ["electronics", "books", "clothing", "toys"]
     }
     
     # Column for category
-    category_col = data['columns'][3]  # "categry" - typo
+    category_col = session.get(MetaTableColumn, ids.column_ids[3])  # "categry" - typo
     candidates = service.calculate_dimension_scores(
         category_col,
         field_values=field_values,
@@ -360,41 +478,43 @@ def test_calculate_dimension_scores_with_values(session, setup_test_data):
 
 
 @pytest.mark.unit
-def test_suggest_dimension_mappings(session, setup_test_data):
+def test_suggest_dimension_mappings(service, setup_test_data):
     """Test suggesting dimension mappings for a table"""
-    service = DimensionMappingService(session)
-    data = setup_test_data
+    ids = setup_test_data
     
     suggestions = service.suggest_dimension_mappings(
-        table_id=data['table'].id,
+        table_id=ids.table_id,
         max_candidates=3
     )
     
     assert len(suggestions) > 0
     
-    # Check that suggestions contain expected structure
-    for column_id, suggestion in suggestions.items():
-        assert 'column_id' in suggestion
-        assert 'field_name' in suggestion
-        assert 'candidates' in suggestion
-        assert len(suggestion['candidates']) <= 3
-        
-        # Each candidate should have required fields
-        for candidate in suggestion['candidates']:
-            assert 'dimension_id' in candidate
-            assert 'dimension_name' in candidate
-            assert 'total_score' in candidate
-            assert 'confidence' in candidate
+    # Check that suggestions and their candidates match the API response schema
+    validated = _SUGGESTIONS_ADAPTER.validate_python(suggestions)
+    assert all(len(suggestion.candidates) <= 3 for suggestion in validated.values())
+
+
+@pytest.mark.unit
+def test_suggest_dimension_mappings_builds_index_once(service, setup_test_data):
+    """Test that all columns of a table are scored against one dimension index"""
+    ids = setup_test_data
+    
+    with patch.object(service, "build_index", wraps=service.build_index) as build_index, \
+            patch.object(service, "_fuzzy_match_scores", wraps=service._fuzzy_match_scores) as fuzzy:
+        service.suggest_dimension_mappings(table_id=ids.table_id)
+    
+    assert build_index.call_count == 1
+    # One batched fuzzy pass per column, not one per column and dimension
+    assert fuzzy.call_count == len(ids.column_ids)
 
 
 @pytest.mark.unit
-def test_apply_dimension_mapping(session, setup_test_data):
+def test_apply_dimension_mapping(session, service, setup_test_data):
     """Test applying a dimension mapping"""
-    service = DimensionMappingService(session)
-    data = setup_test_data
+    ids = setup_test_data
     
-    column = data['columns'][0]
-    dimension = data['dimensions'][0]
+    column = session.get(MetaTableColumn, ids.column_ids[0])
+    dimension = session.get(MetaDimension, ids.dimension_ids[0])
     
     # Apply mapping
     success = service.apply_dimension_mapping(
@@ -412,29 +532,18 @@ def test_apply_dimension_mapping(session, setup_test_data):
 
 
 @pytest.mark.unit
-def test_apply_dimension_mapping_invalid_column(session, setup_test_data):
-    """Test applying mapping with invalid column"""
-    service = DimensionMappingService(session)
-    data = setup_test_data
-    
-    success = service.apply_dimension_mapping(
-        column_id=99999,
-        dimension_id=data['dimensions'][0].id,
-        updated_by="test_user"
-    )
-    
-    assert success is False
-
-
-@pytest.mark.unit
-def test_apply_dimension_mapping_invalid_dimension(session, setup_test_data):
-    """Test applying mapping with invalid dimension"""
-    service = DimensionMappingService(session)
-    data = setup_test_data
+@pytest.mark.parametrize(
+    "column_id,dimension_id",
+    [(99999, "valid"), ("valid", 99999)],
+    ids=["invalid_column", "invalid_dimension"],
+)
+def test_apply_dimension_mapping_invalid_ids(service, setup_test_data, column_id, dimension_id):
+    """Test applying mapping with an invalid column or dimension"""
+    ids = setup_test_data
     
     success = service.apply_dimension_mapping(
-        column_id=data['columns'][0].id,
-        dimension_id=99999,
+        column_id=ids.column_ids[0] if column_id == "valid" else column_id,
+        dimension_id=ids.dimension_ids[0] if dimension_id == "valid" else dimension_id,
         updated_by="test_user"
     )
     
@@ -442,10 +551,8 @@ def test_apply_dimension_mapping_invalid_dimension(session, setup_test_data):
 
 
 @pytest.mark.unit
-def test_confidence_calculation(session):
+def test_confidence_calculation(scorer):
     """Test confidence level calculation"""
-    service = DimensionMappingService(session)
-    
     # High confidence - exact match
     scores = {
         'exact_match': 1.0,
@@ -454,7 +561,7 @@ def test_confidence_calculation(session):
         'value_match': 0.0,
         'semantic_match': 0.0
     }
-    confidence = service._calculate_confidence(1.0, scores)
+    confidence = scorer._calculate_confidence(1.0, scores)
     assert confidence == 'high'
     
     # High confidence - high value match
@@ -465,7 +572,7 @@ def test_confidence_calculation(session):
         'value_match': 0.85,
         'semantic_match': 0.3
     }
-    confidence = service._calculate_confidence(1.0, scores)
+    confidence = scorer._calculate_confidence(1.0, scores)
     assert confidence == 'high'
     
     # Medium confidence - fuzzy + semantic
@@ -476,7 +583,7 @@ def test_confidence_calculation(session):
         'value_match': 0.0,
         'semantic_match': 0.3
     }
-    confidence = service._calculate_confidence(0.7, scores)
+    confidence = scorer._calculate_confidence(0.7, scores)
     assert confidence == 'medium'
     
     # Low confidence
@@ -487,5 +594,5 @@ def test_confidence_calculation(session):
         'value_match': 0.0,
         'semantic_match': 0.0
     }
-    confidence = service._calculate_confidence(0.4, scores)
+    confidence = scorer._calculate_confidence(0.4, scores)
     assert confidence == 'low'
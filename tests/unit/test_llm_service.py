@@ -5,6 +5,15 @@ from unittest.mock import Mock, patch, MagicMock
 from app.services.llm_service import LLMService
 
 
+def _make_openai_mock(content: str) -> Mock:
+    """Build an OpenAI client mock whose chat completions return content"""
+    mock_client = Mock()
+    mock_client.chat.completions.create.return_value.choices = [
+        Mock(message=Mock(content=content))
+    ]
+    return mock_client
+
+
 class TestLLMService:
     """Test LLM service functionality"""
 
@@ -42,16 +51,7 @@ class TestLLMService:
     @patch('app.services.llm_service.OpenAI')
     def test_expand_query_openai(self, mock_openai):
         """Test query expansion with OpenAI"""
-        # Setup mock
-        mock_client = Mock()
-        mock_response = Mock()
-        mock_choice = Mock()
-        mock_message = Mock()
-        mock_message.content = "Query 1\nQuery 2\nQuery 3"
-        mock_choice.message = mock_message
-        mock_response.choices = [mock_choice]
-        mock_client.chat.completions.create.return_value = mock_response
-        mock_openai.return_value = mock_client
+        mock_openai.return_value = _make_openai_mock("Query 1\nQuery 2\nQuery 3")
         
         llm = LLMService(provider="openai", api_key="test-key")
         result = llm.expand_query("销售")
@@ -64,16 +64,7 @@ class TestLLMService:
     @patch('app.services.llm_service.OpenAI')
     def test_generate_related_queries_openai(self, mock_openai):
         """Test related query generation with OpenAI"""
-        # Setup mock
-        mock_client = Mock()
-        mock_response = Mock()
-        mock_choice = Mock()
-        mock_message = Mock()
-        mock_message.content = "Related 1\nRelated 2\nRelated 3"
-        mock_choice.message = mock_message
-        mock_response.choices = [mock_choice]
-        mock_client.chat.completions.create.return_value = mock_response
-        mock_openai.return_value = mock_client
+        mock_openai.return_value = _make_openai_mock("Related 1\nRelated 2\nRelated 3")
         
         llm = LLMService(provider="openai", api_key="test-key")
         result = llm.generate_related_queries("市场趋势", limit=3)
@@ -93,16 +84,7 @@ class TestLLMService:
     @patch('app.services.llm_service.OpenAI')
     def test_rewrite_query_openai(self, mock_openai):
         """Test query rewriting with OpenAI"""
-        # Setup mock
-        mock_client = Mock()
-        mock_response = Mock()
-        mock_choice = Mock()
-        mock_message = Mock()
-        mock_message.content = "销售额分析报告"
-        mock_choice.message = mock_message
-        mock_response.choices = [mock_choice]
-        mock_client.chat.completions.create.return_value = mock_response
-        mock_openai.return_value = mock_client
+        mock_openai.return_value = _make_openai_mock("销售额分析报告")
         
         llm = LLMService(provider="openai", api_key="test-key")
         result = llm.rewrite_query("销售", intent="clarify")
@@ -115,11 +97,43 @@ class TestLLMService:
         result = llm.rewrite_query("test query")
         assert result is None
 
+    def test_expand_query_uses_cache(self):
+        """Test that repeated expansions reuse the cached response"""
+        llm = LLMService(provider="openai", api_key=None)
+        llm.client = _make_openai_mock("Query 1\nQuery 2")
+        
+        first = llm.expand_query("销售", context={"domain": "sales"})
+        second = llm.expand_query("销售", context={"domain": "sales"})
+        assert first == second == ["Query 1", "Query 2"]
+        assert llm.client.chat.completions.create.call_count == 1
+        
+        # A different context is a different cache entry
+        llm.expand_query("销售", context={"domain": "finance"})
+        assert llm.client.chat.completions.create.call_count == 2
+        
+        llm.clear_cache()
+        llm.expand_query("销售", context={"domain": "sales"})
+        assert llm.client.chat.completions.create.call_count == 3
+
+    def test_related_queries_cache_returns_copies(self):
+        """Test that mutating returned related queries does not alter the cache"""
+        llm = LLMService(provider="openai", api_key=None)
+        llm.client = _make_openai_mock("Query 1\nQuery 2")
+
+        first = llm.generate_related_queries("销售", limit=2)
+        first[0]["score"] = 0.0
+        first[0]["metadata"]["llm_generated"] = False
+
+        second = llm.generate_related_queries("销售", limit=2)
+        assert second[0]["score"] == 0.95
+        assert second[0]["metadata"]["llm_generated"] is True
+        assert llm.client.chat.completions.create.call_count == 1
+
     def test_parse_llm_response_line_separated(self):
         """Test parsing line-separated LLM response"""
         llm = LLMService(provider="local")
         response = "Query 1\nQuery 2\nQuery 3"
-        result = llm._parse_llm_response(response)
+        result = list(llm._parse_llm_response(response))
         
         assert len(result) == 3
         assert "Query 1" in result
@@ -128,7 +142,7 @@ class TestLLMService:
         """Test parsing comma-separated LLM response"""
         llm = LLMService(provider="local")
         response = "Query 1, Query 2, Query 3"
-        result = llm._parse_llm_response(response)
+        result = list(llm._parse_llm_response(response))
         
         assert len(result) == 3
         assert "Query 1" in result
@@ -137,7 +151,7 @@ class TestLLMService:
         """Test parsing LLM response with numbering"""
         llm = LLMService(provider="local")
         response = "1. Query 1\n2. Query 2\n3. Query 3"
-        result = llm._parse_llm_response(response)
+        result = list(llm._parse_llm_response(response))
         
         assert len(result) == 3
         assert "Query 1" in result
@@ -147,7 +161,7 @@ class TestLLMService:
         """Test parsing LLM response with bullets"""
         llm = LLMService(provider="local")
         response = "- Query 1\n- Query 2\n- Query 3"
-        result = llm._parse_llm_response(response)
+        result = list(llm._parse_llm_response(response))
         
         assert len(result) == 3
         assert "Query 1" in result
@@ -157,24 +171,24 @@ class TestLLMService:
         """Test parsing LLM response with quotes"""
         llm = LLMService(provider="local")
         response = '"Query 1"\n"Query 2"\n"Query 3"'
-        result = llm._parse_llm_response(response)
+        result = list(llm._parse_llm_response(response))
         
         assert len(result) == 3
         assert "Query 1" in result
         assert '"' not in result[0]
 
+    def test_parse_llm_response_deduplicates(self):
+        """Test parsing LLM response drops repeated queries in order"""
+        llm = LLMService(provider="local")
+        response = "1. Query 1\n2. Query 2\n3. Query 1"
+        result = list(llm._parse_llm_response(response))
+        
+        assert result == ["Query 1", "Query 2"]
+
     @patch('app.services.llm_service.OpenAI')
     def test_expand_query_with_context(self, mock_openai):
         """Test query expansion with context"""
-        mock_client = Mock()
-        mock_response = Mock()
-        mock_choice = Mock()
-        mock_message = Mock()
-        mock_message.content = "Contextual query 1\nContextual query 2"
-        mock_choice.message = mock_message
-        mock_response.choices = [mock_choice]
-        mock_client.chat.completions.create.return_value = mock_response
-        mock_openai.return_value = mock_client
+        mock_openai.return_value = _make_openai_mock("Contextual query 1\nContextual query 2")
         
         llm = LLMService(provider="openai", api_key="test-key")
         context = {
@@ -188,15 +202,7 @@ class TestLLMService:
     @patch('app.services.llm_service.OpenAI')
     def test_generate_related_queries_with_existing_results(self, mock_openai):
         """Test related query generation avoiding duplicates"""
-        mock_client = Mock()
-        mock_response = Mock()
-        mock_choice = Mock()
-        mock_message = Mock()
-        mock_message.content = "New query 1\nNew query 2"
-        mock_choice.message = mock_message
-        mock_response.choices = [mock_choice]
-        mock_client.chat.completions.create.return_value = mock_response
-        mock_openai.return_value = mock_client
+        mock_openai.return_value = _make_openai_mock("New query 1\nNew query 2")
         
         llm = LLMService(provider="openai", api_key="test-key")
         existing = ["Existing query 1", "Existing query 2"]
@@ -247,12 +253,7 @@ class TestLLMService:
     @patch('app.services.llm_service.OpenAI')
     def test_rank_prefix_completions_openai(self, mock_openai):
         """Test prefix completion ranking with OpenAI"""
-        # Setup mock
-        mock_client = Mock()
-        mock_response = Mock()
-        mock_choice = Mock()
-        mock_message = Mock()
-        mock_message.content = '''[
+        mock_openai.return_value = _make_openai_mock('''[
   {
     "text": "帮我查询一下今年北京的销售额",
     "score": 0.95,
@@ -265,11 +266,7 @@ class TestLLMService:
     "completed_term": "销量",
     "reason": "Related metric"
   }
-]'''
-        mock_choice.message = mock_message
-        mock_response.choices = [mock_choice]
-        mock_client.chat.completions.create.return_value = mock_response
-        mock_openai.return_value = mock_client
+]''')
         
         llm = LLMService(provider="openai", api_key="test-key")
         result = llm.rank_prefix_completions(
@@ -2,7 +2,7 @@
 
 import datetime
 import pytest
-from sqlmodel import Session, create_engine, SQLModel
+from sqlmodel import Session
 
 from app.models.metadata import (
     MetaDatabase,
@@ -17,19 +17,79 @@ from app.models.metadata import (
 )
 
 
-@pytest.fixture
-def test_engine():
-    """Create a test database engine"""
-    engine = create_engine("sqlite:///:memory:")
-    SQLModel.metadata.create_all(engine)
-    return engine
+@pytest.fixture(scope="session")
+def test_engine(sqlite_engine_factory):
+    """Create a test database engine and its tables once per test session"""
+    return sqlite_engine_factory()
 
 
 @pytest.fixture
 def test_session(test_engine):
-    """Create a test database session"""
-    with Session(test_engine) as session:
+    """Create a test database session whose changes are rolled back after each test"""
+    connection = test_engine.connect()
+    transaction = connection.begin()
+    # Commits inside the test stay within the outer transaction rolled back below;
+    # attributes stay loaded after commit so asserts do not reload each row
+    with Session(bind=connection, expire_on_commit=False) as session:
         yield session
+    
+    transaction.rollback()
+    connection.close()
+
+
+def _persist(engine, obj):
+    """Commit obj outside any per-test transaction so it survives rollbacks"""
+    with Session(engine, expire_on_commit=False) as session:
+        session.add(obj)
+        session.commit()
+    return obj
+
+
+def _remove(engine, obj):
+    """Delete a row inserted by _persist"""
+    with Session(engine) as session:
+        session.delete(session.get(type(obj), obj.id))
+        session.commit()
+
+
+def _reload(session, obj):
+    """Flush obj and read it back from the database rather than the identity map"""
+    session.flush()
+    session.expire_all()
+    return session.get(type(obj), obj.id)
+
+
+@pytest.fixture(scope="module")
+def shared_entity(test_engine):
+    """Insert a parent entity once per module"""
+    entity = _persist(test_engine, MetaEntity(entity_name="shared_entity"))
+    yield entity
+    _remove(test_engine, entity)
+
+
+@pytest.fixture(scope="module")
+def shared_db(test_engine):
+    """Insert a parent database once per module"""
+    db = _persist(test_engine, MetaDatabase(
+        name="shared_db",
+        db_type="mysql",
+        created_by="test_user",
+        updated_by="test_user"
+    ))
+    yield db
+    _remove(test_engine, db)
+
+
+@pytest.fixture(scope="module")
+def shared_domain(test_engine):
+    """Insert a parent domain once per module"""
+    domain = _persist(test_engine, MetaDomain(
+        name="shared_domain",
+        created_by="test_user",
+        updated_by="test_user"
+    ))
+    yield domain
+    _remove(test_engine, domain)
 
 
 @pytest.mark.unit
@@ -44,13 +104,11 @@ def test_create_database(test_session):
         status=1
     )
     test_session.add(db)
-    test_session.commit()
-    test_session.refresh(db)
+    loaded = _reload(test_session, db)
     
-    assert db.id is not None
-    assert db.name == "test_db"
-    assert db.db_type == "mysql"
-    assert db.status == 1
+    data = loaded.model_dump(include={"name", "db_type", "status"})
+    assert loaded.id is not None
+    assert data == {"name": "test_db", "db_type": "mysql", "status": 1}
 
 
 @pytest.mark.unit
@@ -64,12 +122,11 @@ def test_create_domain(test_session):
         status=1
     )
     test_session.add(domain)
-    test_session.commit()
-    test_session.refresh(domain)
+    loaded = _reload(test_session, domain)
     
-    assert domain.id is not None
-    assert domain.name == "test_domain"
-    assert domain.status == 1
+    data = loaded.model_dump(include={"name", "status"})
+    assert loaded.id is not None
+    assert data == {"name": "test_domain", "status": 1}
 
 
 @pytest.mark.unit
@@ -80,21 +137,16 @@ def test_create_entity(test_session):
         description="Test entity"
     )
     test_session.add(entity)
-    test_session.commit()
-    test_session.refresh(entity)
+    loaded = _reload(test_session, entity)
     
-    assert entity.id is not None
-    assert entity.entity_name == "test_entity"
+    assert loaded.id is not None
+    assert loaded.entity_name == "test_entity"
+    assert loaded.description == "Test entity"
 
 
 @pytest.mark.unit
-def test_create_dimension(test_session):
+def test_create_dimension(test_session, shared_entity):
     """Test creating a dimension record"""
-    entity = MetaEntity(entity_name="user")
-    test_session.add(entity)
-    test_session.commit()
-    test_session.refresh(entity)
-    
     dimension = MetaDimension(
         name="user_id",
         verbose_name="用户ID",
@@ -103,85 +155,63 @@ def test_create_dimension(test_session):
         dim_type="dim",
         created_by="test_user",
         updated_by="test_user",
-        entity_id=entity.id
+        entity_id=shared_entity.id
     )
     test_session.add(dimension)
-    test_session.commit()
-    test_session.refresh(dimension)
+    loaded = _reload(test_session, dimension)
     
-    assert dimension.id is not None
-    assert dimension.name == "user_id"
-    assert dimension.verbose_name == "用户ID"
-    assert dimension.semantic_type == "ID"
-    assert dimension.entity_id == entity.id
+    data = loaded.model_dump(include={"name", "verbose_name", "semantic_type", "entity_id"})
+    assert loaded.id is not None
+    assert data == {
+        "name": "user_id",
+        "verbose_name": "用户ID",
+        "semantic_type": "ID",
+        "entity_id": shared_entity.id,
+    }
 
 
 @pytest.mark.unit
-def test_create_metric(test_session):
+def test_create_metric(test_session, shared_entity):
     """Test creating a metric record"""
-    entity = MetaEntity(entity_name="sales")
-    test_session.add(entity)
-    test_session.commit()
-    test_session.refresh(entity)
-    
     metric = MetaMetric(
         name="revenue",
         verbose_name="销售额",
         data_type="float",
         created_by="test_user",
         updated_by="test_user",
-        entity_id=entity.id
+        entity_id=shared_entity.id
     )
     test_session.add(metric)
-    test_session.commit()
-    test_session.refresh(metric)
+    loaded = _reload(test_session, metric)
     
-    assert metric.id is not None
-    assert metric.name == "revenue"
-    assert metric.verbose_name == "销售额"
-    assert metric.data_type == "float"
+    data = loaded.model_dump(include={"name", "verbose_name", "data_type"})
+    assert loaded.id is not None
+    assert data == {"name": "revenue", "verbose_name": "销售额", "data_type": "float"}
 
 
 @pytest.mark.unit
-def test_create_table(test_session):
+def test_create_table(test_session, shared_db, shared_domain):
     """Test creating a table record"""
-    db = MetaDatabase(
-        name="test_db",
-        db_type="mysql",
-        created_by="test_user",
-        updated_by="test_user"
-    )
-    test_session.add(db)
-    test_session.commit()
-    test_session.refresh(db)
-    
-    domain = MetaDomain(
-        name="test_domain",
-        created_by="test_user",
-        updated_by="test_user"
-    )
-    test_session.add(domain)
-    test_session.commit()
-    test_session.refresh(domain)
-    
     table = MetaTable(
         name="user_table",
         full_name="test_db.public.user_table",
         verbose_name="用户表",
-        database_id=db.id,
-        domain_id=domain.id,
+        database_id=shared_db.id,
+        domain_id=shared_domain.id,
         created_by="test_user",
         updated_by="test_user"
     )
     test_session.add(table)
-    test_session.commit()
-    test_session.refresh(table)
+    loaded = _reload(test_session, table)
     
-    assert table.id is not None
-    assert table.name == "user_table"
-    assert table.full_name == "test_db.public.user_table"
-    assert table.database_id == db.id
-    assert table.domain_id == domain.id
+    data = loaded.model_dump(include={"name", "full_name", "database_id", "domain_id"})
+    assert loaded.id is not None
+    assert data == {
+        "name": "user_table",
+        "full_name": "test_db.public.user_table",
+        "database_id": shared_db.id,
+        "domain_id": shared_domain.id,
+    }
 
 
 @pytest.mark.unit
@@ -195,8 +225,7 @@ def test_dimension_with_parent(test_session):
         updated_by="test_user"
     )
     test_session.add(parent_dim)
-    test_session.commit()
-    test_session.refresh(parent_dim)
+    test_session.flush()  # assigns parent_dim.id without a separate commit
     
     child_dim = MetaDimension(
         name="city",
@@ -207,10 +236,9 @@ def test_dimension_with_parent(test_session):
         updated_by="test_user"
     )
     test_session.add(child_dim)
-    test_session.commit()
-    test_session.refresh(child_dim)
+    loaded = _reload(test_session, child_dim)
     
-    assert child_dim.parent_id == parent_dim.id
+    assert loaded.parent_id == parent_dim.id
 
 
 @pytest.mark.unit
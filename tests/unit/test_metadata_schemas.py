@@ -1,5 +1,7 @@
 """Unit tests for metadata schemas"""
 
+from types import MappingProxyType
+
 import pytest
 from pydantic import ValidationError
 
@@ -20,6 +22,10 @@ from app.models.metadata_schemas import (
 )
 
 
+# Audit fields shared by every payload; read-only so tests cannot alter it
+_AUDIT = MappingProxyType({"created_by": "test_user", "updated_by": "test_user"})
+
+
 @pytest.mark.unit
 def test_dimension_create_valid():
     """Test valid dimension creation schema"""
@@ -27,8 +33,7 @@ def test_dimension_create_valid():
         "name": "user_id",
         "verbose_name": "用户ID",
         "semantic_type": "ID",
-        "created_by": "test_user",
-        "updated_by": "test_user"
+        **_AUDIT
     }
     
     dimension = DimensionCreate(**data)
@@ -85,8 +90,7 @@ def test_metric_create_valid():
     data = {
         "name": "revenue",
         "verbose_name": "销售额",
-        "created_by": "test_user",
-        "updated_by": "test_user"
+        **_AUDIT
     }
     
     metric = MetricCreate(**data)
@@ -225,8 +229,7 @@ def test_dimension_response():
         "dim_type": "dim",
         "expr": {},
         "status": 1,
-        "created_by": "test_user",
-        "updated_by": "test_user"
+        **_AUDIT
     }
     
     response = DimensionResponse(**data)
@@ -244,8 +247,7 @@ def test_metric_response():
         "data_type": "float",
         "status": 1,
         "is_created": False,
-        "created_by": "test_user",
-        "updated_by": "test_user"
+        **_AUDIT
     }
     
     response = MetricResponse(**data)
@@ -275,53 +277,33 @@ def test_table_response():
 
 
 @pytest.mark.unit
-def test_dimension_create_missing_required_field():
-    """Test dimension creation fails with missing required field"""
-    data = {
-        "name": "test_dim",
-        "verbose_name": "测试维度"
-        # Missing semantic_type, created_by, updated_by
-    }
-    
-    with pytest.raises(ValidationError) as exc_info:
-        DimensionCreate(**data)
-    
-    errors = exc_info.value.errors()
-    error_fields = [e['loc'][0] for e in errors]
-    assert 'semantic_type' in error_fields
-    assert 'created_by' in error_fields
-    assert 'updated_by' in error_fields
-
-
-@pytest.mark.unit
-def test_metric_create_missing_required_field():
-    """Test metric creation fails with missing required field"""
-    data = {
-        "name": "test_metric"
-        # Missing verbose_name, created_by, updated_by
-    }
-    
-    with pytest.raises(ValidationError) as exc_info:
-        MetricCreate(**data)
-    
-    errors = exc_info.value.errors()
-    error_fields = [e['loc'][0] for e in errors]
-    assert 'verbose_name' in error_fields
-    assert 'created_by' in error_fields
-
-
-@pytest.mark.unit
-def test_table_create_missing_required_fields():
-    """Test table creation fails with missing required fields"""
-    data = {
-        "name": "test_table"
-        # Missing full_name, verbose_name, database_id, domain_id, etc.
-    }
-    
+@pytest.mark.parametrize(
+    "model_cls,data,expected_missing",
+    [
+        pytest.param(
+            DimensionCreate,
+            {"name": "test_dim", "verbose_name": "测试维度"},
+            {"semantic_type", "created_by", "updated_by"},
+            id="dimension",
+        ),
+        pytest.param(
+            MetricCreate,
+            {"name": "test_metric"},
+            {"verbose_name", "created_by"},
+            id="metric",
+        ),
+        pytest.param(
+            TableCreate,
+            {"name": "test_table"},
+            {"full_name", "database_id"},
+            id="table",
+        ),
+    ],
+)
+def test_create_missing_required_fields(model_cls, data, expected_missing):
+    """Test creation fails when required fields are missing"""
     with pytest.raises(ValidationError) as exc_info:
-        TableCreate(**data)
+        model_cls(**data)
     
-    errors = exc_info.value.errors()
-    error_fields = [e['loc'][0] for e in errors]
-    assert 'full_name' in error_fields
-    assert 'database_id' in error_fields
+    error_fields = {e['loc'][0] for e in exc_info.value.errors()}
+    assert expected_missing <= error_fields
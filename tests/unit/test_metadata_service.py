@@ -1,15 +1,48 @@
 """Unit tests for metadata service"""
 
+from types import MappingProxyType
+
 import pytest
+from sqlmodel import Session
+
 from app.services.metadata_service import MetadataService
-from app.models.metadata import MetaDimension, MetaMetric, MetaTable, MetaEntity
+from app.models.metadata import MetaDimension, MetaMetric, MetaTable, MetaEntity, MetaTableColumn
+
+
+# Audit fields shared by every payload; read-only so tests cannot alter it
+_AUDIT = MappingProxyType({"created_by": "test_user", "updated_by": "test_user"})
+
+
+@pytest.fixture(scope="session")
+def _engine(sqlite_engine_factory):
+    """Create the in-memory database and its tables once per test session"""
+    return sqlite_engine_factory()
+
+
+@pytest.fixture(scope="session")
+def _metadata_service(_engine):
+    """Create the metadata service once, so table checks run once per session"""
+    return MetadataService(engine=_engine)
 
 
 @pytest.fixture
-def metadata_service():
-    """Create a metadata service with in-memory database"""
-    service = MetadataService(database_url="sqlite:///:memory:")
-    return service
+def metadata_service(_metadata_service, monkeypatch):
+    """Provide the shared metadata service with changes rolled back after each test"""
+    connection = _metadata_service.engine.connect()
+    transaction = connection.begin()
+    # Service sessions join the outer transaction, so their commits are undone below
+    monkeypatch.setattr(_metadata_service, "engine", connection)
+    yield _metadata_service
+    
+    transaction.rollback()
+    connection.close()
+
+
+def _remove(service, model_class, record_id):
+    """Hard delete a row committed outside the per-test transaction"""
+    with Session(service.engine) as session:
+        session.delete(session.get(model_class, record_id))
+        session.commit()
 
 
 @pytest.mark.unit
@@ -21,8 +54,7 @@ def test_create_dimension(metadata_service):
         "semantic_type": "ID",
         "data_type": "str",
         "dim_type": "dim",
-        "created_by": "test_user",
-        "updated_by": "test_user"
+        **_AUDIT
     }
     
     dimension = metadata_service.create_dimension(data)
@@ -34,25 +66,6 @@ def test_create_dimension(metadata_service):
     assert dimension.gmt_modified is not None
 
 
-@pytest.mark.unit
-def test_get_dimension(metadata_service):
-    """Test getting a dimension by ID"""
-    data = {
-        "name": "product_id",
-        "verbose_name": "产品ID",
-        "semantic_type": "ID",
-        "created_by": "test_user",
-        "updated_by": "test_user"
-    }
-    
-    created = metadata_service.create_dimension(data)
-    retrieved = metadata_service.get_dimension(created.id)
-    
-    assert retrieved is not None
-    assert retrieved.id == created.id
-    assert retrieved.name == created.name
-
-
 @pytest.mark.unit
 def test_get_nonexistent_dimension(metadata_service):
     """Test getting a non-existent dimension"""
@@ -60,68 +73,19 @@ def test_get_nonexistent_dimension(metadata_service):
     assert result is None
 
 
-@pytest.mark.unit
-def test_update_dimension(metadata_service):
-    """Test updating a dimension"""
-    data = {
-        "name": "region",
-        "verbose_name": "区域",
-        "semantic_type": "CATEGORY",
-        "created_by": "test_user",
-        "updated_by": "test_user"
-    }
-    
-    created = metadata_service.create_dimension(data)
-    
-    update_data = {
-        "verbose_name": "地区",
-        "description": "更新后的描述",
-        "updated_by": "admin"
-    }
-    
-    updated = metadata_service.update_dimension(created.id, update_data)
-    
-    assert updated is not None
-    assert updated.verbose_name == "地区"
-    assert updated.description == "更新后的描述"
-    assert updated.updated_by == "admin"
-    assert updated.gmt_modified > created.gmt_create
-
-
-@pytest.mark.unit
-def test_delete_dimension(metadata_service):
-    """Test soft deleting a dimension"""
-    data = {
-        "name": "temp_dim",
-        "verbose_name": "临时维度",
-        "semantic_type": "CATEGORY",
-        "created_by": "test_user",
-        "updated_by": "test_user"
-    }
-    
-    created = metadata_service.create_dimension(data)
-    success = metadata_service.delete_dimension(created.id)
-    
-    assert success is True
-    
-    # Verify soft delete
-    deleted = metadata_service.get_dimension(created.id)
-    assert deleted.status == 0
-
-
 @pytest.mark.unit
 def test_get_all_dimensions(metadata_service):
     """Test getting all dimensions with pagination"""
     # Create multiple dimensions
-    for i in range(5):
-        data = {
+    metadata_service.bulk_insert_dimensions([
+        {
             "name": f"dim_{i}",
             "verbose_name": f"维度{i}",
             "semantic_type": "CATEGORY",
-            "created_by": "test_user",
-            "updated_by": "test_user"
+            **_AUDIT
         }
-        metadata_service.create_dimension(data)
+        for i in range(5)
+    ])
     
     # Get first page
     dimensions = metadata_service.get_dimensions(skip=0, limit=3)
@@ -139,8 +103,7 @@ def test_create_metric(metadata_service):
         "name": "revenue",
         "verbose_name": "销售额",
         "data_type": "float",
-        "created_by": "test_user",
-        "updated_by": "test_user"
+        **_AUDIT
     }
     
     metric = metadata_service.create_metric(data)
@@ -151,51 +114,6 @@ def test_create_metric(metadata_service):
     assert metric.gmt_create is not None
 
 
-@pytest.mark.unit
-def test_get_metric(metadata_service):
-    """Test getting a metric by ID"""
-    data = {
-        "name": "profit",
-        "verbose_name": "利润",
-        "data_type": "float",
-        "created_by": "test_user",
-        "updated_by": "test_user"
-    }
-    
-    created = metadata_service.create_metric(data)
-    retrieved = metadata_service.get_metric(created.id)
-    
-    assert retrieved is not None
-    assert retrieved.id == created.id
-    assert retrieved.name == created.name
-
-
-@pytest.mark.unit
-def test_update_metric(metadata_service):
-    """Test updating a metric"""
-    data = {
-        "name": "cost",
-        "verbose_name": "成本",
-        "data_type": "float",
-        "created_by": "test_user",
-        "updated_by": "test_user"
-    }
-    
-    created = metadata_service.create_metric(data)
-    
-    update_data = {
-        "verbose_name": "总成本",
-        "unit": "元",
-        "updated_by": "admin"
-    }
-    
-    updated = metadata_service.update_metric(created.id, update_data)
-    
-    assert updated is not None
-    assert updated.verbose_name == "总成本"
-    assert updated.unit == "元"
-
-
 @pytest.mark.unit
 def test_create_entity(metadata_service):
     """Test creating an entity"""
@@ -246,19 +164,80 @@ def test_create_domain(metadata_service):
     assert domain.description == "销售主题域"
 
 
+@pytest.mark.unit
+def test_create_dimensions(metadata_service):
+    """Test creating several dimensions in one transaction"""
+    dimensions = metadata_service.create_dimensions([
+        {
+            "name": f"bulk_dim_{i}",
+            "verbose_name": f"批量维度{i}",
+            "semantic_type": "CATEGORY",
+            **_AUDIT
+        }
+        for i in range(3)
+    ])
+    
+    assert [d.name for d in dimensions] == ["bulk_dim_0", "bulk_dim_1", "bulk_dim_2"]
+    assert all(d.id is not None and d.gmt_create is not None for d in dimensions)
+    assert metadata_service.get_dimension(dimensions[0].id).name == "bulk_dim_0"
+
+
+@pytest.mark.unit
+def test_bulk_insert_dimensions(metadata_service):
+    """Test inserting several dimensions without returning them"""
+    inserted = metadata_service.bulk_insert_dimensions([
+        {
+            "name": f"fast_dim_{i}",
+            "verbose_name": f"快速维度{i}",
+            "semantic_type": "CATEGORY",
+            **_AUDIT
+        }
+        for i in range(3)
+    ])
+    
+    assert inserted == 3
+    dimensions = metadata_service.get_dimensions()
+    assert [d.name for d in dimensions] == ["fast_dim_0", "fast_dim_1", "fast_dim_2"]
+    assert all(d.status == 1 and d.expr == {} and d.gmt_create is not None for d in dimensions)
+
+
+@pytest.mark.unit
+def test_create_table_columns(metadata_service):
+    """Test creating several columns of a table in one transaction"""
+    db = metadata_service.create_database({"name": "col_db", "db_type": "mysql", **_AUDIT})
+    domain = metadata_service.create_domain({"name": "col_domain", **_AUDIT})
+    table = metadata_service.create_table({
+        "name": "orders",
+        "full_name": "col_db.public.orders",
+        "verbose_name": "订单表",
+        "database_id": db.id,
+        "domain_id": domain.id,
+        **_AUDIT
+    })
+    
+    columns = metadata_service.create_table_columns(table.id, [
+        {"field_name": f"col_{i}", "data_type": "varchar", "logical_type": "varchar", **_AUDIT}
+        for i in range(3)
+    ])
+    
+    assert [c.field_name for c in columns] == ["col_0", "col_1", "col_2"]
+    assert all(c.id is not None and c.table_id == table.id for c in columns)
+    assert metadata_service.count(MetaTableColumn, {"table_id": table.id}) == 3
+
+
 @pytest.mark.unit
 def test_count_dimensions(metadata_service):
     """Test counting dimensions"""
     # Create some dimensions
-    for i in range(3):
-        data = {
+    metadata_service.bulk_insert_dimensions([
+        {
             "name": f"count_dim_{i}",
             "verbose_name": f"计数维度{i}",
             "semantic_type": "CATEGORY",
-            "created_by": "test_user",
-            "updated_by": "test_user"
+            **_AUDIT
         }
-        metadata_service.create_dimension(data)
+        for i in range(3)
+    ])
     
     count = metadata_service.count(MetaDimension)
     assert count >= 3
@@ -267,27 +246,23 @@ def test_count_dimensions(metadata_service):
 @pytest.mark.unit
 def test_filter_by_status(metadata_service):
     """Test filtering dimensions by status"""
-    # Create active dimension
-    data1 = {
-        "name": "active_dim",
-        "verbose_name": "活跃维度",
-        "semantic_type": "CATEGORY",
-        "status": 1,
-        "created_by": "test_user",
-        "updated_by": "test_user"
-    }
-    metadata_service.create_dimension(data1)
-    
-    # Create inactive dimension
-    data2 = {
-        "name": "inactive_dim",
-        "verbose_name": "非活跃维度",
-        "semantic_type": "CATEGORY",
-        "status": 0,
-        "created_by": "test_user",
-        "updated_by": "test_user"
-    }
-    metadata_service.create_dimension(data2)
+    # Create an active and an inactive dimension
+    metadata_service.create_dimensions([
+        {
+            "name": "active_dim",
+            "verbose_name": "活跃维度",
+            "semantic_type": "CATEGORY",
+            "status": 1,
+            **_AUDIT
+        },
+        {
+            "name": "inactive_dim",
+            "verbose_name": "非活跃维度",
+            "semantic_type": "CATEGORY",
+            "status": 0,
+            **_AUDIT
+        }
+    ])
     
     # Filter by status
     active_dims = metadata_service.get_dimensions(status=1)
@@ -297,3 +272,95 @@ def test_filter_by_status(metadata_service):
     assert len(inactive_dims) >= 1
     assert all(d.status == 1 for d in active_dims)
     assert all(d.status == 0 for d in inactive_dims)
+
+
+@pytest.fixture(scope="class")
+def created_dim(_metadata_service):
+    """Create the dimension once; per-test rollbacks undo updates and deletes"""
+    dimension = _metadata_service.create_dimension({
+        "name": "region",
+        "verbose_name": "区域",
+        "semantic_type": "CATEGORY",
+        **_AUDIT
+    })
+    yield dimension
+    _remove(_metadata_service, MetaDimension, dimension.id)
+
+
+@pytest.mark.unit
+class TestDimensionRoundTrip:
+    """Get, update and delete against one dimension created for the class"""
+
+    def test_get_dimension(self, metadata_service, created_dim):
+        """Test getting a dimension by ID"""
+        retrieved = metadata_service.get_dimension(created_dim.id)
+        
+        assert retrieved is not None
+        assert retrieved.id == created_dim.id
+        assert retrieved.name == created_dim.name
+
+    def test_update_dimension(self, metadata_service, created_dim):
+        """Test updating a dimension"""
+        update_data = {
+            "verbose_name": "地区",
+            "description": "更新后的描述",
+            "updated_by": "admin"
+        }
+        
+        updated = metadata_service.update_dimension(created_dim.id, update_data)
+        
+        assert updated is not None
+        assert updated.verbose_name == "地区"
+        assert updated.description == "更新后的描述"
+        assert updated.updated_by == "admin"
+        assert updated.gmt_modified > created_dim.gmt_create
+
+    def test_delete_dimension(self, metadata_service, created_dim):
+        """Test soft deleting a dimension"""
+        success = metadata_service.delete_dimension(created_dim.id)
+        
+        assert success is True
+        
+        # Verify soft delete
+        deleted = metadata_service.get_dimension(created_dim.id)
+        assert deleted.status == 0
+
+
+@pytest.fixture(scope="class")
+def created_metric(_metadata_service):
+    """Create the metric once; per-test rollbacks undo updates"""
+    metric = _metadata_service.create_metric({
+        "name": "profit",
+        "verbose_name": "利润",
+        "data_type": "float",
+        **_AUDIT
+    })
+    yield metric
+    _remove(_metadata_service, MetaMetric, metric.id)
+
+
+@pytest.mark.unit
+class TestMetricRoundTrip:
+    """Get and update against one metric created for the class"""
+
+    def test_get_metric(self, metadata_service, created_metric):
+        """Test getting a metric by ID"""
+        retrieved = metadata_service.get_metric(created_metric.id)
+        
+        assert retrieved is not None
+        assert retrieved.id == created_metric.id
+        assert retrieved.name == created_metric.name
+
+    def test_update_metric(self, metadata_service, created_metric):
+        """Test updating a metric"""
+        update_data = {
+            "verbose_name": "总成本",
+            "unit": "元",
+            "updated_by": "admin"
+        }
+        
+        updated = metadata_service.update_metric(created_metric.id, update_data)
+        
+        assert updated is not None
+        assert updated.verbose_name == "总成本"
+        assert updated.unit == "元"
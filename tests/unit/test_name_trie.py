@@ -0,0 +1,35 @@
+"""Unit tests for the name trie"""
+
+import pytest
+
+from app.utils.name_trie import NameTrie
+
+
+NAMES = ["user_id", "user_name", "userid", "category", "categories", "产品类别", "user_id"]
+
+
+@pytest.mark.unit
+def test_search_within_exact_match():
+    """Test that exact matches are found at distance 0, including duplicates"""
+    trie = NameTrie(NAMES)
+    results = trie.search_within("user_id", 0)
+
+    assert results == {0: 0, 6: 0}
+
+
+@pytest.mark.unit
+def test_search_within_distances():
+    """Test that names within the bound are reported with exact distances"""
+    trie = NameTrie(NAMES)
+    results = trie.search_within("categry", 2)
+
+    assert results == {3: 1}
+    assert trie.search_within("userid", 1) == {0: 1, 2: 0, 6: 1}
+    assert trie.search_within("产品类", 1) == {5: 1}
+
+
+@pytest.mark.unit
+def test_search_within_empty():
+    """Test empty queries and empty tries"""
+    assert NameTrie(["", "a"]).search_within("", 0) == {0: 0}
+    assert NameTrie([]).search_within("user_id", 3) == {}
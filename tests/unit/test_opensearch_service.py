@@ -0,0 +1,91 @@
+"""Unit tests for OpenSearch service"""
+
+import pytest
+from unittest.mock import MagicMock, call, patch
+
+from app.services.opensearch_service import OpenSearchService
+
+
+_DOCUMENTS = [
+    {"doc_id": f"doc{i}", "text": f"销售报告{i}", "vector": [0.1, 0.2, 0.3]}
+    for i in range(3)
+]
+
+
+@pytest.fixture
+def service():
+    """Create the service over a mocked client"""
+    service = OpenSearchService(index_name="test_index")
+    service.client = MagicMock()
+    service.client.indices.get_settings.return_value = {
+        "test_index": {"settings": {"index": {"refresh_interval": "5s"}}}
+    }
+    return service
+
+
+@pytest.fixture
+def parallel_bulk():
+    """Patch parallel_bulk to report every document as indexed"""
+    with patch("app.services.opensearch_service.helpers.parallel_bulk") as mock_bulk:
+        mock_bulk.side_effect = lambda client, actions, **kwargs: ((True, {}) for _ in actions)
+        yield mock_bulk
+
+
+def _refresh_intervals(service):
+    """Refresh intervals written through put_settings, in call order"""
+    return [
+        c.kwargs["body"]["index"]["refresh_interval"]
+        for c in service.client.indices.put_settings.call_args_list
+    ]
+
+
+@pytest.mark.unit
+def test_bulk_index_keeps_refresh_by_default(service, parallel_bulk):
+    """Test a plain bulk index leaves the settings alone and refreshes once"""
+    assert service.bulk_index_documents(_DOCUMENTS) == (3, 0)
+
+    service.client.indices.put_settings.assert_not_called()
+    service.client.indices.refresh.assert_called_once_with(index="test_index")
+
+
+@pytest.mark.unit
+def test_bulk_index_suspend_refresh_restores_previous(service, parallel_bulk):
+    """Test suspended refresh is restored to the configured interval"""
+    assert service.bulk_index_documents(_DOCUMENTS, suspend_refresh=True) == (3, 0)
+
+    assert _refresh_intervals(service) == ["-1", "5s"]
+    service.client.indices.refresh.assert_called_once_with(index="test_index")
+
+
+@pytest.mark.unit
+def test_bulk_index_suspend_refresh_restores_default(service, parallel_bulk):
+    """Test an index without a configured interval goes back to the default"""
+    service.client.indices.get_settings.return_value = {"test_index": {"settings": {}}}
+
+    service.bulk_index_documents(_DOCUMENTS, suspend_refresh=True)
+
+    assert _refresh_intervals(service) == ["-1", None]
+
+
+@pytest.mark.unit
+def test_bulk_index_suspend_failure_still_indexes(service, parallel_bulk):
+    """Test a failed settings update does not abort the ingest"""
+    service.client.indices.put_settings.side_effect = Exception("forbidden")
+
+    assert service.bulk_index_documents(_DOCUMENTS, suspend_refresh=True) == (3, 0)
+
+    assert service.client.indices.put_settings.call_args_list == [
+        call(index="test_index", body={"index": {"refresh_interval": "-1"}})
+    ]
+    service.client.indices.refresh.assert_called_once_with(index="test_index")
+
+
+@pytest.mark.unit
+def test_bulk_index_restore_failure_keeps_counts(service, parallel_bulk):
+    """Test a failed restore still reports the documents that were indexed"""
+    service.client.indices.put_settings.side_effect = [None, Exception("timeout")]
+
+    assert service.bulk_index_documents(_DOCUMENTS, suspend_refresh=True) == (3, 0)
+
+    assert _refresh_intervals(service) == ["-1", "5s"]
+    service.client.indices.refresh.assert_called_once_with(index="test_index")
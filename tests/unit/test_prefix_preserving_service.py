@@ -1,32 +1,52 @@
 """Unit tests for prefix-preserving service"""
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import create_autospec
 
+from app.services.llm_service import LLMService
+from app.services.opensearch_service import OpenSearchService
+from app.services.personalization_service import PersonalizationService
 from app.services.prefix_preserving_service import PrefixPreservingService
 from app.models.schemas import Suggestion
 
 
+@pytest.fixture(scope="class")
+def mock_opensearch():
+    """Mock OpenSearch service, shared by the class and reset per test"""
+    return create_autospec(OpenSearchService, instance=True)
+
+
+@pytest.fixture(scope="class")
+def mock_llm():
+    """Mock LLM service, shared by the class and reset per test"""
+    return create_autospec(LLMService, instance=True)
+
+
+@pytest.fixture(scope="class")
+def service(mock_opensearch, mock_llm):
+    """Create service instance"""
+    return PrefixPreservingService(
+        opensearch_service=mock_opensearch,
+        llm_service=mock_llm,
+        personalization_service=None,
+    )
+
+
 class TestPrefixPreservingService:
     """Test prefix-preserving service functionality"""
 
-    @pytest.fixture
-    def mock_opensearch(self):
-        """Mock OpenSearch service"""
-        mock = Mock()
-        mock.keyword_search.return_value = [
+    @pytest.fixture(autouse=True)
+    def _reset_mocks(self, mock_opensearch, mock_llm):
+        """Clear recorded calls and restore default return values before each test"""
+        mock_opensearch.reset_mock()
+        mock_opensearch.keyword_search.return_value = [
             {"text": "销售额", "score": 0.9},
             {"text": "销量", "score": 0.85},
             {"text": "销售情况", "score": 0.8},
         ]
-        return mock
-
-    @pytest.fixture
-    def mock_llm(self):
-        """Mock LLM service"""
-        mock = Mock()
-        mock.is_available.return_value = True
-        mock.rank_prefix_completions.return_value = [
+        mock_llm.reset_mock()
+        mock_llm.is_available.return_value = True
+        mock_llm.rank_prefix_completions.return_value = [
             {
                 "text": "帮我查询一下今年北京的销售额",
                 "score": 0.95,
@@ -40,16 +60,6 @@ class TestPrefixPreservingService:
                 "completed_term": "销量",
             },
         ]
-        return mock
-
-    @pytest.fixture
-    def service(self, mock_opensearch, mock_llm):
-        """Create service instance"""
-        return PrefixPreservingService(
-            opensearch_service=mock_opensearch,
-            llm_service=mock_llm,
-            personalization_service=None,
-        )
 
     def test_analyze_input_short_query(self, service):
         """Test analysis of short query"""
@@ -98,7 +108,7 @@ class TestPrefixPreservingService:
 
     def test_rank_and_complete_fallback(self, mock_opensearch):
         """Test fallback completion without LLM"""
-        mock_llm = Mock()
+        mock_llm = create_autospec(LLMService, instance=True)
         mock_llm.is_available.return_value = False
         
         service = PrefixPreservingService(
@@ -141,7 +151,37 @@ class TestPrefixPreservingService:
         assert "prefix" in result[0].metadata
         assert "incomplete_term" in result[0].metadata
 
-    def test_get_suggestions_no_candidates(self, service, mock_opensearch):
+    def test_get_suggestions_strips_text(self, service, mock_llm):
+        """Test LLM completions are stripped like validated suggestions"""
+        mock_llm.rank_prefix_completions.return_value = [
+            {"text": "  帮我查询一下今年北京的销售额\n", "score": 0.95},
+        ]
+        
+        result = service.get_suggestions_with_prefix_preservation(
+            query="帮我查询一下今年北京的销",
+            limit=10,
+        )
+        
+        assert result[0].text == "帮我查询一下今年北京的销售额"
+        assert result[0] == Suggestion(**result[0].model_dump())
+
+    def test_get_suggestions_drops_invalid_text(self, service, mock_llm):
+        """Test completions without usable text are dropped, not stringified"""
+        mock_llm.rank_prefix_completions.return_value = [
+            {"text": None, "score": 0.99},
+            {"text": "   ", "score": 0.98},
+            {"text": 42, "score": 0.97},
+            {"text": "帮我查询一下今年北京的销量", "score": 0.90},
+        ]
+        
+        result = service.get_suggestions_with_prefix_preservation(
+            query="帮我查询一下今年北京的销",
+            limit=10,
+        )
+        
+        assert [s.text for s in result] == ["帮我查询一下今年北京的销量"]
+
+    def test_get_suggestions_no_candidates(self, service, mock_opensearch, mock_llm):
         """Test when no candidates are found"""
         mock_opensearch.keyword_search.return_value = []
         
@@ -151,10 +191,12 @@ class TestPrefixPreservingService:
         )
         
         assert result is None
+        # Empty candidates short-circuit before any LLM ranking
+        mock_llm.rank_prefix_completions.assert_not_called()
 
     def test_build_user_context(self, mock_opensearch, mock_llm):
         """Test building user context"""
-        mock_personalization = Mock()
+        mock_personalization = create_autospec(PersonalizationService, instance=True)
         mock_personalization.get_user_preferences.return_value = [
             "销售分析",
             "客户满意度",
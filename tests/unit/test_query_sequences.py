@@ -1,19 +1,40 @@
 """Unit tests for query sequence tracking and related queries optimization"""
+from collections import Counter
+
 import pytest
 from unittest.mock import Mock, MagicMock
 from app.services.personalization_service import PersonalizationService
 from app.services.autocomplete_service import AutocompleteService
 
+# Keep these tests on one worker so the module-scoped fixtures are built once
+pytestmark = pytest.mark.xdist_group("unit_sequences")
 
-@pytest.mark.unit
-def test_track_query_sequences():
-    """Test that query sequences are tracked correctly"""
-    # Create mock Redis client
-    mock_redis = MagicMock()
 
-    # Create service with mock Redis
+@pytest.fixture(scope="module")
+def mock_redis():
+    """Mock Redis client shared by the module and reset per test"""
+    return MagicMock()
+
+
+@pytest.fixture(scope="module")
+def personalization_service(mock_redis):
+    """Create the personalization service once; its Redis connect attempt is slow"""
     service = PersonalizationService()
     service.redis_client = mock_redis
+    return service
+
+
+@pytest.fixture(autouse=True)
+def _reset_redis(mock_redis, personalization_service):
+    """Clear the shared mock and reattach it before each test"""
+    mock_redis.reset_mock(return_value=True, side_effect=True)
+    personalization_service.redis_client = mock_redis
+
+
+@pytest.mark.unit
+def test_track_query_sequences(personalization_service, mock_redis):
+    """Test that query sequences are tracked correctly"""
+    service = personalization_service
 
     # Simulate user making sequential queries
     # First query: "销售分析"
@@ -25,32 +46,35 @@ def test_track_query_sequences():
     service.track_selection("user123", "市场趋势", "2024市场趋势报告")
 
     # Verify sequence was tracked
-    # Should have called zincrby for global sequence
-    calls = [call for call in mock_redis.zincrby.call_args_list if 'sequence:' in str(call)]
+    # Should have queued zincrby for global sequence on the pipeline
+    pipe = mock_redis.pipeline.return_value
+    calls = [call for call in pipe.zincrby.call_args_list if 'sequence:' in str(call)]
     assert len(calls) > 0, "Expected sequence tracking calls"
 
+    # The reverse index records where "市场趋势" came from
+    pipe.zincrby.assert_any_call("prev:市场趋势", 1, "销售分析")
+    pipe.zincrby.assert_any_call("user:user123:prev:市场趋势", 1, "销售分析")
+
+    # Writes go out in one non-transactional round-trip per selection
+    mock_redis.pipeline.assert_called_with(transaction=False)
+    assert pipe.execute.call_count == 2
+    mock_redis.zincrby.assert_not_called()
+
 
 @pytest.mark.unit
-def test_get_query_sequences():
+def test_get_query_sequences(personalization_service, mock_redis):
     """Test retrieving query sequences (next and previous queries)"""
-    mock_redis = MagicMock()
-
-    service = PersonalizationService()
-    service.redis_client = mock_redis
+    service = personalization_service
 
-    # Mock next queries (queries that come after current query)
+    # Mock next queries (queries that come after current query), then
+    # previous queries from the reverse index
     mock_redis.zrevrange.side_effect = [
         [("市场趋势", 5.0), ("业绩报告", 3.0)],  # User-specific next queries
         [("竞争分析", 4.0)],  # Global next queries
+        [("销售分析", 6.0)],  # User-specific previous queries
+        [("销售分析", 5.0), ("数据统计", 3.0)],  # Global previous queries
     ]
 
-    # Mock scan_iter for finding previous queries
-    mock_redis.scan_iter.side_effect = [
-        ["user:user123:sequence:销售分析"],  # User-specific sequences
-        ["sequence:销售分析", "sequence:数据统计"],  # Global sequences
-    ]
-    mock_redis.zscore.side_effect = [6.0, 5.0, 3.0]  # Scores for previous queries
-
     result = service.get_query_sequences("市场趋势", user_id="user123", limit=5)
 
     # Verify result structure
@@ -64,12 +88,17 @@ def test_get_query_sequences():
 
     # Verify previous queries are present
     assert len(result["previous"]) > 0
+    assert result["previous"] == [("销售分析", 6.0), ("数据统计", 3.0)]
+
+    # Previous queries come from the reverse index, never from a key scan
+    mock_redis.zrevrange.assert_any_call("prev:市场趋势", 0, 4, withscores=True)
+    mock_redis.scan_iter.assert_not_called()
 
 
 @pytest.mark.unit
-def test_get_query_sequences_without_redis():
+def test_get_query_sequences_without_redis(personalization_service):
     """Test that get_query_sequences handles missing Redis gracefully"""
-    service = PersonalizationService()
+    service = personalization_service
     service.redis_client = None
 
     result = service.get_query_sequences("test query")
@@ -77,41 +106,38 @@ def test_get_query_sequences_without_redis():
     assert result == {"next": [], "previous": []}
 
 
+@pytest.fixture
+def make_autocomplete():
+    """Build an AutocompleteService over mocks returning the given results"""
+    def _make(*, hybrid=None, seq=None, prefs=None):
+        mock_opensearch = Mock()
+        mock_vector_service = Mock()
+        mock_personalization = Mock()
+
+        mock_vector_service.encode_single.return_value = [0.1, 0.2, 0.3]
+        mock_opensearch.hybrid_search.return_value = hybrid or []
+        mock_personalization.get_query_sequences.return_value = seq or {"next": [], "previous": []}
+        mock_personalization.get_user_preferences.return_value = prefs or []
+
+        return AutocompleteService(
+            opensearch_service=mock_opensearch,
+            vector_service=mock_vector_service,
+            personalization_service=mock_personalization,
+            enable_personalization=True
+        )
+
+    return _make
+
+
 @pytest.mark.unit
-def test_related_queries_with_sequences():
+def test_related_queries_with_sequences(make_autocomplete):
     """Test that related queries include sequence-based suggestions"""
-    # Mock dependencies
-    mock_opensearch = Mock()
-    mock_vector_service = Mock()
-    mock_personalization = Mock()
-
-    # Setup mocks
-    mock_vector_service.encode_single.return_value = [0.1, 0.2, 0.3]
-    mock_opensearch.hybrid_search.return_value = [
-        {
-            "text": "销售数据统计",
-            "score": 0.75,
-            "keywords": ["sales"],
-            "doc_id": "doc1"
-        }
-    ]
-
-    # Mock sequence queries - "next" queries should have higher scores
-    mock_personalization.get_query_sequences.return_value = {
-        "next": [("市场分析", 10.0), ("业绩报告", 8.0)],
-        "previous": [("数据收集", 5.0)]
-    }
-    mock_personalization.get_user_preferences.return_value = []
-
-    # Create service
-    service = AutocompleteService(
-        opensearch_service=mock_opensearch,
-        vector_service=mock_vector_service,
-        personalization_service=mock_personalization,
-        enable_personalization=True
+    # "next" queries should have higher scores
+    service = make_autocomplete(
+        hybrid=[{"text": "销售数据统计", "score": 0.75, "keywords": ["sales"], "doc_id": "doc1"}],
+        seq={"next": [("市场分析", 10.0), ("业绩报告", 8.0)], "previous": [("数据收集", 5.0)]},
     )
 
-    # Get related queries
     results = service.get_related_queries("销售分析", user_id="user123", limit=10)
 
     # Verify results
@@ -132,80 +158,43 @@ def test_related_queries_with_sequences():
 
 
 @pytest.mark.unit
-def test_related_queries_prioritizes_next_over_previous():
-    """Test that next queries appear before previous queries in results"""
-    mock_opensearch = Mock()
-    mock_vector_service = Mock()
-    mock_personalization = Mock()
-
-    mock_vector_service.encode_single.return_value = [0.1, 0.2, 0.3]
-    mock_opensearch.hybrid_search.return_value = []
-
-    # Mock sequences where we have both next and previous queries
-    mock_personalization.get_query_sequences.return_value = {
-        "next": [("下一步操作", 5.0)],  # Should appear first
-        "previous": [("上一步操作", 5.0)]  # Should appear after next
-    }
-    mock_personalization.get_user_preferences.return_value = []
-
-    service = AutocompleteService(
-        opensearch_service=mock_opensearch,
-        vector_service=mock_vector_service,
-        personalization_service=mock_personalization,
-        enable_personalization=True
+def test_related_queries_prioritizes_next_over_previous(make_autocomplete):
+    """Test that equal scores are ordered by source, next before hybrid before previous"""
+    # Next count 1.0 scores 0.9 and previous count 2.0 scores 0.75, tying with the
+    # hybrid hits; previous queries are collected before hybrid hits, so only the
+    # source tie-break moves them behind
+    service = make_autocomplete(
+        hybrid=[
+            {"text": "同类报告", "score": 0.9, "keywords": [], "doc_id": "doc1"},
+            {"text": "相关报告", "score": 0.75, "keywords": [], "doc_id": "doc2"},
+        ],
+        seq={"next": [("下一步操作", 1.0)], "previous": [("上一步操作", 2.0)]},
     )
 
     results = service.get_related_queries("当前步骤", user_id="user123", limit=10)
 
-    # Find positions of next and previous queries
-    next_pos = None
-    prev_pos = None
-    for i, r in enumerate(results):
-        if r["source"] == "sequence_next":
-            next_pos = i
-        elif r["source"] == "sequence_prev":
-            prev_pos = i
-
-    # If both are present, next should come before previous
-    if next_pos is not None and prev_pos is not None:
-        assert next_pos < prev_pos, "Next queries should appear before previous queries"
+    assert [(r["text"], r["score"], r["source"]) for r in results] == [
+        ("下一步操作", 0.9, "sequence_next"),
+        ("同类报告", 0.9, "hybrid"),
+        ("相关报告", 0.75, "hybrid"),
+        ("上一步操作", 0.75, "sequence_prev"),
+    ]
 
 
 @pytest.mark.unit
-def test_related_queries_deduplication():
+def test_related_queries_deduplication(make_autocomplete):
     """Test that related queries are properly deduplicated"""
-    mock_opensearch = Mock()
-    mock_vector_service = Mock()
-    mock_personalization = Mock()
-
-    mock_vector_service.encode_single.return_value = [0.1, 0.2, 0.3]
-
-    # Return same query in hybrid search
-    mock_opensearch.hybrid_search.return_value = [
-        {
-            "text": "市场分析",
-            "score": 0.8,
-            "keywords": [],
-            "doc_id": "doc1"
-        }
-    ]
-
-    # Also return it in sequences
-    mock_personalization.get_query_sequences.return_value = {
-        "next": [("市场分析", 10.0)],  # Duplicate
-        "previous": []
-    }
-    mock_personalization.get_user_preferences.return_value = ["市场分析"]  # Another duplicate
-
-    service = AutocompleteService(
-        opensearch_service=mock_opensearch,
-        vector_service=mock_vector_service,
-        personalization_service=mock_personalization,
-        enable_personalization=True
+    # The same query comes back from hybrid search, sequences and user history
+    service = make_autocomplete(
+        hybrid=[{"text": "市场分析", "score": 0.8, "keywords": [], "doc_id": "doc1"}],
+        seq={"next": [("市场分析", 10.0)], "previous": []},
+        prefs=["市场分析"],
     )
 
     results = service.get_related_queries("销售分析", user_id="user123", limit=10)
 
     # Should only have one instance of "市场分析"
     texts = [r["text"] for r in results]
-    assert texts.count("市场分析") == 1, "Duplicate queries should be removed"
+    counts = Counter(texts)
+    assert counts["市场分析"] == 1, "Duplicate queries should be removed"
+    assert len(counts) == len(texts), "Every related query should be unique"
@@ -15,23 +15,83 @@ from app.models.schemas import (
     QueryItem,
 )
 
+# Keep these tests on one worker under `pytest -n auto --dist loadgroup`
+pytestmark = pytest.mark.xdist_group("unit_schemas")
+
 
 @pytest.mark.unit
-def test_autocomplete_request_valid():
-    """Test valid autocomplete request"""
-    request = AutocompleteRequest(query="销售", user_id="user123", limit=5)
-    assert request.query == "销售"
-    assert request.user_id == "user123"
-    assert request.limit == 5
+@pytest.mark.parametrize(
+    "model_cls,payload,expected",
+    [
+        pytest.param(
+            AutocompleteRequest,
+            {"query": "销售", "user_id": "user123", "limit": 5},
+            {"query": "销售", "user_id": "user123", "limit": 5},
+            id="autocomplete",
+        ),
+        pytest.param(
+            AutocompleteRequest,
+            {"query": "test"},
+            {"query": "test", "user_id": None, "limit": 10},
+            id="autocomplete-defaults",
+        ),
+        pytest.param(
+            Suggestion,
+            {"text": "销售额", "score": 2.5, "source": "hybrid"},
+            {"text": "销售额", "score": 2.5, "source": "hybrid"},
+            id="suggestion",
+        ),
+        pytest.param(
+            DocumentRequest,
+            {"text": "销售额趋势分析", "metadata": {"category": "sales"}},
+            {"text": "销售额趋势分析", "metadata": {"category": "sales"}},
+            id="document",
+        ),
+        pytest.param(
+            DocumentRequest,
+            {"text": "test query"},
+            {"text": "test query", "metadata": None},
+            id="document-without-metadata",
+        ),
+        pytest.param(
+            SimilarQueriesRequest,
+            {"query": "销售分析", "user_id": "user123", "limit": 5},
+            {"query": "销售分析", "user_id": "user123", "limit": 5},
+            id="similar-queries",
+        ),
+        pytest.param(
+            SimilarQueriesRequest,
+            {"query": "test query"},
+            {"query": "test query", "user_id": None, "limit": 10},
+            id="similar-queries-defaults",
+        ),
+        pytest.param(
+            RelatedQueriesRequest,
+            {"query": "客户满意度", "user_id": "user456", "limit": 8},
+            {"query": "客户满意度", "user_id": "user456", "limit": 8},
+            id="related-queries",
+        ),
+        pytest.param(
+            QueryItem,
+            {"text": "销售额趋势", "score": 0.95, "source": "vector"},
+            {"text": "销售额趋势", "score": 0.95, "source": "vector", "metadata": None},
+            id="query-item",
+        ),
+    ],
+)
+def test_model_valid(model_cls, payload, expected):
+    """Test valid payloads, validated as request bodies are"""
+    model = model_cls.model_validate(payload)
+    assert {field: getattr(model, field) for field in expected} == expected
 
 
 @pytest.mark.unit
-def test_autocomplete_request_defaults():
-    """Test autocomplete request with defaults"""
-    request = AutocompleteRequest(query="test")
-    assert request.query == "test"
-    assert request.user_id is None
-    assert request.limit == 10
+def test_feedback_request_valid():
+    """Test valid feedback request"""
+    feedback = FeedbackRequest(query="销售", selected="销售额", user_id="user123")
+    assert feedback.query == "销售"
+    assert feedback.selected_suggestion == "销售额"
+    assert feedback.user_id == "user123"
 
 
 @pytest.mark.unit
@@ -42,12 +102,16 @@ def test_autocomplete_request_empty_query_fails():
 
 
 @pytest.mark.unit
-def test_suggestion_model():
-    """Test Suggestion model"""
-    suggestion = Suggestion(text="销售额", score=2.5, source="hybrid")
-    assert suggestion.text == "销售额"
-    assert suggestion.score == 2.5
-    assert suggestion.source == "hybrid"
+@pytest.mark.parametrize("model_cls", [Suggestion, QueryItem])
+def test_result_item_is_frozen_and_strict(model_cls):
+    """Test result items strip text, reject unknown fields and cannot be mutated"""
+    item = model_cls(text="  销售额 ", score=0.9, source="hybrid")
+    assert item.text == "销售额"
+
+    with pytest.raises(ValidationError):
+        item.text = "销量"
+    with pytest.raises(ValidationError):
+        model_cls(text="销售额", score=0.9, source="hybrid", rank=1)
 
 
 @pytest.mark.unit
@@ -63,68 +127,6 @@ def test_autocomplete_response():
     assert response.total == 2
 
 
-@pytest.mark.unit
-def test_feedback_request_valid():
-    """Test valid feedback request"""
-    feedback = FeedbackRequest(query="销售", selected="销售额", user_id="user123")
-    assert feedback.query == "销售"
-    assert feedback.selected_suggestion == "销售额"
-    assert feedback.user_id == "user123"
-
-
-@pytest.mark.unit
-def test_document_request_valid():
-    """Test valid document request"""
-    doc = DocumentRequest(text="销售额趋势分析", metadata={"category": "sales"})
-    assert doc.text == "销售额趋势分析"
-    assert doc.metadata["category"] == "sales"
-
-
-@pytest.mark.unit
-def test_document_request_without_metadata():
-    """Test document request without metadata"""
-    doc = DocumentRequest(text="test query")
-    assert doc.text == "test query"
-    assert doc.metadata is None
-
-
-@pytest.mark.unit
-def test_similar_queries_request_valid():
-    """Test valid similar queries request"""
-    request = SimilarQueriesRequest(query="销售分析", user_id="user123", limit=5)
-    assert request.query == "销售分析"
-    assert request.user_id == "user123"
-    assert request.limit == 5
-
-
-@pytest.mark.unit
-def test_similar_queries_request_defaults():
-    """Test similar queries request with defaults"""
-    request = SimilarQueriesRequest(query="test query")
-    assert request.query == "test query"
-    assert request.user_id is None
-    assert request.limit == 10
-
-
-@pytest.mark.unit
-def test_related_queries_request_valid():
-    """Test valid related queries request"""
-    request = RelatedQueriesRequest(query="客户满意度", user_id="user456", limit=8)
-    assert request.query == "客户满意度"
-    assert request.user_id == "user456"
-    assert request.limit == 8
-
-
-@pytest.mark.unit
-def test_query_item_model():
-    """Test QueryItem model"""
-    item = QueryItem(text="销售额趋势", score=0.95, source="vector")
-    assert item.text == "销售额趋势"
-    assert item.score == 0.95
-    assert item.source == "vector"
-    assert item.metadata is None
-
-
 @pytest.mark.unit
 def test_similar_queries_response():
     """Test SimilarQueriesResponse model"""
@@ -0,0 +1,69 @@
+"""Unit tests for vector service"""
+
+import numpy as np
+import pytest
+from unittest.mock import Mock
+
+from app.services.vector_service import VectorService
+
+
+def _make_service(cache_size=2):
+    """Create a service whose model encodes each text as [len(text), 1.0]"""
+    service = VectorService(cache_size=cache_size)
+    service._model = Mock()
+    service._model.encode.side_effect = lambda texts, **kwargs: np.array(
+        [[float(len(t)), 1.0] for t in texts]
+    )
+    return service
+
+
+@pytest.mark.unit
+def test_encode_single_cache_hit():
+    """Test a repeated text is served from the cache"""
+    service = _make_service()
+
+    first = service.encode_single("销售")
+    first.append(9.0)  # callers get a copy, not the cached vector
+    second = service.encode_single("销售")
+
+    assert second == [2.0, 1.0]
+    assert service._model.encode.call_count == 1
+
+
+@pytest.mark.unit
+def test_encode_single_evicts_least_recent():
+    """Test the least recently used text is evicted at cache_size"""
+    service = _make_service(cache_size=2)
+
+    service.encode_single("a")
+    service.encode_single("bb")
+    service.encode_single("a")  # "bb" is now the least recently used
+    service.encode_single("ccc")
+
+    assert list(service._cache) == ["a", "ccc"]
+    service.encode_single("bb")
+    assert service._model.encode.call_count == 4
+
+
+@pytest.mark.unit
+def test_encode_single_cache_disabled():
+    """Test cache_size=0 encodes every call"""
+    service = _make_service(cache_size=0)
+
+    service.encode_single("销售")
+    service.encode_single("销售")
+
+    assert service._model.encode.call_count == 2
+    assert len(service._cache) == 0
+
+
+@pytest.mark.unit
+def test_clear_cache():
+    """Test clear_cache forces the next call to encode again"""
+    service = _make_service()
+
+    service.encode_single("销售")
+    service.clear_cache()
+    service.encode_single("销售")
+
+    assert service._model.encode.call_count == 2